@@ -6,15 +6,34 @@
 import json
 import datetime
 import time
+import random
+import asyncio
+import hashlib
+import re
+import string
+import functools
+import itertools
 import argparse
+import shutil
+import importlib.util
+import subprocess
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import numpy as np
 import questionary
+import httpx
 from rich.console import Console
 from rich.progress import Progress
 from rich.panel import Panel
 from rich.table import Table
-import anthropic
-import openai
-import google.generativeai as genai
+
+# Optional faster JSON encoder for the interview metadata file
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import the FinePersona manager
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -47,8 +66,14 @@ def get_personas_by_category(self, category, count=30, search_query=None):
 # Initialize console for pretty output
 console = Console()
 
+@dataclass(frozen=True, slots=True)
+class Persona:
+    """An interviewer or interviewee: a display name and a one-line role description."""
+    name: str
+    role: str
+
 # Stakeholder categories
-STAKEHOLDER_CATEGORIES = [
+STAKEHOLDER_CATEGORIES = (
     "senior_executives",
     "ai_specialists", 
     "mid_level_consultants",
@@ -56,61 +81,229 @@ def get_personas_by_category(self, category, count=30, search_query=None):
     "technology_providers",
     "regulatory_stakeholders",
     "industry_analysts"
-]
+)
 
 # Personas by category (4 personas per category)
 PERSONAS = {
-    "senior_executives": [
-        {"name": "Sarah Chen", "role": "Chief Strategy Officer at a Fortune 500 consulting firm with 18 years of experience"},
-        {"name": "Michael Rodriguez", "role": "CEO of a mid-sized consulting firm specializing in digital transformation"},
-        {"name": "Jennifer Park", "role": "Managing Director at a top-tier consulting firm overseeing AI initiatives"},
-        {"name": "Thomas Wilson", "role": "Global Head of Innovation at an international consulting conglomerate"}
-    ],
-    "ai_specialists": [
-        {"name": "Dr. Alex Kumar", "role": "Head of AI Research at a consulting firm with a PhD in Machine Learning"},
-        {"name": "Emma Watson", "role": "AI Ethics Lead with background in both technology and philosophy"},
-        {"name": "David Chen", "role": "Chief AI Architect with extensive experience implementing enterprise solutions"},
-        {"name": "Sophia Miller", "role": "AI Implementation Specialist focusing on practical applications in consulting"}
-    ],
-    "mid_level_consultants": [
-        {"name": "James Peterson", "role": "Senior Consultant with 7 years of experience in AI-driven projects"},
-        {"name": "Maria Garcia", "role": "Project Manager for AI implementation teams at a mid-tier firm"},
-        {"name": "Robert Kim", "role": "Data Science Consultant bridging technical and business requirements"},
-        {"name": "Aisha Johnson", "role": "Engagement Manager focusing on AI transformation projects"}
-    ],
-    "clients": [
-        {"name": "Elizabeth Taylor", "role": "CFO at a manufacturing company using AI consulting services"},
-        {"name": "Richard Martinez", "role": "CIO at a financial services firm evaluating AI implementations"},
-        {"name": "Susan Yamamoto", "role": "COO at a healthcare provider working with AI consultants"},
-        {"name": "Christopher Adams", "role": "VP of Strategy at a retail chain undergoing AI transformation"}
-    ],
-    "technology_providers": [
-        {"name": "Michelle Lee", "role": "CEO of an AI platform company partnering with consulting firms"},
-        {"name": "Ryan Patel", "role": "CTO of a software company developing tools for consultants"},
-        {"name": "Jessica Brown", "role": "Product Director at an enterprise AI solutions provider"},
-        {"name": "Nathan Williams", "role": "Partnership Lead at a major cloud and AI infrastructure company"}
-    ],
-    "regulatory_stakeholders": [
-        {"name": "Dr. Gregory Scott", "role": "Former regulatory official now advising on AI compliance"},
-        {"name": "Amanda Chen", "role": "Legal counsel specializing in AI and data regulation"},
-        {"name": "Jonathan Baker", "role": "Director at an industry standards organization for AI"},
-        {"name": "Patricia Reynolds", "role": "Ethics Board Member overseeing AI implementations in consulting"}
-    ],
-    "industry_analysts": [
-        {"name": "Dr. Caroline White", "role": "Principal Analyst at a leading research firm covering AI in consulting"},
-        {"name": "Marcus Johnson", "role": "Industry Researcher specializing in digital transformation trends"},
-        {"name": "Hannah Diaz", "role": "Senior Analyst publishing reports on the consulting industry"},
-        {"name": "Rajiv Patel", "role": "Market Intelligence Director with focus on technology adoption in services"}
-    ]
+    "senior_executives": (
+        Persona("Sarah Chen", "Chief Strategy Officer at a Fortune 500 consulting firm with 18 years of experience"),
+        Persona("Michael Rodriguez", "CEO of a mid-sized consulting firm specializing in digital transformation"),
+        Persona("Jennifer Park", "Managing Director at a top-tier consulting firm overseeing AI initiatives"),
+        Persona("Thomas Wilson", "Global Head of Innovation at an international consulting conglomerate")
+    ),
+    "ai_specialists": (
+        Persona("Dr. Alex Kumar", "Head of AI Research at a consulting firm with a PhD in Machine Learning"),
+        Persona("Emma Watson", "AI Ethics Lead with background in both technology and philosophy"),
+        Persona("David Chen", "Chief AI Architect with extensive experience implementing enterprise solutions"),
+        Persona("Sophia Miller", "AI Implementation Specialist focusing on practical applications in consulting")
+    ),
+    "mid_level_consultants": (
+        Persona("James Peterson", "Senior Consultant with 7 years of experience in AI-driven projects"),
+        Persona("Maria Garcia", "Project Manager for AI implementation teams at a mid-tier firm"),
+        Persona("Robert Kim", "Data Science Consultant bridging technical and business requirements"),
+        Persona("Aisha Johnson", "Engagement Manager focusing on AI transformation projects")
+    ),
+    "clients": (
+        Persona("Elizabeth Taylor", "CFO at a manufacturing company using AI consulting services"),
+        Persona("Richard Martinez", "CIO at a financial services firm evaluating AI implementations"),
+        Persona("Susan Yamamoto", "COO at a healthcare provider working with AI consultants"),
+        Persona("Christopher Adams", "VP of Strategy at a retail chain undergoing AI transformation")
+    ),
+    "technology_providers": (
+        Persona("Michelle Lee", "CEO of an AI platform company partnering with consulting firms"),
+        Persona("Ryan Patel", "CTO of a software company developing tools for consultants"),
+        Persona("Jessica Brown", "Product Director at an enterprise AI solutions provider"),
+        Persona("Nathan Williams", "Partnership Lead at a major cloud and AI infrastructure company")
+    ),
+    "regulatory_stakeholders": (
+        Persona("Dr. Gregory Scott", "Former regulatory official now advising on AI compliance"),
+        Persona("Amanda Chen", "Legal counsel specializing in AI and data regulation"),
+        Persona("Jonathan Baker", "Director at an industry standards organization for AI"),
+        Persona("Patricia Reynolds", "Ethics Board Member overseeing AI implementations in consulting")
+    ),
+    "industry_analysts": (
+        Persona("Dr. Caroline White", "Principal Analyst at a leading research firm covering AI in consulting"),
+        Persona("Marcus Johnson", "Industry Researcher specializing in digital transformation trends"),
+        Persona("Hannah Diaz", "Senior Analyst publishing reports on the consulting industry"),
+        Persona("Rajiv Patel", "Market Intelligence Director with focus on technology adoption in services")
+    )
 }
 
 # Interviewers
-INTERVIEWERS = [
-    {"name": "Dr. Maria Reynolds", "role": "Experienced researcher specializing in AI and consulting practices"},
-    {"name": "Dr. James Harrison", "role": "Professor of Business Technology with focus on industry transformation"},
-    {"name": "Dr. Sophia Lin", "role": "Research Director at a technology think tank studying AI adoption"},
-    {"name": "Dr. Marcus Wellington", "role": "Academic specializing in organizational change and technology"}
-]
+INTERVIEWERS = (
+    Persona("Dr. Maria Reynolds", "Experienced researcher specializing in AI and consulting practices"),
+    Persona("Dr. James Harrison", "Professor of Business Technology with focus on industry transformation"),
+    Persona("Dr. Sophia Lin", "Research Director at a technology think tank studying AI adoption"),
+    Persona("Dr. Marcus Wellington", "Academic specializing in organizational change and technology")
+)
+
+# Prompts the local vLLM engine runs together in one generate call
+VLLM_BATCH_SIZE = 64
+
+# Cloud model used instead of the local vLLM engine when no GPU is available
+VLLM_FALLBACK_MODELS = {
+    "anthropic": "claude-3-7-sonnet-20250219",
+    "openai": "gpt-4o-2024-08-06",
+    "google": "gemini-2.0-flash"
+}
+
+# Maximum number of concurrent LLM requests per provider (kept below typical RPM limits)
+MAX_CONCURRENCY = {
+    "anthropic": 5,
+    "openai": 20,
+    "google": 8,
+    "vllm_local": VLLM_BATCH_SIZE  # enough requests in flight to fill a local batch
+}
+
+# Cheaper model per provider for extractive steps (interview analyses and stakeholder summaries)
+FAST_MODELS = {
+    "anthropic": "claude-3-5-haiku-20241022",
+    "openai": "gpt-4o-mini-2024-07-18",
+    "google": "gemini-2.0-flash-lite"
+}
+
+# Token budgets for the prior analyses/summaries embedded in summary and final report prompts
+ANALYSIS_TOKEN_LIMIT = 500
+FINAL_REPORT_SUMMARIES_TOKEN_BUDGET = 6000
+
+# On-disk cache of LLM responses, so repeated experiment runs don't pay for identical prompts
+CACHE_DIR = os.path.join("data", "cache", "llm")
+SEMANTIC_CACHE_THRESHOLD = 0.97
+SEMANTIC_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Prompt templates, compiled once at import and filled in per call.
+# The fixed instructions for analyses, summaries and the final report are sent as system prompts
+# so providers can cache them across calls; only the interview data goes in the user message.
+INTERVIEW_PROMPT_TEMPLATE = string.Template("""
+You are conducting an interview about AI in consulting. Please generate a realistic interview between these two personas:
+
+INTERVIEWER: $interviewer_name, $interviewer_role
+
+INTERVIEWEE: $interviewee_name, $interviewee_role
+
+CONTEXT: This interview is with a $category about AI in consulting firms.
+
+The interview should focus on:
+1. Current state of AI adoption in consulting
+2. Market trends in the consulting industry related to AI
+3. Impact of AI on automation and knowledge management in consulting
+4. Ethical considerations and risks of AI in consulting
+
+The interview should include at least 5 questions and detailed, thoughtful responses that demonstrate the interviewee's unique perspective as a $category.
+
+Format the interview as a back-and-forth conversation, with each person's name followed by a colon and then their dialogue.
+The interview should be about 1000-1500 words.
+""")
+
+ANALYSIS_SYSTEM_PROMPT = """
+You analyze interviews about AI in consulting.
+Format your analysis with these clear sections:
+
+1. KEY POINTS: Summarize the 3-5 most important points from the interview.
+
+2. NOTABLE QUOTES: Extract 2-3 direct quotes that best represent the interviewee's perspective.
+
+3. AI ATTITUDES: Analyze the interviewee's attitude toward AI in consulting (positive, negative, neutral, nuanced).
+
+4. RQ1 INSIGHTS: What insights does this interview provide about the state of AI adoption in consulting?
+
+5. RQ2 INSIGHTS: What insights does this interview provide about current market trends in consulting?
+
+6. RQ3 INSIGHTS: What insights does this interview provide about automation and knowledge management?
+
+7. RQ4 INSIGHTS: What insights does this interview provide about ethical considerations and risks?
+
+8. CONTRADICTIONS: Note any contradictions or inconsistencies in the interviewee's statements.
+
+9. AUTHENTICITY ASSESSMENT: Evaluate how authentic and realistic this interview feels.
+"""
+
+ANALYSIS_PROMPT_TEMPLATE = string.Template("""
+Analyze the following interview about AI in consulting between $interviewer_name and $interviewee_name, who is a $category.
+
+INTERVIEW TEXT:
+$interview_text
+""")
+
+SUMMARY_SYSTEM_PROMPT = """
+You synthesize interview analyses from one stakeholder group into a report about AI in consulting.
+Generate TWO sections:
+
+## EXECUTIVE SUMMARY
+Write a 400-500 word executive summary that:
+1. Synthesizes the key findings across all of the group's interviews
+2. Identifies common themes and patterns
+3. Highlights unique perspectives from this stakeholder group
+4. Explains the significance of these findings
+
+## PRESENTATION BULLETS
+Create concise, presentation-ready bullet points organized by:
+
+### Key Findings
+- [3 bullet points on main findings]
+
+### AI Adoption (RQ1)
+- [2-3 bullet points]
+
+### Market Trends (RQ2)
+- [2-3 bullet points]
+
+### Automation & Knowledge (RQ3)
+- [2-3 bullet points]
+
+### Ethical Considerations (RQ4)
+- [2-3 bullet points]
+
+Keep each bullet point clear, specific, and under 15 words.
+"""
+
+SUMMARY_PROMPT_TEMPLATE = string.Template("""
+Create a comprehensive synthesis of findings from $count interviews with $category stakeholders about AI in consulting.
+
+ANALYSES:
+$analyses_text
+""")
+
+FINAL_REPORT_SYSTEM_PROMPT = """
+You write research reports on "The Role of AI in Consulting" from stakeholder interview summaries.
+Generate a complete research report with these sections:
+
+# AI in Consulting: Comprehensive Research Report
+
+## Executive Summary
+[400-500 word executive summary of the entire research]
+
+## Key Findings for Presentation
+[Create 3-4 bullet points for each of these sections:]
+- Overall Insights
+- AI Adoption Status
+- Market Trends 
+- Automation & Knowledge Effects
+- Ethical Considerations
+- Recommendations for Consulting Firms
+
+## Stakeholder Perspectives
+[For each stakeholder group, provide a 1-2 paragraph summary of their unique perspective]
+
+## Cross-Category Analysis
+[400-500 word analysis comparing and contrasting views across stakeholder groups]
+
+## Research Questions Analysis
+[For each research question (RQ1-RQ4), provide a 1-2 paragraph synthesis across all stakeholders]
+
+## Methodology
+[Brief explanation of the interview methodology]
+
+Focus on synthesizing insights across stakeholder groups and identifying patterns, contradictions, and consensus points.
+"""
+
+FINAL_REPORT_PROMPT_TEMPLATE = string.Template("""
+Create a comprehensive research report on "The Role of AI in Consulting" based on interviews with $count different stakeholder groups:
+$categories
+
+STAKEHOLDER SUMMARIES:
+$summaries_text
+""")
 
 def select_llm_provider():
     """Allow user to select an LLM provider and model."""
@@ -119,7 +312,8 @@ def select_llm_provider():
         choices=[
             "Anthropic (Claude)",
             "OpenAI (GPT)",
-            "Google (Gemini)"
+            "Google (Gemini)",
+            "Local vLLM (open-weight models on this machine's GPUs)"
         ]
     ).ask()
     
@@ -161,6 +355,50 @@ def select_llm_provider():
         ).ask()
         model_name = model.split()[0]
         return "google", model_name
+    
+    elif "vLLM" in provider:
+        model = questionary.select(
+            "Select local model:",
+            choices=[
+                "meta-llama/Llama-3.1-8B-Instruct (fast)",
+                "meta-llama/Llama-3.1-70B-Instruct (powerful, needs several GPUs)"
+            ]
+        ).ask()
+        model_name = model.split()[0]
+        return "vllm_local", model_name
+
+# Demographics recorded for every interviewer; shared by all combinations rather than rebuilt per interview
+INTERVIEWER_DEMOGRAPHICS = {
+    "profession": "Researcher",
+    "experience": "Senior",
+    "expertise": "AI in Consulting"
+}
+
+# FinePersonas labels recorded for interviewers when no FinePersonas data is used
+DEFAULT_INTERVIEWER_LABELS = ("Academic", "Research", "AI", "Consulting", "Technology")
+
+@functools.lru_cache(maxsize=None)
+def default_interviewee_labels(category):
+    """Return the FinePersonas labels recorded for a category's interviewees when no FinePersonas data is used."""
+    labels = (
+        category.replace("_", " ").title(),
+        "Business" if "executive" in category or "client" in category else "",
+        "Technology" if "tech" in category or "ai" in category else "",
+        "Consulting" if "consultant" in category else "",
+        "Government" if "regulatory" in category else "",
+        "Research" if "analyst" in category else ""
+    )
+    return tuple(label for label in labels if label)
+
+def persona_stream(category):
+    """Yield the built-in personas for a category, followed by as many generated ones as are requested."""
+    yield from PERSONAS[category]
+    category_display = category.replace('_', ' ')
+    for i in itertools.count(len(PERSONAS[category])):
+        yield Persona(
+            f"Additional {category_display} {i+1}",
+            f"Expert in the {category_display} sector with unique perspective {i+1}"
+        )
 
 def select_stakeholder_categories():
     """Allow user to select stakeholder categories to interview."""
@@ -198,65 +436,444 @@ def select_interviews_per_category():
     
     return int(num_interviews)
 
-def initialize_llm_client(provider, model, api_key):
-    """Initialize the appropriate LLM client."""
+# Connection pool shared by the async Anthropic and OpenAI clients for the whole run
+_async_http_client = None
+
+def get_async_http_client():
+    """Return the shared async HTTP client, creating it on first use."""
+    global _async_http_client
+    if _async_http_client is None:
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        # Long completions can take minutes, so only the connect timeout is short
+        timeout = httpx.Timeout(600.0, connect=10.0)
+        try:
+            _async_http_client = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package
+            _async_http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+    return _async_http_client
+
+async def close_async_http_client():
+    """Close the shared async HTTP client and drop the async SDK clients built on it."""
+    global _async_http_client
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+        _get_client.cache_clear()
+
+@functools.lru_cache(maxsize=None)
+def _get_client(provider, api_key):
+    """Create (and reuse) the sync and async SDK clients for a provider and key."""
+    # Each SDK takes a noticeable time to import, so only the selected provider's is loaded
     if provider == "anthropic":
-        return {
-            "provider": provider,
-            "model": model,
-            "client": anthropic.Anthropic(api_key=api_key)
-        }
+        import anthropic
+        return (
+            anthropic.Anthropic(api_key=api_key),
+            anthropic.AsyncAnthropic(api_key=api_key, http_client=get_async_http_client())
+        )
     elif provider == "openai":
-        client = openai.OpenAI(api_key=api_key)
-        return {
-            "provider": provider,
-            "model": model,
-            "client": client
-        }
+        import openai
+        return (
+            openai.OpenAI(api_key=api_key),
+            openai.AsyncOpenAI(api_key=api_key, http_client=get_async_http_client())
+        )
     elif provider == "google":
+        import google.generativeai as genai
         genai.configure(api_key=api_key)
-        return {
-            "provider": provider,
-            "model": model,
-            "client": genai
-        }
+        return genai, genai
+
+@functools.lru_cache(maxsize=None)
+def local_gpu_count():
+    """Return the number of CUDA GPUs available to vLLM (0 if vLLM is not installed)."""
+    if importlib.util.find_spec("vllm") is None:
+        return 0
+    import torch
+    return torch.cuda.device_count()
+
+def vllm_generate(engine, conversations, max_tokens):
+    """Run chat conversations through a vLLM engine in one call and return the texts in order."""
+    from vllm import SamplingParams
+    sampling_params = [SamplingParams(max_tokens=limit) for limit in max_tokens]
+    outputs = engine.chat(conversations, sampling_params, use_tqdm=False)
+    return [output.outputs[0].text for output in outputs]
+
+class LocalBatcher:
+    """Collects concurrent async requests and runs them through the vLLM engine in batches."""
+    
+    def __init__(self, engine, batch_size=VLLM_BATCH_SIZE):
+        self.engine = engine
+        self.batch_size = batch_size
+        self._pending = []
+        self._worker = None
+    
+    async def generate(self, messages, max_tokens):
+        """Queue one conversation and wait for its completion."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((messages, max_tokens, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+    
+    async def _drain(self):
+        """Run queued requests until the queue is empty, one engine call at a time."""
+        while self._pending:
+            # Give requests scheduled in the same tick a chance to join this batch
+            await asyncio.sleep(0)
+            batch = self._pending[:self.batch_size]
+            self._pending = self._pending[self.batch_size:]
+            try:
+                texts = await asyncio.to_thread(
+                    vllm_generate,
+                    self.engine,
+                    [messages for messages, _, _ in batch],
+                    [max_tokens for _, max_tokens, _ in batch]
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), text in zip(batch, texts):
+                if not future.done():
+                    future.set_result(text)
+
+@functools.lru_cache(maxsize=None)
+def _get_vllm_clients(model):
+    """Load a model into a local vLLM engine (once per model) sharded across all visible GPUs."""
+    from vllm import LLM
+    engine = LLM(model=model, tensor_parallel_size=local_gpu_count())
+    return engine, LocalBatcher(engine)
+
+def parse_tier_map(tier_map):
+    """Parse a --tier-map value such as 'fast=MODEL,strong=MODEL' into a dict."""
+    tiers = {}
+    if not tier_map:
+        return tiers
+    for entry in tier_map.split(','):
+        tier, _, tier_model = entry.partition('=')
+        tier, tier_model = tier.strip(), tier_model.strip()
+        if tier not in ("fast", "strong") or not tier_model:
+            raise ValueError(f"Invalid --tier-map entry '{entry}'. Use fast=MODEL and/or strong=MODEL.")
+        tiers[tier] = tier_model
+    return tiers
+
+def initialize_llm_client(provider, model, api_key, latency_optimized=False):
+    """Initialize the appropriate LLM client (sync and async)."""
+    if provider == "vllm_local":
+        client, async_client = _get_vllm_clients(model)
+    else:
+        client, async_client = _get_client(provider, api_key)
+    return {
+        "provider": provider,
+        "model": model,
+        "client": client,
+        "async_client": async_client,
+        "latency_optimized": latency_optimized
+    }
+
+def openai_request_options(llm_config):
+    """Extra chat.completions arguments for the configured inference mode."""
+    # Priority processing trades a higher per-token price for lower latency on interactive calls
+    if llm_config.get("latency_optimized"):
+        return {"service_tier": "priority"}
+    return {}
+
+class ResponseCache:
+    """Exact-prompt disk cache with an optional embedding-similarity fallback."""
+    
+    def __init__(self, cache_dir=CACHE_DIR, embedding_client=None, threshold=SEMANTIC_CACHE_THRESHOLD):
+        self.cache_dir = cache_dir
+        self.embedding_client = embedding_client
+        self.threshold = threshold
+        self._semantic = {}
+        self._pending_embeddings = {}
+        # put runs on worker threads; the semantic store is read, extended and rewritten as a whole
+        self._semantic_lock = threading.Lock()
+        # Create the cache directories once rather than on every write
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if self.embedding_client is not None:
+            os.makedirs(os.path.join(self.cache_dir, "semantic"), exist_ok=True)
+    
+    def _namespace(self, llm_config, max_tokens):
+        return f"{llm_config['provider']}\0{llm_config['model']}\0{max_tokens}"
+    
+    def _key(self, llm_config, prompt, max_tokens):
+        payload = f"{self._namespace(llm_config, max_tokens)}\0{prompt}"
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+    
+    def _semantic_paths(self, namespace):
+        name = hashlib.blake2b(namespace.encode("utf-8"), digest_size=16).hexdigest()
+        base = os.path.join(self.cache_dir, "semantic")
+        return os.path.join(base, f"{name}.npy"), os.path.join(base, f"{name}.json")
+    
+    def _load_semantic(self, namespace):
+        """Load the (embeddings, responses) pair for one provider/model namespace."""
+        if namespace not in self._semantic:
+            matrix_path, responses_path = self._semantic_paths(namespace)
+            if os.path.exists(matrix_path) and os.path.exists(responses_path):
+                matrix = np.load(matrix_path)
+                with open(responses_path, 'r', encoding='utf-8') as f:
+                    responses = json.load(f)
+            else:
+                matrix = np.empty((0, 0), dtype=np.float32)
+                responses = []
+            self._semantic[namespace] = (matrix, responses)
+        return self._semantic[namespace]
+    
+    def _embed(self, prompt):
+        response = self.embedding_client.embeddings.create(model=SEMANTIC_EMBEDDING_MODEL, input=prompt)
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return embedding / np.linalg.norm(embedding)
+    
+    def get(self, llm_config, prompt, max_tokens, semantic=False):
+        """Return a cached response for the prompt, or None on a miss.
+        
+        Only callers passing semantic=True fall back to near-identical prompts. Prompts that embed
+        an interview or analysis differ only in that payload, and interview prompts only in the
+        persona names and roles, so a similar prompt would return another interview's output.
+        """
+        key = self._key(llm_config, prompt, max_tokens)
+        path = os.path.join(self.cache_dir, f"{key}.txt")
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        
+        if self.embedding_client is None or not semantic:
+            return None
+        
+        try:
+            embedding = self._embed(prompt)
+        except Exception as e:
+            console.print(f"[yellow]Semantic cache lookup failed: {str(e)}[/yellow]")
+            return None
+        self._pending_embeddings[key] = embedding
+        
+        matrix, responses = self._load_semantic(self._namespace(llm_config, max_tokens))
+        if not responses:
+            return None
+        similarities = embedding @ matrix.T
+        best = int(np.argmax(similarities))
+        if similarities[best] > self.threshold:
+            return responses[best]
+        return None
+    
+    def put(self, llm_config, prompt, max_tokens, text):
+        """Store a successful response and return it unchanged."""
+        key = self._key(llm_config, prompt, max_tokens)
+        with open(os.path.join(self.cache_dir, f"{key}.txt"), 'w', encoding='utf-8') as f:
+            f.write(text)
+        
+        embedding = self._pending_embeddings.pop(key, None)
+        if embedding is not None:
+            namespace = self._namespace(llm_config, max_tokens)
+            with self._semantic_lock:
+                matrix, responses = self._load_semantic(namespace)
+                matrix = np.vstack([matrix, embedding]) if responses else embedding[np.newaxis, :]
+                responses = responses + [text]
+                self._semantic[namespace] = (matrix, responses)
+                
+                matrix_path, responses_path = self._semantic_paths(namespace)
+                np.save(matrix_path, matrix)
+                with open(responses_path, 'w', encoding='utf-8') as f:
+                    json.dump(responses, f)
+        
+        return text
+
+def openai_messages(model, prompt, system=None):
+    """Chat messages for OpenAI, with the fixed instructions first so automatic prefix caching applies."""
+    if not system:
+        return [{"role": "user", "content": prompt}]
+    # o1 and o3 models don't accept a system role, so the instructions lead the user message instead
+    if model.startswith('o1-') or model.startswith('o3-'):
+        return [{"role": "user", "content": f"{system}\n{prompt}"}]
+    return [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+
+def anthropic_request_options(system=None):
+    """Extra messages.create arguments carrying the system prompt, marked for prompt caching."""
+    if not system:
+        return {}
+    return {"system": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]}
+
+def stream_with_llm(llm_config, prompt, max_tokens, sink, system=None):
+    """Stream a completion into sink as it arrives and return the full text."""
+    provider = llm_config["provider"]
+    model = llm_config["model"]
+    client = llm_config["client"]
+    parts = []
+    
+    if provider == "anthropic":
+        with client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+            **anthropic_request_options(system)
+        ) as stream:
+            for text in stream.text_stream:
+                sink.write(text)
+                parts.append(text)
+    
+    elif provider == "openai":
+        # OpenAI's o1 and o3 models require max_completion_tokens instead of max_tokens
+        token_param = "max_completion_tokens" if model.startswith('o1-') or model.startswith('o3-') else "max_tokens"
+        response = client.chat.completions.create(
+            model=model,
+            messages=openai_messages(model, prompt, system),
+            stream=True,
+            **{token_param: max_tokens},
+            **openai_request_options(llm_config)
+        )
+        for chunk in response:
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            if text:
+                sink.write(text)
+                parts.append(text)
+    
+    elif provider == "google":
+        model_obj = client.GenerativeModel(model, system_instruction=system)
+        for chunk in model_obj.generate_content(prompt, stream=True):
+            sink.write(chunk.text)
+            parts.append(chunk.text)
+    
+    elif provider == "vllm_local":
+        # The offline engine returns whole completions, so the sink gets the text in one write
+        text = vllm_generate(client, [openai_messages(model, prompt, system)], [max_tokens])[0]
+        sink.write(text)
+        parts.append(text)
+    
+    return "".join(parts)
 
-def generate_with_llm(llm_config, prompt, max_tokens=4000, max_retries=3, retry_delay=5):
-    """Generate text using the configured LLM with retry logic."""
+async def stream_with_llm_async(llm_config, prompt, max_tokens, sink, system=None):
+    """Asynchronously stream a completion into sink as it arrives and return the full text."""
+    provider = llm_config["provider"]
+    model = llm_config["model"]
+    client = llm_config["async_client"]
+    parts = []
+
+    if provider == "anthropic":
+        async with client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+            **anthropic_request_options(system)
+        ) as stream:
+            async for text in stream.text_stream:
+                sink.write(text)
+                parts.append(text)
+
+    elif provider == "openai":
+        # OpenAI's o1 and o3 models require max_completion_tokens instead of max_tokens
+        token_param = "max_completion_tokens" if model.startswith('o1-') or model.startswith('o3-') else "max_tokens"
+        response = await client.chat.completions.create(
+            model=model,
+            messages=openai_messages(model, prompt, system),
+            stream=True,
+            **{token_param: max_tokens},
+            **openai_request_options(llm_config)
+        )
+        async for chunk in response:
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            if text:
+                sink.write(text)
+                parts.append(text)
+
+    elif provider == "google":
+        model_obj = client.GenerativeModel(model, system_instruction=system)
+        response = await model_obj.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            sink.write(chunk.text)
+            parts.append(chunk.text)
+
+    elif provider == "vllm_local":
+        # The offline engine returns whole completions, so the sink gets the text in one write
+        text = await client.generate(openai_messages(model, prompt, system), max_tokens)
+        sink.write(text)
+        parts.append(text)
+
+    return "".join(parts)
+
+# Upper bound in seconds for a single backoff between retries
+MAX_RETRY_WAIT = 60
+
+# Set by --quiet to hide per-attempt retry messages (final failures are still reported)
+_quiet = False
+
+def retry_wait_seconds(error, attempt, retry_delay):
+    """Return how long to wait before retrying, honouring a Retry-After header if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        retry_after = headers.get("retry-after")
+        try:
+            return min(MAX_RETRY_WAIT, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            pass
+    # Jittered exponential backoff so concurrent requests don't retry in lockstep
+    return min(MAX_RETRY_WAIT, random.uniform(retry_delay, retry_delay * 2 ** attempt))
+
+def generate_with_llm(llm_config, prompt, max_tokens=4000, max_retries=3, retry_delay=5, sink=None, system=None, semantic=False):
+    """Generate text using the configured LLM with retry logic, streaming it into sink if given.
+    
+    semantic=True lets the response cache answer with a near-identical earlier prompt's response;
+    only pass it for prompts that don't embed per-interview text.
+    """
     provider = llm_config["provider"]
     model = llm_config["model"]
     client = llm_config["client"]
+    cache = llm_config.get("cache")
+    # The system prompt is part of the cache key
+    cache_prompt = f"{system}\0{prompt}" if system else prompt
+    
+    if cache:
+        cached = cache.get(llm_config, cache_prompt, max_tokens, semantic=semantic)
+        if cached is not None:
+            if sink is not None:
+                sink.write(cached)
+            return cached
+    
+    sink_start = sink.tell() if sink is not None else None
     
     for attempt in range(max_retries):
         try:
-            if provider == "anthropic":
+            if sink is not None:
+                # Discard partial output from a failed attempt before streaming again
+                sink.seek(sink_start)
+                sink.truncate()
+                text = stream_with_llm(llm_config, prompt, max_tokens, sink, system)
+            
+            elif provider == "anthropic":
                 response = client.messages.create(
                     model=model,
                     max_tokens=max_tokens,
-                    messages=[{"role": "user", "content": prompt}]
+                    messages=[{"role": "user", "content": prompt}],
+                    **anthropic_request_options(system)
                 )
-                return response.content[0].text
+                text = response.content[0].text
             
             elif provider == "openai":
                 # OpenAI's o1 and o3 models require max_completion_tokens instead of max_tokens
                 if model.startswith('o1-') or model.startswith('o3-'):
                     response = client.chat.completions.create(
                         model=model,
-                        messages=[{"role": "user", "content": prompt}],
-                        max_completion_tokens=max_tokens
+                        messages=openai_messages(model, prompt, system),
+                        max_completion_tokens=max_tokens,
+                        **openai_request_options(llm_config)
                     )
                 else:
                     response = client.chat.completions.create(
                         model=model,
-                        messages=[{"role": "user", "content": prompt}],
-                        max_tokens=max_tokens
+                        messages=openai_messages(model, prompt, system),
+                        max_tokens=max_tokens,
+                        **openai_request_options(llm_config)
                     )
-                return response.choices[0].message.content
+                text = response.choices[0].message.content
             
             elif provider == "google":
-                model_obj = client.GenerativeModel(model)
+                model_obj = client.GenerativeModel(model, system_instruction=system)
                 response = model_obj.generate_content(prompt)
-                return response.text
+                text = response.text
+            
+            elif provider == "vllm_local":
+                text = vllm_generate(client, [openai_messages(model, prompt, system)], [max_tokens])[0]
                 
         except KeyboardInterrupt:
             # Re-raise keyboard interrupt to allow clean exit
@@ -268,176 +885,346 @@ def generate_with_llm(llm_config, prompt, max_tokens=4000, max_retries=3, retry_
             
             # Handle rate limiting errors specially
             if "RateLimitError" in error_type or "429" in str(e) or "rate limit" in str(e).lower():
-                wait_time = retry_delay * (attempt + 1)  # Exponential backoff
+                wait_time = retry_wait_seconds(e, attempt, retry_delay)
                 
                 if attempt < max_retries - 1:  # Don't show this on the last attempt
-                    console.print(f"[yellow]Rate limit hit with {provider}. Waiting {wait_time} seconds before retry ({attempt+1}/{max_retries})...[/yellow]")
+                    if not _quiet:
+                        console.print(f"[yellow]Rate limit hit with {provider}. Waiting {wait_time:.1f} seconds before retry ({attempt+1}/{max_retries})...[/yellow]")
                     time.sleep(wait_time)
                     continue
             
             # Handle other errors
             if attempt < max_retries - 1:
-                console.print(f"[yellow]Error with {provider} {model}: {str(e)}. Retrying ({attempt+1}/{max_retries})...[/yellow]")
+                if not _quiet:
+                    console.print(f"[yellow]Error with {provider} {model}: {str(e)}. Retrying ({attempt+1}/{max_retries})...[/yellow]")
                 time.sleep(retry_delay)
             else:
                 console.print(f"[red]Failed after {max_retries} attempts with {provider} {model}: {str(e)}[/red]")
                 
                 # For the final error, return a message that won't break downstream processing
-                return f"Error occurred while generating content. The system encountered the following issue: {error_type}. Please check the logs for more details."
+                error_text = f"Error occurred while generating content. The system encountered the following issue: {error_type}. Please check the logs for more details."
+                if sink is not None:
+                    sink.seek(sink_start)
+                    sink.truncate()
+                    sink.write(error_text)
+                return error_text
+        
+        else:
+            # Outside the try above, so a cache write failure doesn't re-send the request
+            if cache:
+                try:
+                    cache.put(llm_config, cache_prompt, max_tokens, text)
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not cache response: {str(e)}[/yellow]")
+            return text
     
     # This should only happen if we exhaust all retries
     return "Error: Maximum retry attempts exceeded. Unable to generate content."
 
-def generate_interview(llm_config, interviewer, interviewee, stakeholder_category):
-    """Generate an interview between interviewer and interviewee."""
-    interview_prompt = f"""
-You are conducting an interview about AI in consulting. Please generate a realistic interview between these two personas:
-
-INTERVIEWER: {interviewer['name']}, {interviewer['role']}
-
-INTERVIEWEE: {interviewee['name']}, {interviewee['role']}
-
-CONTEXT: This interview is with a {stakeholder_category.replace('_', ' ')} about AI in consulting firms.
-
-The interview should focus on:
-1. Current state of AI adoption in consulting
-2. Market trends in the consulting industry related to AI
-3. Impact of AI on automation and knowledge management in consulting
-4. Ethical considerations and risks of AI in consulting
-
-The interview should include at least 5 questions and detailed, thoughtful responses that demonstrate the interviewee's unique perspective as a {stakeholder_category.replace('_', ' ')}.
-
-Format the interview as a back-and-forth conversation, with each person's name followed by a colon and then their dialogue.
-The interview should be about 1000-1500 words.
-"""
+async def generate_with_llm_async(llm_config, prompt, max_tokens=4000, max_retries=3, retry_delay=5, sink=None, system=None, semantic=False):
+    """Asynchronously generate text using the configured LLM with retry logic, streaming it into sink if given.
+    
+    semantic is passed to the response cache as in generate_with_llm.
+    """
+    provider = llm_config["provider"]
+    model = llm_config["model"]
+    client = llm_config["async_client"]
+    cache = llm_config.get("cache")
+    # The system prompt is part of the cache key
+    cache_prompt = f"{system}\0{prompt}" if system else prompt
 
-    return generate_with_llm(llm_config, interview_prompt)
+    if cache:
+        cached = await asyncio.to_thread(cache.get, llm_config, cache_prompt, max_tokens, semantic)
+        if cached is not None:
+            if sink is not None:
+                sink.write(cached)
+            return cached
 
-def analyze_interview(llm_config, interview_text, interviewer, interviewee, stakeholder_category):
-    """Generate analysis of an interview."""
-    analysis_prompt = f"""
-Analyze the following interview about AI in consulting between {interviewer['name']} and {interviewee['name']}, who is a {stakeholder_category.replace('_', ' ')}.
-Provide a structured analysis with these sections:
+    sink_start = sink.tell() if sink is not None else None
 
-INTERVIEW TEXT:
-{interview_text}
+    for attempt in range(max_retries):
+        try:
+            if sink is not None:
+                # Discard partial output from a failed attempt before streaming again
+                sink.seek(sink_start)
+                sink.truncate()
+                text = await stream_with_llm_async(llm_config, prompt, max_tokens, sink, system)
+
+            elif provider == "anthropic":
+                response = await client.messages.create(
+                    model=model,
+                    max_tokens=max_tokens,
+                    messages=[{"role": "user", "content": prompt}],
+                    **anthropic_request_options(system)
+                )
+                text = response.content[0].text
 
-Please format your analysis with these clear sections:
+            elif provider == "openai":
+                # OpenAI's o1 and o3 models require max_completion_tokens instead of max_tokens
+                if model.startswith('o1-') or model.startswith('o3-'):
+                    response = await client.chat.completions.create(
+                        model=model,
+                        messages=openai_messages(model, prompt, system),
+                        max_completion_tokens=max_tokens,
+                        **openai_request_options(llm_config)
+                    )
+                else:
+                    response = await client.chat.completions.create(
+                        model=model,
+                        messages=openai_messages(model, prompt, system),
+                        max_tokens=max_tokens,
+                        **openai_request_options(llm_config)
+                    )
+                text = response.choices[0].message.content
 
-1. KEY POINTS: Summarize the 3-5 most important points from the interview.
+            elif provider == "google":
+                model_obj = client.GenerativeModel(model, system_instruction=system)
+                response = await model_obj.generate_content_async(prompt)
+                text = response.text
 
-2. NOTABLE QUOTES: Extract 2-3 direct quotes that best represent the interviewee's perspective.
+            elif provider == "vllm_local":
+                text = await client.generate(openai_messages(model, prompt, system), max_tokens)
 
-3. AI ATTITUDES: Analyze the interviewee's attitude toward AI in consulting (positive, negative, neutral, nuanced).
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            raise
 
-4. RQ1 INSIGHTS: What insights does this interview provide about the state of AI adoption in consulting?
+        except Exception as e:
+            error_type = type(e).__name__
 
-5. RQ2 INSIGHTS: What insights does this interview provide about current market trends in consulting?
+            # Handle rate limiting errors specially
+            if "RateLimitError" in error_type or "429" in str(e) or "rate limit" in str(e).lower():
+                wait_time = retry_wait_seconds(e, attempt, retry_delay)
 
-6. RQ3 INSIGHTS: What insights does this interview provide about automation and knowledge management?
+                if attempt < max_retries - 1:
+                    if not _quiet:
+                        console.print(f"[yellow]Rate limit hit with {provider}. Waiting {wait_time:.1f} seconds before retry ({attempt+1}/{max_retries})...[/yellow]")
+                    await asyncio.sleep(wait_time)
+                    continue
 
-7. RQ4 INSIGHTS: What insights does this interview provide about ethical considerations and risks?
+            # Handle other errors
+            if attempt < max_retries - 1:
+                if not _quiet:
+                    console.print(f"[yellow]Error with {provider} {model}: {str(e)}. Retrying ({attempt+1}/{max_retries})...[/yellow]")
+                await asyncio.sleep(retry_delay)
+            else:
+                console.print(f"[red]Failed after {max_retries} attempts with {provider} {model}: {str(e)}[/red]")
+                error_text = f"Error occurred while generating content. The system encountered the following issue: {error_type}. Please check the logs for more details."
+                if sink is not None:
+                    sink.seek(sink_start)
+                    sink.truncate()
+                    sink.write(error_text)
+                return error_text
 
-8. CONTRADICTIONS: Note any contradictions or inconsistencies in the interviewee's statements.
+        else:
+            # Outside the try above, so a cache write failure doesn't re-send the request;
+            # the write (and any semantic store rewrite) runs off the event loop
+            if cache:
+                try:
+                    await asyncio.to_thread(cache.put, llm_config, cache_prompt, max_tokens, text)
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not cache response: {str(e)}[/yellow]")
+            return text
 
-9. AUTHENTICITY ASSESSMENT: Evaluate how authentic and realistic this interview feels.
-"""
+    return "Error: Maximum retry attempts exceeded. Unable to generate content."
 
-    return generate_with_llm(llm_config, analysis_prompt)
+def submit_batch(llm_config, prompts, max_tokens=4000, poll_interval=30, system=None):
+    """Run prompts through the provider's batch API and return the texts in prompt order."""
+    provider = llm_config["provider"]
+    model = llm_config["model"]
+    client = llm_config["client"]
+    error_text = "Error occurred while generating content. The batch request for this item did not succeed."
+    results = {}
 
-def create_stakeholder_summary(llm_config, analyses, stakeholder_category):
-    """Generate a summary of all interviews for a stakeholder category."""
-    
-    # Format the analyses as a condensed text
-    analyses_text = "\n\n".join([
-        f"ANALYSIS {i+1}:\n{analysis[:2000]}...(truncated)" 
-        for i, analysis in enumerate(analyses)
-    ])
-    
-    summary_prompt = f"""
-Create a comprehensive synthesis of findings from {len(analyses)} interviews with {stakeholder_category.replace('_', ' ')} stakeholders about AI in consulting.
+    if provider == "anthropic":
+        batch = client.messages.batches.create(requests=[
+            {
+                "custom_id": f"request-{i}",
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "messages": [{"role": "user", "content": prompt}],
+                    **anthropic_request_options(system)
+                }
+            }
+            for i, prompt in enumerate(prompts)
+        ])
+        console.print(f"[cyan]Submitted Anthropic message batch {batch.id} with {len(prompts)} requests. Waiting for results...[/cyan]")
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
 
-ANALYSES:
-{analyses_text}
+    elif provider == "openai":
+        # OpenAI's o1 and o3 models require max_completion_tokens instead of max_tokens
+        token_param = "max_completion_tokens" if model.startswith('o1-') or model.startswith('o3-') else "max_tokens"
+        batch_lines = [
+            json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": openai_messages(model, prompt, system),
+                    token_param: max_tokens
+                }
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        batch_file = client.files.create(
+            file=("batch_requests.jsonl", "\n".join(batch_lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        console.print(f"[cyan]Submitted OpenAI batch {batch.id} with {len(prompts)} requests. Waiting for results...[/cyan]")
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            console.print(f"[yellow]OpenAI batch {batch.id} finished with status '{batch.status}'.[/yellow]")
+        if batch.output_file_id:
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
 
-Please generate TWO sections:
+    elif provider == "vllm_local":
+        # The local engine batches the whole list itself, so there is nothing to poll
+        console.print(f"[cyan]Running {len(prompts)} requests through the local vLLM engine...[/cyan]")
+        conversations = [openai_messages(model, prompt, system) for prompt in prompts]
+        return vllm_generate(client, conversations, [max_tokens] * len(prompts))
 
-## EXECUTIVE SUMMARY
-Write a 400-500 word executive summary that:
-1. Synthesizes the key findings across all {stakeholder_category.replace('_', ' ')} interviews
-2. Identifies common themes and patterns
-3. Highlights unique perspectives from this stakeholder group
-4. Explains the significance of these findings
+    else:
+        # Gemini has no batch endpoint in this SDK, so fall back to one request per prompt
+        console.print(f"[yellow]Batch API not available for {provider}. Sending requests individually...[/yellow]")
+        return [generate_with_llm(llm_config, prompt, max_tokens=max_tokens, system=system) for prompt in prompts]
 
-## PRESENTATION BULLETS
-Create concise, presentation-ready bullet points organized by:
+    failed = len(prompts) - len(results)
+    if failed:
+        console.print(f"[yellow]{failed} of {len(prompts)} batch requests did not succeed.[/yellow]")
 
-### Key Findings
-- [3 bullet points on main findings]
+    return [results.get(f"request-{i}", error_text) for i in range(len(prompts))]
 
-### AI Adoption (RQ1)
-- [2-3 bullet points]
+@functools.lru_cache(maxsize=None)
+def _token_encoding():
+    """Return the tiktoken encoding used for prompt budgeting, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # tiktoken is optional, and loading an encoding can fail without network access
+        return None
+
+def count_tokens(text):
+    """Count tokens in text, estimating four characters per token without tiktoken."""
+    encoding = _token_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text))
+
+def truncate_tokens(text, max_tokens):
+    """Truncate text to at most max_tokens tokens, marking it if anything was cut."""
+    encoding = _token_encoding()
+    if encoding is None:
+        if len(text) <= max_tokens * 4:
+            return text
+        return text[:max_tokens * 4] + "...(truncated)"
+    token_ids = encoding.encode(text)
+    if len(token_ids) <= max_tokens:
+        return text
+    return encoding.decode(token_ids[:max_tokens]) + "...(truncated)"
+
+def build_interview_prompt(interviewer, interviewee, stakeholder_category):
+    """Build the prompt used to generate an interview."""
+    return INTERVIEW_PROMPT_TEMPLATE.substitute(
+        interviewer_name=interviewer.name,
+        interviewer_role=interviewer.role,
+        interviewee_name=interviewee.name,
+        interviewee_role=interviewee.role,
+        category=stakeholder_category.replace('_', ' ')
+    )
+
+def generate_interview(llm_config, interviewer, interviewee, stakeholder_category, sink=None):
+    """Generate an interview between interviewer and interviewee."""
+    interview_prompt = build_interview_prompt(interviewer, interviewee, stakeholder_category)
+    return generate_with_llm(llm_config, interview_prompt, sink=sink)
+
+async def generate_interview_async(llm_config, interviewer, interviewee, stakeholder_category, sink=None):
+    """Asynchronously generate an interview between interviewer and interviewee."""
+    interview_prompt = build_interview_prompt(interviewer, interviewee, stakeholder_category)
+    return await generate_with_llm_async(llm_config, interview_prompt, sink=sink)
+
+def build_analysis_prompt(interview_text, interviewer, interviewee, stakeholder_category):
+    """Build the prompt used to analyze an interview."""
+    return ANALYSIS_PROMPT_TEMPLATE.substitute(
+        interviewer_name=interviewer.name,
+        interviewee_name=interviewee.name,
+        category=stakeholder_category.replace('_', ' '),
+        interview_text=interview_text
+    )
 
-### Market Trends (RQ2)
-- [2-3 bullet points]
+def analyze_interview(llm_config, interview_text, interviewer, interviewee, stakeholder_category):
+    """Generate analysis of an interview."""
+    analysis_prompt = build_analysis_prompt(interview_text, interviewer, interviewee, stakeholder_category)
+    return generate_with_llm(llm_config, analysis_prompt, system=ANALYSIS_SYSTEM_PROMPT)
 
-### Automation & Knowledge (RQ3)
-- [2-3 bullet points]
+async def analyze_interview_async(llm_config, interview_text, interviewer, interviewee, stakeholder_category):
+    """Asynchronously generate analysis of an interview."""
+    analysis_prompt = build_analysis_prompt(interview_text, interviewer, interviewee, stakeholder_category)
+    return await generate_with_llm_async(llm_config, analysis_prompt, system=ANALYSIS_SYSTEM_PROMPT)
 
-### Ethical Considerations (RQ4)
-- [2-3 bullet points]
+def build_summary_prompt(analyses, stakeholder_category):
+    """Build the prompt used to summarize a stakeholder category."""
+    
+    # Format the analyses as a condensed text, truncated by tokens
+    analyses_text = "\n\n".join(
+        f"ANALYSIS {i+1}:\n{truncate_tokens(analysis, ANALYSIS_TOKEN_LIMIT)}"
+        for i, analysis in enumerate(analyses)
+    )
+    
+    return SUMMARY_PROMPT_TEMPLATE.substitute(
+        count=len(analyses),
+        category=stakeholder_category.replace('_', ' '),
+        analyses_text=analyses_text
+    )
 
-Keep each bullet point clear, specific, and under 15 words.
-"""
+def create_stakeholder_summary(llm_config, analyses, stakeholder_category):
+    """Generate a summary of all interviews for a stakeholder category."""
+    summary_prompt = build_summary_prompt(analyses, stakeholder_category)
+    return generate_with_llm(llm_config, summary_prompt, system=SUMMARY_SYSTEM_PROMPT)
 
-    return generate_with_llm(llm_config, summary_prompt)
+async def create_stakeholder_summary_async(llm_config, analyses, stakeholder_category):
+    """Asynchronously generate a summary of all interviews for a stakeholder category."""
+    summary_prompt = build_summary_prompt(analyses, stakeholder_category)
+    return await generate_with_llm_async(llm_config, summary_prompt, system=SUMMARY_SYSTEM_PROMPT)
 
 def create_final_report(llm_config, stakeholder_summaries, stakeholder_categories):
     """Generate a comprehensive final report across all stakeholder categories."""
     
-    # Format the summaries as a condensed text
-    summaries_text = "\n\n".join([
-        f"SUMMARY FOR {category.upper().replace('_', ' ')}:\n{summary[:3000]}...(truncated)" 
+    # Include the summaries in full when they fit the budget, otherwise give each an equal share
+    if sum(count_tokens(summary) for summary in stakeholder_summaries) > FINAL_REPORT_SUMMARIES_TOKEN_BUDGET:
+        per_summary = FINAL_REPORT_SUMMARIES_TOKEN_BUDGET // max(len(stakeholder_summaries), 1)
+        stakeholder_summaries = [truncate_tokens(summary, per_summary) for summary in stakeholder_summaries]
+    summaries_text = "\n\n".join(
+        f"SUMMARY FOR {category.upper().replace('_', ' ')}:\n{summary}"
         for category, summary in zip(stakeholder_categories, stakeholder_summaries)
-    ])
+    )
     
-    report_prompt = f"""
-Create a comprehensive research report on "The Role of AI in Consulting" based on interviews with {len(stakeholder_categories)} different stakeholder groups:
-{', '.join([category.replace('_', ' ') for category in stakeholder_categories])}
-
-STAKEHOLDER SUMMARIES:
-{summaries_text}
-
-Please generate a complete research report with these sections:
-
-# AI in Consulting: Comprehensive Research Report
-
-## Executive Summary
-[400-500 word executive summary of the entire research]
-
-## Key Findings for Presentation
-[Create 3-4 bullet points for each of these sections:]
-- Overall Insights
-- AI Adoption Status
-- Market Trends 
-- Automation & Knowledge Effects
-- Ethical Considerations
-- Recommendations for Consulting Firms
-
-## Stakeholder Perspectives
-[For each stakeholder group, provide a 1-2 paragraph summary of their unique perspective]
-
-## Cross-Category Analysis
-[400-500 word analysis comparing and contrasting views across stakeholder groups]
-
-## Research Questions Analysis
-[For each research question (RQ1-RQ4), provide a 1-2 paragraph synthesis across all stakeholders]
-
-## Methodology
-[Brief explanation of the interview methodology]
-
-Focus on synthesizing insights across stakeholder groups and identifying patterns, contradictions, and consensus points.
-"""
+    report_prompt = FINAL_REPORT_PROMPT_TEMPLATE.substitute(
+        count=len(stakeholder_categories),
+        categories=', '.join([category.replace('_', ' ') for category in stakeholder_categories]),
+        summaries_text=summaries_text
+    )
 
     # Set max tokens based on the model
     max_tokens = 4000  # Default for smaller models
@@ -461,527 +1248,467 @@ def create_final_report(llm_config, stakeholder_summaries, stakeholder_categorie
         else:
             max_tokens = 4000
     
-    return generate_with_llm(llm_config, report_prompt, max_tokens=max_tokens)
+    return generate_with_llm(llm_config, report_prompt, max_tokens=max_tokens, system=FINAL_REPORT_SYSTEM_PROMPT)
+
+# Start time of this run; per-file headers show it instead of the moment each file was written
+RUN_TS = datetime.datetime.now()
+RUN_DATE = RUN_TS.strftime('%Y-%m-%d %H:%M:%S')
+
+# Translation tables for turning persona names and model identifiers into filename parts
+NAME_FILENAME_TABLE = str.maketrans("", "", " ")
+MODEL_FILENAME_TABLE = str.maketrans("-/", "__")
+
+@functools.lru_cache(maxsize=None)
+def safe_filename(name):
+    """Return a persona name with spaces removed, for use in filenames."""
+    return name.translate(NAME_FILENAME_TABLE)
+
+@functools.lru_cache(maxsize=None)
+def model_filename(provider, model):
+    """Return the provider_model part of interview filenames."""
+    return f"{provider}_{model}".translate(MODEL_FILENAME_TABLE)
+
+# Single append-only interview log written instead of per-interview .txt files with --jsonl-log
+INTERVIEW_LOG_FILENAME = "interviews.jsonl"
+
+# Interview metadata appended as each interview finishes, so a crashed run keeps what it generated
+COMBINATIONS_LOG_FILENAME = "interview_combinations.jsonl"
+
+def append_jsonl(f, record):
+    """Write one record as a JSON line to a file opened in binary mode and flush it to disk."""
+    if orjson is not None:
+        f.write(orjson.dumps(record) + b"\n")
+    else:
+        f.write(json.dumps(record).encode('utf-8') + b"\n")
+    f.flush()
+
+# Report subdirectories created under reports_dir at the start of each run
+REPORT_SUBDIRS = ("individual", "stakeholder_groups", "summary", "presentation", "comprehensive")
+
+def create_output_dirs(exports_dir, reports_dir, categories):
+    """Create the whole output directory tree once at the start of a run."""
+    for category in categories:
+        Path(exports_dir, category).mkdir(parents=True, exist_ok=True)
+    for subdir in REPORT_SUBDIRS:
+        Path(reports_dir, subdir).mkdir(parents=True, exist_ok=True)
+
+def interview_filepath(interviewee, stakeholder_category, model_info, timestamp, export_dir):
+    """Return the path an interview is saved to (the directory is created by create_output_dirs)."""
+    # Create filename
+    model_str = model_filename(model_info['provider'], model_info['model'])
+    filename = f"{timestamp}_{stakeholder_category}_{safe_filename(interviewee.name)}_{model_str}.txt"
+    return str(Path(export_dir, stakeholder_category, filename))
+
+def write_interview_header(f, interviewer, interviewee, stakeholder_category, model_info):
+    """Write the metadata header that precedes the interview text."""
+    f.write(f"INTERVIEW: {interviewee.name} ({stakeholder_category.replace('_', ' ')})\n")
+    f.write(f"ROLE: {interviewee.role}\n")
+    f.write(f"INTERVIEWER: {interviewer.name}\n")
+    f.write(f"MODEL: {model_info['provider']}/{model_info['model']}\n")
+    f.write(f"DATE: {RUN_DATE}\n\n")
+
+def append_interview_record(log_path, interview_text, interviewer, interviewee, stakeholder_category, model_info):
+    """Append an interview as one JSON line to the run's interview log."""
+    record = {
+        "date": RUN_DATE,
+        "category": stakeholder_category,
+        "name": interviewee.name,
+        "role": interviewee.role,
+        "interviewer": interviewer.name,
+        "model": f"{model_info['provider']}/{model_info['model']}",
+        "text": interview_text
+    }
+    with open(log_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return log_path
 
 def save_interview(interview_text, interviewer, interviewee, stakeholder_category, model_info, timestamp, export_dir):
     """Save an interview to a file."""
-    # Create stakeholder directory
-    stakeholder_dir = os.path.join(export_dir, stakeholder_category)
-    os.makedirs(stakeholder_dir, exist_ok=True)
-    
-    # Create filename
-    safe_name = interviewee["name"].replace(" ", "")
-    model_str = f"{model_info['provider']}_{model_info['model']}".replace("-", "_")
-    filename = f"{timestamp}_{stakeholder_category}_{safe_name}_{model_str}.txt"
-    filepath = os.path.join(stakeholder_dir, filename)
+    filepath = interview_filepath(interviewee, stakeholder_category, model_info, timestamp, export_dir)
     
     # Save file
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(f"INTERVIEW: {interviewee['name']} ({stakeholder_category.replace('_', ' ')})\n")
-        f.write(f"ROLE: {interviewee['role']}\n")
-        f.write(f"INTERVIEWER: {interviewer['name']}\n")
-        f.write(f"MODEL: {model_info['provider']}/{model_info['model']}\n")
-        f.write(f"DATE: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        write_interview_header(f, interviewer, interviewee, stakeholder_category, model_info)
         f.write(interview_text)
     
     return filepath
 
+# PDF toolchain, probed once at startup instead of shelling out to `which` for every document
+PANDOC_PATH = shutil.which("pandoc")
+HAS_PYPANDOC = importlib.util.find_spec("pypandoc") is not None
+PDF_ENGINE = next((engine for engine in ("pdflatex", "xelatex") if shutil.which(engine)), None)
+
+# Markdown files waiting for PDF conversion, as (md_filepath, pdf_filepath) pairs
+PENDING_PDFS = []
+
+# pandoc errors that will recur for every document, so the rest of the run skips PDF creation
+FATAL_PDF_ERROR_RE = re.compile(r"xcolor\.sty|xelatex not found|pdflatex not found")
+
+# Set once a fatal LaTeX error has been seen
+_pdf_disabled = False
+
+def queue_pdf(md_filepath, pdf_filepath):
+    """Register a Markdown file for PDF conversion at the end of the run."""
+    PENDING_PDFS.append((md_filepath, pdf_filepath))
+
+def load_weasyprint():
+    """Return the (markdown, HTML) pair for in-process PDF rendering, or None if WeasyPrint is unusable."""
+    try:
+        import markdown
+        from weasyprint import HTML
+        return markdown, HTML
+    except Exception:
+        # WeasyPrint raises OSError rather than ImportError when its system libraries are missing
+        return None
+
+# Debian/Ubuntu packages that provide LaTeX with xcolor.sty for pandoc
+LATEX_APT_PACKAGES = ("texlive-latex-base", "texlive-fonts-recommended", "texlive-latex-extra")
+
+def apt_install(packages):
+    """Install system packages with apt-get (via sudo); returns True if the install succeeded."""
+    # Run apt-get directly rather than through a shell, and only install if the package lists updated
+    if subprocess.run(["sudo", "apt-get", "update"], check=False).returncode != 0:
+        return False
+    return subprocess.run(["sudo", "apt-get", "install", "-y", *packages], check=False).returncode == 0
+
+def has_xcolor():
+    """Check whether LaTeX can find xcolor.sty, asking kpsewhich before scanning /usr."""
+    kpsewhich = shutil.which("kpsewhich")
+    if kpsewhich:
+        # kpsewhich looks the file up in TeX's own index
+        return subprocess.run([kpsewhich, "xcolor.sty"], capture_output=True).returncode == 0
+    result = subprocess.run(["find", "/usr", "-name", "xcolor.sty", "-print", "-quit"], capture_output=True)
+    return bool(result.stdout.strip())
+
+@functools.lru_cache(maxsize=None)
+def probe_pdf_toolchain():
+    """Probe pypandoc, pandoc and xcolor.sty once; clear the cache after installing packages to probe again."""
+    return {
+        "pypandoc": importlib.util.find_spec("pypandoc") is not None,
+        "pandoc": shutil.which("pandoc") is not None,
+        "xcolor": has_xcolor(),
+    }
+
+def reprobe_pdf_toolchain():
+    """Forget the cached probe results (e.g. after an install), probe again and update the startup detection."""
+    global PANDOC_PATH, HAS_PYPANDOC, PDF_ENGINE, _pdf_disabled
+    probe_pdf_toolchain.cache_clear()
+    importlib.invalidate_caches()
+    toolchain = probe_pdf_toolchain()
+    PANDOC_PATH = shutil.which("pandoc")
+    HAS_PYPANDOC = toolchain["pypandoc"]
+    PDF_ENGINE = next((engine for engine in ("pdflatex", "xelatex") if shutil.which(engine)), None)
+    _pdf_disabled = False
+    return toolchain
+
+def convert_markdown_to_pdf(md_filepath, pdf_filepath, messages=None):
+    """Convert a Markdown file to PDF with a single pypandoc call, or a single pandoc run without pypandoc.
+    
+    Status and error lines are printed, or appended to messages (as console markup) when given.
+    """
+    report = console.print if messages is None else messages.append
+    # Use the engine detected at startup (pdflatex, then xelatex); no arguments lets pandoc choose.
+    # --quiet drops pandoc's warnings, which pypandoc would otherwise log to stderr; errors are still
+    # captured from the child process below rather than by redirecting this process's stderr
+    extra_args = ["--quiet", *([f"--pdf-engine={PDF_ENGINE}", "-V", "geometry:margin=1in"] if PDF_ENGINE else [])]
+    try:
+        if HAS_PYPANDOC:
+            import pypandoc
+            pypandoc.convert_file(md_filepath, 'pdf', outputfile=pdf_filepath, extra_args=extra_args)
+        elif PANDOC_PATH:
+            # Capture stderr from the same run so failures can be diagnosed without re-running pandoc
+            result = subprocess.run(
+                [PANDOC_PATH, md_filepath, "-o", pdf_filepath, *extra_args],
+                capture_output=True, text=True, check=False
+            )
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip() or f"pandoc returned error code {result.returncode}")
+        else:
+            # Silently continue if neither pypandoc nor pandoc is available
+            return False
+        
+        if os.path.exists(pdf_filepath) and os.path.getsize(pdf_filepath) > 0:
+            report(f"[green]Saved PDF to {pdf_filepath}[/green]")
+            return True
+        raise RuntimeError("PDF file was not created or is empty")
+    except Exception as e:
+        error_msg = str(e)
+        if FATAL_PDF_ERROR_RE.search(error_msg):
+            global _pdf_disabled
+            _pdf_disabled = True
+        if "xcolor.sty" in error_msg:
+            report(f"[yellow]Error during PDF creation: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
+        elif "xelatex not found" in error_msg or "pdflatex not found" in error_msg:
+            report(f"[yellow]Error during PDF creation: LaTeX engine not found. Install texlive-xetex package.[/yellow]")
+            report(f"[dim]Run: sudo apt-get install texlive-xetex texlive-latex-extra[/dim]")
+        else:
+            report(f"[yellow]Error during PDF creation: {error_msg}[/yellow]")
+            report("[dim]Try installing all required LaTeX packages with: sudo apt-get install texlive-latex-base texlive-fonts-recommended texlive-latex-extra texlive-xetex[/dim]")
+
+    
+    return False
+
 def save_interview_analysis(analysis_text, interviewer, interviewee, stakeholder_category, model_info, timestamp, reports_dir):
     """Save an interview analysis to files (MD and PDF)."""
-    # Create individual report directory
-    individual_dir = os.path.join(reports_dir, 'individual')
-    os.makedirs(individual_dir, exist_ok=True)
+    individual_dir = Path(reports_dir, 'individual')
     
     # Create filename
-    safe_name = interviewee["name"].replace(" ", "")
+    safe_name = safe_filename(interviewee.name)
     md_filename = f"{stakeholder_category}_{safe_name}.md"
-    md_filepath = os.path.join(individual_dir, md_filename)
+    md_filepath = str(individual_dir / md_filename)
     
     # Create markdown content
-    md_content = f"# Interview Analysis: {interviewee['name']} ({stakeholder_category.replace('_', ' ')})\n\n"
-    md_content += f"**Date:** {datetime.datetime.now().strftime('%Y-%m-%d')}\n"
-    md_content += f"**Interviewer:** {interviewer['name']}\n"
+    md_content = f"# Interview Analysis: {interviewee.name} ({stakeholder_category.replace('_', ' ')})\n\n"
+    md_content += f"**Date:** {RUN_TS.strftime('%Y-%m-%d')}\n"
+    md_content += f"**Interviewer:** {interviewer.name}\n"
     md_content += f"**Model Used:** {model_info['provider']}/{model_info['model']}\n\n"
     md_content += analysis_text
     
     # Save markdown file
-    with open(md_filepath, 'w', encoding='utf-8') as f:
-        f.write(md_content)
+    Path(md_filepath).write_text(md_content, encoding='utf-8')
     
-    # Try to create PDF using pypandoc if available, or fall back to command-line pandoc
+    # Queue the PDF version; all PDFs are created together at the end of the run
     pdf_filename = f"{stakeholder_category}_{safe_name}.pdf"
-    pdf_filepath = os.path.join(individual_dir, pdf_filename)
-    
-    try:
-        # First try to use pypandoc (Python wrapper that includes pandoc binaries)
-        try:
-            import pypandoc
-            # Try with different PDF engines in order of preference
-            # First try with pdflatex (most commonly available)
-            pdf_engine = "pdflatex"
-            if os.system("which pdflatex > /dev/null 2>&1") != 0:
-                # If pdflatex not available, try xelatex
-                if os.system("which xelatex > /dev/null 2>&1") == 0:
-                    pdf_engine = "xelatex"
-                else:
-                    # If neither is available, let pandoc choose
-                    pdf_engine = None
-            
-            # Use pypandoc with appropriate error handling
-            try:
-                if pdf_engine:
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath,
-                        extra_args=[f'--pdf-engine={pdf_engine}', '-V', 'geometry:margin=1in']
-                    )
-                else:
-                    # Try without specifying an engine
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath
-                    )
-            except Exception as inner_e:
-                console.print(f"[yellow]Error with pypandoc conversion: {str(inner_e)}[/yellow]")
-                console.print("[dim]Trying alternative pypandoc approach...[/dim]")
-                
-                # Try alternative approach without extra args
-                try:
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath
-                    )
-                except Exception as alt_e:
-                    raise Exception(f"Multiple pypandoc approaches failed: {str(alt_e)}")
-            
-            if os.path.exists(pdf_filepath) and os.path.getsize(pdf_filepath) > 0:
-                console.print(f"[green]Saved PDF analysis to {pdf_filepath}[/green]")
-            else:
-                raise Exception("PDF file was not created or is empty")
-                
-        except ImportError:
-            # If pypandoc is not installed, try command-line pandoc
-            pandoc_installed = os.system("which pandoc > /dev/null 2>&1") == 0
-            if pandoc_installed:
-                # Try with pdflatex first (more commonly available), then xelatex if available
-                if os.system("which pdflatex > /dev/null 2>&1") == 0:
-                    exit_code = os.system(f"pandoc {md_filepath} --pdf-engine=pdflatex -V geometry:margin=1in -o {pdf_filepath} 2>/dev/null")
-                elif os.system("which xelatex > /dev/null 2>&1") == 0:
-                    exit_code = os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -V geometry:margin=1in -o {pdf_filepath} 2>/dev/null")
-                else:
-                    # Try without specifying an engine
-                    exit_code = os.system(f"pandoc {md_filepath} -o {pdf_filepath} 2>/dev/null")
-                if exit_code == 0 and os.path.exists(pdf_filepath):
-                    console.print(f"[green]Saved PDF analysis to {pdf_filepath}[/green]")
-                else:
-                    error_msg = ""
-                    # Try to capture the error message for debugging
-                    temp_error_file = os.path.join(individual_dir, "pandoc_error.log")
-                    
-                    # First try pdflatex for error diagnostics
-                    if os.system("which pdflatex > /dev/null 2>&1") == 0:
-                        os.system(f"pandoc {md_filepath} --pdf-engine=pdflatex -o {pdf_filepath} 2> {temp_error_file}")
-                    elif os.system("which xelatex > /dev/null 2>&1") == 0:
-                        os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -o {pdf_filepath} 2> {temp_error_file}")
-                    else:
-                        os.system(f"pandoc {md_filepath} -o {pdf_filepath} 2> {temp_error_file}")
-                    if os.path.exists(temp_error_file):
-                        with open(temp_error_file, 'r') as f:
-                            error_msg = f.read().strip()
-                        os.remove(temp_error_file)
-                    
-                    if "xcolor.sty" in error_msg:
-                        console.print(f"[yellow]Failed to create PDF: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-                    elif "xelatex not found" in error_msg or "pdflatex not found" in error_msg:
-                        console.print(f"[yellow]Failed to create PDF: LaTeX engine not found. Install texlive-xetex package.[/yellow]")
-                        console.print(f"[dim]Run: sudo apt-get install texlive-xetex texlive-latex-extra[/dim]")
-                    else:
-                        console.print(f"[yellow]Failed to create PDF: pandoc returned error code {exit_code}[/yellow]")
-                        if error_msg:
-                            console.print(f"[dim]Error details: {error_msg}[/dim]")
-                            console.print(f"[dim]Try installing: sudo apt-get install texlive-latex-base texlive-fonts-recommended texlive-latex-extra texlive-xetex[/dim]")
-            else:
-                # Silently continue if neither pypandoc nor pandoc is available
-                pass
-    except Exception as e:
-        error_msg = str(e)
-        if "xcolor.sty" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-        elif "xelatex not found" in error_msg or "pdflatex not found" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: LaTeX engine not found. Install texlive-xetex package.[/yellow]")
-            console.print(f"[dim]Run: sudo apt-get install texlive-xetex texlive-latex-extra[/dim]")
-        else:
-            console.print(f"[yellow]Error during PDF creation: {error_msg}[/yellow]")
-            console.print("[dim]Try installing all required LaTeX packages with: sudo apt-get install texlive-latex-base texlive-fonts-recommended texlive-latex-extra texlive-xetex[/dim]")
+    pdf_filepath = str(individual_dir / pdf_filename)
+    queue_pdf(md_filepath, pdf_filepath)
     
     return md_filepath
 
 def save_stakeholder_summary(summary_text, stakeholder_category, timestamp, reports_dir):
     """Save a stakeholder category summary to files (MD and PDF)."""
-    # Create stakeholder group directory
-    stakeholder_dir = os.path.join(reports_dir, 'stakeholder_groups')
-    os.makedirs(stakeholder_dir, exist_ok=True)
+    stakeholder_dir = Path(reports_dir, 'stakeholder_groups')
     
     # Create filename
     md_filename = f"{stakeholder_category}_analysis.md"
-    md_filepath = os.path.join(stakeholder_dir, md_filename)
+    md_filepath = str(stakeholder_dir / md_filename)
     
     # Create markdown content
     md_content = f"# {stakeholder_category.replace('_', ' ').title()} Analysis Report\n\n"
-    md_content += f"**Generated:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    md_content += f"**Generated:** {RUN_DATE}\n\n"
     md_content += summary_text
     
     # Save markdown file
-    with open(md_filepath, 'w', encoding='utf-8') as f:
-        f.write(md_content)
+    Path(md_filepath).write_text(md_content, encoding='utf-8')
     
-    # Try to create PDF using pypandoc if available, or fall back to command-line pandoc
+    # Queue the PDF version; all PDFs are created together at the end of the run
     pdf_filename = f"{stakeholder_category}_analysis.pdf"
-    pdf_filepath = os.path.join(stakeholder_dir, pdf_filename)
-    
-    try:
-        # First try to use pypandoc (Python wrapper that includes pandoc binaries)
-        try:
-            import pypandoc
-            # Try with different PDF engines in order of preference
-            # First try with pdflatex (most commonly available)
-            pdf_engine = "pdflatex"
-            if os.system("which pdflatex > /dev/null 2>&1") != 0:
-                # If pdflatex not available, try xelatex
-                if os.system("which xelatex > /dev/null 2>&1") == 0:
-                    pdf_engine = "xelatex"
-                else:
-                    # If neither is available, let pandoc choose
-                    pdf_engine = None
-            
-            # Use pypandoc with appropriate error handling
-            try:
-                if pdf_engine:
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath,
-                        extra_args=[f'--pdf-engine={pdf_engine}', '-V', 'geometry:margin=1in']
-                    )
-                else:
-                    # Try without specifying an engine
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath
-                    )
-            except Exception as inner_e:
-                console.print(f"[yellow]Error with pypandoc conversion: {str(inner_e)}[/yellow]")
-                console.print("[dim]Trying alternative pypandoc approach...[/dim]")
-                
-                # Try alternative approach without extra args
-                try:
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath
-                    )
-                except Exception as alt_e:
-                    raise Exception(f"Multiple pypandoc approaches failed: {str(alt_e)}")
-            
-            if os.path.exists(pdf_filepath) and os.path.getsize(pdf_filepath) > 0:
-                console.print(f"[green]Saved PDF summary to {pdf_filepath}[/green]")
-            else:
-                raise Exception("PDF file was not created or is empty")
-                
-        except ImportError:
-            # If pypandoc is not installed, try command-line pandoc
-            pandoc_installed = os.system("which pandoc > /dev/null 2>&1") == 0
-            if pandoc_installed:
-                # Try with pdflatex first (more commonly available), then xelatex if available
-                if os.system("which pdflatex > /dev/null 2>&1") == 0:
-                    exit_code = os.system(f"pandoc {md_filepath} --pdf-engine=pdflatex -V geometry:margin=1in -o {pdf_filepath} 2>/dev/null")
-                elif os.system("which xelatex > /dev/null 2>&1") == 0:
-                    exit_code = os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -V geometry:margin=1in -o {pdf_filepath} 2>/dev/null")
-                else:
-                    # Try without specifying an engine
-                    exit_code = os.system(f"pandoc {md_filepath} -o {pdf_filepath} 2>/dev/null")
-                if exit_code == 0 and os.path.exists(pdf_filepath):
-                    console.print(f"[green]Saved PDF summary to {pdf_filepath}[/green]")
-                else:
-                    error_msg = ""
-                    # Try to capture the error message for debugging
-                    temp_error_file = os.path.join(stakeholder_dir, "pandoc_error.log")
-                    os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -o {pdf_filepath} 2> {temp_error_file}")
-                    if os.path.exists(temp_error_file):
-                        with open(temp_error_file, 'r') as f:
-                            error_msg = f.read().strip()
-                        os.remove(temp_error_file)
-                    
-                    if "xcolor.sty" in error_msg:
-                        console.print(f"[yellow]Failed to create PDF summary: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-                    else:
-                        console.print(f"[yellow]Failed to create PDF summary: pandoc returned error code {exit_code}[/yellow]")
-                        if error_msg:
-                            console.print(f"[dim]Error details: {error_msg}[/dim]")
-            else:
-                # Silently continue if neither pypandoc nor pandoc is available
-                pass
-    except Exception as e:
-        error_msg = str(e)
-        if "xcolor.sty" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-        elif "xelatex not found" in error_msg or "pdflatex not found" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: LaTeX engine not found. Install texlive-xetex package.[/yellow]")
-            console.print(f"[dim]Run: sudo apt-get install texlive-xetex texlive-latex-extra[/dim]")
-        else:
-            console.print(f"[yellow]Error during PDF creation: {error_msg}[/yellow]")
-            console.print("[dim]Try installing all required LaTeX packages with: sudo apt-get install texlive-latex-base texlive-fonts-recommended texlive-latex-extra texlive-xetex[/dim]")
+    pdf_filepath = str(stakeholder_dir / pdf_filename)
+    queue_pdf(md_filepath, pdf_filepath)
     
     return md_filepath
 
 def save_final_report(report_text, timestamp, reports_dir):
     """Save the final report to files (MD and PDF)."""
-    # Create summary directory
-    summary_dir = os.path.join(reports_dir, 'summary')
-    os.makedirs(summary_dir, exist_ok=True)
+    summary_dir = Path(reports_dir, 'summary')
     
     # Create filename
     md_filename = f"comprehensive_report_{timestamp}.md"
-    md_filepath = os.path.join(summary_dir, md_filename)
+    md_filepath = str(summary_dir / md_filename)
     
     # Save markdown file
-    with open(md_filepath, 'w', encoding='utf-8') as f:
-        f.write(report_text)
+    Path(md_filepath).write_text(report_text, encoding='utf-8')
     
-    # Try to create PDF using pypandoc if available, or fall back to command-line pandoc
+    # Queue the PDF version; all PDFs are created together at the end of the run
     pdf_filename = f"comprehensive_report_{timestamp}.pdf"
-    pdf_filepath = os.path.join(summary_dir, pdf_filename)
+    pdf_filepath = str(summary_dir / pdf_filename)
+    queue_pdf(md_filepath, pdf_filepath)
     
-    try:
-        # First try to use pypandoc (Python wrapper that includes pandoc binaries)
-        try:
-            import pypandoc
-            # Try with different PDF engines in order of preference
-            # First try with pdflatex (most commonly available)
-            pdf_engine = "pdflatex"
-            if os.system("which pdflatex > /dev/null 2>&1") != 0:
-                # If pdflatex not available, try xelatex
-                if os.system("which xelatex > /dev/null 2>&1") == 0:
-                    pdf_engine = "xelatex"
-                else:
-                    # If neither is available, let pandoc choose
-                    pdf_engine = None
-            
-            # Use pypandoc with appropriate error handling
-            try:
-                if pdf_engine:
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath,
-                        extra_args=[f'--pdf-engine={pdf_engine}', '-V', 'geometry:margin=1in']
-                    )
-                else:
-                    # Try without specifying an engine
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath
-                    )
-            except Exception as inner_e:
-                console.print(f"[yellow]Error with pypandoc conversion: {str(inner_e)}[/yellow]")
-                console.print("[dim]Trying alternative pypandoc approach...[/dim]")
-                
-                # Try alternative approach without extra args
+    return md_filepath
+
+# Number of pandoc conversions run at the same time
+PDF_WORKERS = os.cpu_count() or 4
+
+def convert_queued_pdf(md_filepath, pdf_filepath, messages=None):
+    """Convert one queued file with pandoc; returns None if PDF creation was disabled by an earlier failure."""
+    if _pdf_disabled:
+        # A missing LaTeX dependency fails every conversion; don't start pandoc again
+        return None
+    return convert_markdown_to_pdf(md_filepath, pdf_filepath, messages)
+
+def convert_pending_pdfs(background=False):
+    """Create PDFs for all queued Markdown files in a single pass.
+    
+    In the background, per-file messages are collected instead of printed so they don't interleave
+    with prompts on the main thread; report_pdf_results prints them.
+    
+    Returns:
+        Tuple of (converted, skipped, total, messages)
+    """
+    if not PENDING_PDFS:
+        return 0, 0, 0, []
+    
+    jobs = list(PENDING_PDFS)
+    PENDING_PDFS.clear()
+    
+    # Render in-process with WeasyPrint when possible, which avoids starting pandoc and LaTeX per file
+    weasyprint = load_weasyprint()
+    converted = 0
+    skipped = 0
+    messages = [] if background else None
+    report = console.print if messages is None else messages.append
+    
+    # A progress bar would fight with interactive prompts when this runs in the background
+    with Progress(console=console, disable=background) as progress:
+        pdf_task = progress.add_task("[green]Creating PDFs...", total=len(jobs))
+        if weasyprint:
+            markdown, HTML = weasyprint
+            for md_filepath, pdf_filepath in jobs:
                 try:
-                    pypandoc.convert_file(
-                        md_filepath, 
-                        'pdf', 
-                        outputfile=pdf_filepath
-                    )
-                except Exception as alt_e:
-                    raise Exception(f"Multiple pypandoc approaches failed: {str(alt_e)}")
-            
-            if os.path.exists(pdf_filepath) and os.path.getsize(pdf_filepath) > 0:
-                console.print(f"[green]Saved PDF report to {pdf_filepath}[/green]")
-            else:
-                raise Exception("PDF file was not created or is empty")
-                
-        except ImportError:
-            # If pypandoc is not installed, try command-line pandoc
-            pandoc_installed = os.system("which pandoc > /dev/null 2>&1") == 0
-            if pandoc_installed:
-                # Try with pdflatex first (more commonly available), then xelatex if available
-                if os.system("which pdflatex > /dev/null 2>&1") == 0:
-                    exit_code = os.system(f"pandoc {md_filepath} --pdf-engine=pdflatex -V geometry:margin=1in -o {pdf_filepath} 2>/dev/null")
-                elif os.system("which xelatex > /dev/null 2>&1") == 0:
-                    exit_code = os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -V geometry:margin=1in -o {pdf_filepath} 2>/dev/null")
-                else:
-                    # Try without specifying an engine
-                    exit_code = os.system(f"pandoc {md_filepath} -o {pdf_filepath} 2>/dev/null")
-                if exit_code == 0 and os.path.exists(pdf_filepath):
-                    console.print(f"[green]Saved PDF report to {pdf_filepath}[/green]")
-                else:
-                    error_msg = ""
-                    # Try to capture the error message for debugging
-                    temp_error_file = os.path.join(summary_dir, "pandoc_error.log")
-                    os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -o {pdf_filepath} 2> {temp_error_file}")
-                    if os.path.exists(temp_error_file):
-                        with open(temp_error_file, 'r') as f:
-                            error_msg = f.read().strip()
-                        os.remove(temp_error_file)
-                    
-                    if "xcolor.sty" in error_msg:
-                        console.print(f"[yellow]Failed to create PDF report: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-                    else:
-                        console.print(f"[yellow]Failed to create PDF report: pandoc returned error code {exit_code}[/yellow]")
-                        if error_msg:
-                            console.print(f"[dim]Error details: {error_msg}[/dim]")
-            else:
-                # Silently continue if neither pypandoc nor pandoc is available
-                pass
-    except Exception as e:
-        error_msg = str(e)
-        if "xcolor.sty" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-        elif "xelatex not found" in error_msg or "pdflatex not found" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: LaTeX engine not found. Install texlive-xetex package.[/yellow]")
-            console.print(f"[dim]Run: sudo apt-get install texlive-xetex texlive-latex-extra[/dim]")
+                    with open(md_filepath, 'r', encoding='utf-8') as f:
+                        html_body = markdown.markdown(f.read(), extensions=['tables'])
+                    HTML(string=f"<html><head><meta charset=\"utf-8\"><style>@page {{ margin: 1in; }}</style></head><body>{html_body}</body></html>").write_pdf(pdf_filepath)
+                    converted += 1
+                except Exception as e:
+                    report(f"[yellow]Error creating PDF for {md_filepath}: {str(e)}[/yellow]")
+                progress.update(pdf_task, advance=1)
         else:
-            console.print(f"[yellow]Error during PDF creation: {error_msg}[/yellow]")
-            console.print("[dim]Try installing all required LaTeX packages with: sudo apt-get install texlive-latex-base texlive-fonts-recommended texlive-latex-extra texlive-xetex[/dim]")
-    
-    return md_filepath
+            # pandoc and LaTeX run as child processes, so worker threads are enough to use every core.
+            # Their stderr is captured per run, so main-thread output isn't touched while this runs
+            # in the background.
+            with ThreadPoolExecutor(max_workers=PDF_WORKERS) as pool:
+                futures = [pool.submit(convert_queued_pdf, md_filepath, pdf_filepath, messages) for md_filepath, pdf_filepath in jobs]
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is None:
+                        skipped += 1
+                    elif result:
+                        converted += 1
+                    progress.update(pdf_task, advance=1)
+    
+    return converted, skipped, len(jobs), messages or []
+
+def find_markdown_files(directory):
+    """Recursively list the .md files under directory as Paths."""
+    # rglob walks the tree with os.scandir and matches the pattern in C
+    return list(Path(directory).rglob("*.md"))
+
+def convert_markdown_tree(directory):
+    """Convert every Markdown file under directory to PDF in one batch."""
+    md_files = find_markdown_files(directory)
+    if not md_files:
+        console.print("[yellow]No Markdown files found in the exports directory.[/yellow]")
+        return
+    # Same path as the end-of-run conversion: one shared pool instead of a pandoc run after another
+    for md_file in md_files:
+        queue_pdf(str(md_file), str(md_file.with_suffix(".pdf")))
+    console.print(f"[cyan]Converting {len(md_files)} Markdown files to PDF...[/cyan]")
+    report_pdf_results(*convert_pending_pdfs())
+
+def report_pdf_results(converted, skipped, total, messages):
+    """Print the outcome of convert_pending_pdfs, including the messages it collected in the background."""
+    if not total:
+        return
+    for message in messages:
+        console.print(message)
+    console.print(f"[green]Created {converted} of {total} PDF documents.[/green]")
+    if skipped:
+        console.print(f"[yellow]Skipped {skipped} PDF documents because LaTeX is missing a required package or engine.[/yellow]")
+
+# The "Key Findings for Presentation" section, up to the next section that follows it in the report
+PRESENTATION_BULLETS_RE = re.compile(
+    r"## Key Findings for Presentation.*?(?=## Stakeholder Perspectives|## Cross-Category Analysis|\Z)",
+    re.DOTALL
+)
+
+# Text between a summary's "## EXECUTIVE SUMMARY" header and the next "##"
+EXECUTIVE_SUMMARY_RE = re.compile(r"## EXECUTIVE SUMMARY(.*?)(?=##|\Z)", re.DOTALL)
 
 def extract_presentation_bullets(report_text):
     """Extract presentation bullets from the final report."""
-    start_marker = "## Key Findings for Presentation"
-    end_markers = ["## Stakeholder Perspectives", "## Cross-Category Analysis"]
-    
-    # Find the start of the presentation bullets
-    if start_marker not in report_text:
+    match = PRESENTATION_BULLETS_RE.search(report_text)
+    if match is None:
         return "No presentation bullets found."
-    
-    start_idx = report_text.index(start_marker)
-    
-    # Find the end of the presentation bullets
-    end_idx = len(report_text)
-    for marker in end_markers:
-        if marker in report_text[start_idx:]:
-            marker_idx = report_text.index(marker, start_idx)
-            if marker_idx < end_idx:
-                end_idx = marker_idx
-    
-    # Extract the bullets
-    bullets_text = report_text[start_idx:end_idx].strip()
-    return bullets_text
+    return match.group(0).strip()
 
 def save_presentation(report_text, timestamp, reports_dir):
     """Save the presentation bullets to files (MD and PDF)."""
-    # Create presentation directory
-    presentation_dir = os.path.join(reports_dir, 'presentation')
-    os.makedirs(presentation_dir, exist_ok=True)
+    presentation_dir = Path(reports_dir, 'presentation')
     
     # Extract presentation bullets
     bullets_text = extract_presentation_bullets(report_text)
     
     # Create filename
     md_filename = f"key_findings_{timestamp}.md"
-    md_filepath = os.path.join(presentation_dir, md_filename)
+    md_filepath = str(presentation_dir / md_filename)
     
     # Create markdown content
     md_content = f"# AI in Consulting Research Findings\n\n"
-    md_content += f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d')}\n\n"
+    md_content += f"Generated: {RUN_TS.strftime('%Y-%m-%d')}\n\n"
     md_content += bullets_text
     md_content += "\n\n# Thank You"
     
     # Save markdown file
-    with open(md_filepath, 'w', encoding='utf-8') as f:
-        f.write(md_content)
+    Path(md_filepath).write_text(md_content, encoding='utf-8')
     
-    # Try to create PDF using pypandoc if available, or fall back to command-line pandoc
+    # Queue the PDF version; all PDFs are created together at the end of the run
     pdf_filename = f"key_findings_{timestamp}.pdf"
-    pdf_filepath = os.path.join(presentation_dir, pdf_filename)
-    
-    try:
-        # First try to use pypandoc (Python wrapper that includes pandoc binaries)
-        try:
-            import pypandoc
-            # Capture and redirect potential stderr output
-            temp_stderr = os.dup(2)
-            os.close(2)
-            temp_file = open(os.devnull, 'w')
-            os.dup2(temp_file.fileno(), 2)
-            
-            # Try the conversion with extra args to help with LaTeX packages
-            pypandoc.convert_file(
-                md_filepath, 
-                'pdf', 
-                outputfile=pdf_filepath,
-                extra_args=[
-                    '--pdf-engine=xelatex', 
-                    '-V', 'geometry:margin=1in',
-                    '--slide-level=2'  # Treat level 2 headers as slides
-                ]
-            )
-            
-            # Restore stderr
-            os.close(2)
-            os.dup2(temp_stderr, 2)
-            temp_file.close()
-            
-            if os.path.exists(pdf_filepath) and os.path.getsize(pdf_filepath) > 0:
-                console.print(f"[green]Saved PDF presentation to {pdf_filepath}[/green]")
-            else:
-                raise Exception("PDF file was not created or is empty")
-                
-        except ImportError:
-            # If pypandoc is not installed, try command-line pandoc
-            pandoc_installed = os.system("which pandoc > /dev/null 2>&1") == 0
-            if pandoc_installed:
-                # Run pandoc with xelatex engine which has better Unicode support
-                exit_code = os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -V geometry:margin=1in --slide-level=2 -o {pdf_filepath} 2>/dev/null")
-                if exit_code == 0 and os.path.exists(pdf_filepath):
-                    console.print(f"[green]Saved PDF presentation to {pdf_filepath}[/green]")
-                else:
-                    error_msg = ""
-                    # Try to capture the error message for debugging
-                    temp_error_file = os.path.join(presentation_dir, "pandoc_error.log")
-                    os.system(f"pandoc {md_filepath} --pdf-engine=xelatex -o {pdf_filepath} 2> {temp_error_file}")
-                    if os.path.exists(temp_error_file):
-                        with open(temp_error_file, 'r') as f:
-                            error_msg = f.read().strip()
-                        os.remove(temp_error_file)
-                    
-                    if "xcolor.sty" in error_msg:
-                        console.print(f"[yellow]Failed to create PDF presentation: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-                    else:
-                        console.print(f"[yellow]Failed to create PDF presentation: pandoc returned error code {exit_code}[/yellow]")
-                        if error_msg:
-                            console.print(f"[dim]Error details: {error_msg}[/dim]")
-            else:
-                # Silently continue if neither pypandoc nor pandoc is available
-                pass
-    except Exception as e:
-        error_msg = str(e)
-        if "xcolor.sty" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: Missing LaTeX package 'xcolor.sty'. Install texlive-latex-extra package.[/yellow]")
-        elif "xelatex not found" in error_msg or "pdflatex not found" in error_msg:
-            console.print(f"[yellow]Error during PDF creation: LaTeX engine not found. Install texlive-xetex package.[/yellow]")
-            console.print(f"[dim]Run: sudo apt-get install texlive-xetex texlive-latex-extra[/dim]")
-        else:
-            console.print(f"[yellow]Error during PDF creation: {error_msg}[/yellow]")
-            console.print("[dim]Try installing all required LaTeX packages with: sudo apt-get install texlive-latex-base texlive-fonts-recommended texlive-latex-extra texlive-xetex[/dim]")
+    pdf_filepath = str(presentation_dir / pdf_filename)
+    queue_pdf(md_filepath, pdf_filepath)
     
     return md_filepath
 
+def normalize_combinations(interview_combinations):
+    """Split combinations into one persona table keyed by user_id and combinations that reference it by id."""
+    personas = {}
+    combinations = []
+    for combo in interview_combinations:
+        interviewer = combo['interviewer']
+        interviewee = combo['interviewee']
+        personas.setdefault(interviewer['user_id'], interviewer)
+        personas.setdefault(interviewee['user_id'], interviewee)
+        combinations.append({
+            "interviewer_id": interviewer['user_id'],
+            "interviewee_id": interviewee['user_id'],
+            "interview_details": combo['interview_details']
+        })
+    return {"personas": personas, "combinations": combinations}
+
+def render_demographics(interview_combinations):
+    """Render each persona's demographics once, keyed by user_id, for reuse across combinations."""
+    demographics = {}
+    for combo in interview_combinations:
+        for person in (combo['interviewer'], combo['interviewee']):
+            if person['user_id'] not in demographics:
+                demographics[person['user_id']] = ", ".join(f"{k}: {v}" for k, v in person['demographics'].items())
+    return demographics
+
+def render_combination_summary(i, combo, demographics):
+    """Render one interview combination as a section of interview_summary.md."""
+    interviewer = combo['interviewer']
+    interviewee = combo['interviewee']
+    details = combo['interview_details']
+    return (
+        f"### Interview {i+1}\n\n"
+        f"**Interviewer**: {interviewer['name']} ({interviewer['user_id']})\n"
+        f"- Role: {interviewer['role']}\n"
+        f"- Demographics: {demographics[interviewer['user_id']]}\n\n"
+        f"**Interviewee**: {interviewee['name']} ({interviewee['user_id']})\n"
+        f"- Role: {interviewee['role']}\n"
+        f"- Demographics: {demographics[interviewee['user_id']]}\n\n"
+        f"**Details**:\n"
+        f"- Category: {details['category'].replace('_', ' ')}\n"
+        f"- File: {os.path.basename(details['file_path'])}\n"
+        f"- Timestamp: {details['timestamp']}\n\n"
+    )
+
 def main():
     parser = argparse.ArgumentParser(description='Interactive Interview Generator')
     parser.add_argument('--anthropic-key', help='Anthropic API key')
     parser.add_argument('--openai-key', help='OpenAI API key')
     parser.add_argument('--google-key', help='Google API key')
     parser.add_argument('--use-finepersonas', action='store_true', help='Use FinePersonas database')
+    parser.add_argument('--batch', action='store_true', help='Run analyses and summaries through the provider batch API (slower, cheaper)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk LLM response cache')
+    parser.add_argument('--semantic-cache', action='store_true', help='Also reuse responses for near-identical prompts where a generation step allows it; interview, analysis and summary prompts always use exact matches (needs an OpenAI key for embeddings)')
+    parser.add_argument('--jsonl-log', action='store_true', help='Append interviews to one interviews.jsonl file instead of a .txt file each (see render.py)')
+    parser.add_argument('--tier-map', help="Override model tiers, e.g. 'fast=gpt-4o-mini-2024-07-18,strong=gpt-4o-2024-08-06'")
+    parser.add_argument('--quiet', action='store_true', help='Hide per-request retry messages during generation')
+    parser.add_argument('--latency-optimized', action='store_true', help='Request low-latency (priority) inference for interactive calls where the provider supports it')
     args = parser.parse_args()
     
+    global _quiet
+    _quiet = args.quiet
+    
     # Get API keys
     anthropic_key = args.anthropic_key or os.getenv("ANTHROPIC_API_KEY") or questionary.password("Enter your Anthropic API key (or press Enter to skip):").ask()
     openai_key = args.openai_key or os.getenv("OPENAI_API_KEY") or questionary.password("Enter your OpenAI API key (or press Enter to skip):").ask()
@@ -1004,8 +1731,8 @@ def main():
     if google_key:
         available_providers.append("Google (Gemini)")
     
-    if not available_providers:
-        console.print("[red]Error: At least one API key must be provided to use LLM functionality.[/red]")
+    if not available_providers and not local_gpu_count():
+        console.print("[red]Error: At least one API key (or a GPU with vLLM installed) must be provided to use LLM functionality.[/red]")
         return
     
     # Initialize FinePersona manager if requested
@@ -1037,16 +1764,51 @@ def main():
     console.print("\n[bold cyan]Select Number of Interviews per Category[/bold cyan]")
     interviews_per_category = select_interviews_per_category()
     
+    # Without a GPU, hand a local vLLM run to the first cloud provider with an API key
+    if provider == "vllm_local" and not local_gpu_count():
+        api_keys = {"anthropic": anthropic_key, "openai": openai_key, "google": google_key}
+        fallback = next((name for name, key in api_keys.items() if key), None)
+        if fallback is None:
+            console.print("[red]Error: vLLM or a CUDA GPU is not available, and there is no API key to fall back to.[/red]")
+            return
+        provider, model = fallback, VLLM_FALLBACK_MODELS[fallback]
+        console.print(f"[yellow]Warning: vLLM or a CUDA GPU is not available. Falling back to {provider} ({model}).[/yellow]")
+    
     # Initialize LLM client
-    api_key = {"anthropic": anthropic_key, "openai": openai_key, "google": google_key}[provider]
-    llm_config = initialize_llm_client(provider, model, api_key)
+    api_key = {"anthropic": anthropic_key, "openai": openai_key, "google": google_key}.get(provider)
+    llm_config = initialize_llm_client(provider, model, api_key, latency_optimized=args.latency_optimized)
+    
+    # Analyses and summaries are extractive, so they run on the provider's fast tier;
+    # interviews and the final report use the selected (strong) model
+    tiers = {"fast": FAST_MODELS.get(provider, model), "strong": model}
+    try:
+        tiers.update(parse_tier_map(args.tier_map))
+    except ValueError as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        return
+    if tiers["strong"] != model:
+        model = tiers["strong"]
+        llm_config = initialize_llm_client(provider, model, api_key, latency_optimized=args.latency_optimized)
+    fast_config = initialize_llm_client(provider, tiers["fast"], api_key)
+    if fast_config["model"] != model:
+        console.print(f"[cyan]Using {fast_config['model']} for analyses and summaries, {model} for interviews and the final report.[/cyan]")
+    
+    # Set up the response cache
+    if not args.no_cache:
+        embedding_client = None
+        if args.semantic_cache:
+            if openai_key:
+                embedding_client = _get_client("openai", openai_key)[0]
+            else:
+                console.print("[yellow]Warning: Semantic cache needs an OpenAI API key for embeddings. Using exact-match cache only.[/yellow]")
+        llm_config["cache"] = fast_config["cache"] = ResponseCache(embedding_client=embedding_client)
     
     # Download personas from FinePersonas if enabled
     finepersonas = {}
     if use_finepersonas and persona_manager:
         console.print("[cyan]Downloading personas from FinePersonas database...[/cyan]")
         
-        with Progress() as progress:
+        with Progress(console=console) as progress:
             download_task = progress.add_task("[green]Downloading personas...", total=len(selected_categories) + 1)
             
             # Download interviewer personas
@@ -1068,223 +1830,328 @@ def main():
         
         console.print(f"[green]Downloaded personas for {len(finepersonas)} categories.[/green]")
     
+    # FinePersonas data by category ("interviewer" for interviewers), empty when not in use
+    finepersona_pools = finepersonas if use_finepersonas else {}
+    
     # Create output directories with timestamp and model name
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = RUN_TS.strftime("%Y%m%d_%H%M%S")
     model_short_name = model.split('-')[0] if '-' in model else model  # Extract first part of model name
     base_dir = f"exports/{timestamp}_{provider}_{model_short_name}"
     exports_dir = f"{base_dir}/interviews"
     reports_dir = f"{base_dir}/reports"
-    os.makedirs(exports_dir, exist_ok=True)
+    create_output_dirs(exports_dir, reports_dir, selected_categories)
+    interview_log = os.path.join(base_dir, INTERVIEW_LOG_FILENAME) if args.jsonl_log else None
     
     # Track all generated files
     all_interviews = []
     all_analyses = []
     stakeholder_summaries = []
+    # Category of each entry in stakeholder_summaries; categories without interviews have no summary
+    summarized_categories = []
     
     # Track all interview combinations
     interview_combinations = []
     
+    # In batch mode, analyses are queued here and submitted after all interviews are generated
+    use_batch = args.batch
+    pending_analyses = []
+    
     # Generate interviews for each category
     total_interviews = len(selected_categories) * interviews_per_category
     
-    with Progress() as progress:
-        # Create tasks
-        interview_task = progress.add_task("[green]Generating interviews...", total=total_interviews)
+    # Interviewer records by interview number, shared by every category's combinations instead of rebuilt per interview
+    interviewer_records = {}
+    
+    def interviewer_record(i, interviewer, interviewer_index):
+        """Return the combination record for the interviewer of interview i, building it on first use."""
+        record = interviewer_records.get(i)
+        if record is not None:
+            return record
         
-        # For each selected category
-        for category in selected_categories:
-            console.print(f"\n[bold cyan]Generating interviews for {category.replace('_', ' ')}[/bold cyan]")
-            
-            # Get personas for this category, generating more if needed
-            available_personas = PERSONAS[category]
-            # If we need more personas than available, generate additional ones
-            if interviews_per_category > len(available_personas):
-                # Generate additional personas as needed
-                for i in range(len(available_personas), interviews_per_category):
-                    new_persona = {
-                        "name": f"Additional {category.replace('_', ' ')} {i+1}",
-                        "role": f"Expert in the {category.replace('_', ' ')} sector with unique perspective {i+1}"
-                    }
-                    available_personas.append(new_persona)
+        interviewer_pool = finepersona_pools.get("interviewer")
+        if interviewer_pool:
+            # Use real FinePersona data for interviewer
+            interviewer_fp = interviewer_pool[interviewer_index % len(interviewer_pool)]
+            interviewer_finepersona = {
+                "id": interviewer_fp.get("id", f"fp_{interviewer_index}_001"),
+                "persona": interviewer_fp.get("persona_text", interviewer.role),
+                "labels": [label for label in interviewer_fp.get("labels", ["Academic", "Research", "AI"]) if label]
+            }
+        else:
+            # Generate mock FinePersona data
+            interviewer_finepersona = {
+                "id": f"fp_{interviewer_index}_001",
+                "persona": interviewer.role,
+                "labels": list(DEFAULT_INTERVIEWER_LABELS)
+            }
+        
+        record = {
+            "name": interviewer.name,
+            "role": interviewer.role,
+            # Interview i always pairs with the same interviewer session, so i identifies it uniquely
+            "user_id": f"interviewer_{i}",
+            "demographics": INTERVIEWER_DEMOGRAPHICS,
+            "finepersona": interviewer_finepersona
+        }
+        interviewer_records[i] = record
+        return record
+    
+    async def generate_and_analyze(i, persona, category, progress, interview_task, semaphore):
+        """Generate an interview and its analysis for one persona.
+        
+        Each LLM call takes its own semaphore slot, so the next interview can start while this one is analyzed.
+        Returns (interview_file, combination, analysis_file, analysis_text), or None if the interview failed.
+        """
+        category_display = category.replace("_", " ")
+        category_title = category_display.title()
+        
+        # Select interviewer (cycle through them)
+        interviewer_index = i % len(INTERVIEWERS)
+        interviewer = INTERVIEWERS[interviewer_index]
+        
+        # For interviews beyond available interviewers, create variations
+        if i >= len(INTERVIEWERS):
+            interviewer = Persona(f"{interviewer.name} (Session {int(i/len(INTERVIEWERS))+1})", interviewer.role)
+        
+        # Generate interview
+        progress.update(interview_task, description=f"[green]Interview: {interviewer.name} → {persona.name}")
+        try:
+            model_info = {"provider": provider, "model": model}
+            if interview_log:
+                # Append the interview to the run's JSONL log
+                async with semaphore:
+                    interview_text = await generate_interview_async(llm_config, interviewer, persona, category)
+                interview_file = append_interview_record(interview_log, interview_text, interviewer, persona, category, model_info)
+            else:
+                # Stream the interview straight into its file
+                interview_file = interview_filepath(persona, category, model_info, timestamp, exports_dir)
+                with open(interview_file, 'w', encoding='utf-8') as f:
+                    write_interview_header(f, interviewer, persona, category, model_info)
+                    async with semaphore:
+                        interview_text = await generate_interview_async(llm_config, interviewer, persona, category, sink=f)
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            console.print("\n[yellow]Interview generation interrupted. Saving progress so far...[/yellow]")
+            raise
+        except Exception as e:
+            console.print(f"[red]Error generating interview between {interviewer.name} and {persona.name}: {str(e)}[/red]")
+            console.print("[yellow]Skipping this interview and continuing with the next one...[/yellow]")
+            progress.update(interview_task, advance=1)
+            return None
+        
+        # Get FinePersona data, or fall back to mock data
+        interviewee_pool = finepersona_pools.get(category)
+        if interviewee_pool:
+            # Use real FinePersona data for interviewee
+            interviewee_fp = interviewee_pool[i % len(interviewee_pool)]
+            interviewee_finepersona = {
+                "id": interviewee_fp.get("id", f"fp_{category}_{i}_001"),
+                "persona": interviewee_fp.get("persona_text", persona.role),
+                "labels": [label for label in interviewee_fp.get("labels", [category_title]) if label]
+            }
+        else:
+            # Generate mock FinePersona data
+            interviewee_finepersona = {
+                "id": f"fp_{category}_{i}_001",
+                "persona": persona.role,
+                "labels": list(default_interviewee_labels(category))
+            }
+        
+        # Track interview combination
+        combination = {
+            "interviewer": interviewer_record(i, interviewer, interviewer_index),
+            "interviewee": {
+                "name": persona.name,
+                "role": persona.role,
+                "user_id": f"{category}_{i}",
+                "demographics": {
+                    "stakeholder_category": category_display,
+                    "seniority": "Senior" if "Senior" in persona.role or "Chief" in persona.role or "Head" in persona.role else "Mid-level",
+                    "years_experience": "15+" if "Senior" in persona.role or "Chief" in persona.role else "5-15"
+                },
+                "finepersona": interviewee_finepersona
+            },
+            "interview_details": {
+                "category": category,
+                "file_path": interview_file,
+                "timestamp": RUN_DATE,
+                "model": model
+            }
+        }
+        
+        # Record the metadata as soon as the interview exists, whether or not it is analyzed now
+        append_jsonl(combinations_log, combination)
+        
+        # Defer analysis to the batch job
+        if use_batch:
+            pending_analyses.append((category, interviewer, persona, interview_text))
+            progress.update(interview_task, advance=1)
+            return interview_file, combination, None, None
+        
+        # Generate analysis
+        progress.update(interview_task, description=f"[green]Analysis: {persona.name}")
+        analysis_file = None
+        try:
+            async with semaphore:
+                analysis_text = await analyze_interview_async(fast_config, interview_text, interviewer, persona, category)
             
-            category_personas = available_personas[:interviews_per_category]
-            category_analyses = []
+            # Save analysis
+            analysis_file = save_interview_analysis(
+                analysis_text, interviewer, persona, category,
+                {"provider": provider, "model": fast_config["model"]},
+                timestamp, reports_dir
+            )
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            console.print("\n[yellow]Analysis generation interrupted. Saving progress so far...[/yellow]")
+            raise
+        except Exception as e:
+            console.print(f"[red]Error analyzing interview with {persona.name}: {str(e)}[/red]")
+            console.print("[yellow]Skipping this analysis and continuing with the next interview...[/yellow]")
+            # Add a placeholder analysis so the counts match
+            analysis_text = f"Error analyzing interview with {persona.name}. The system encountered an error."
+        
+        # Update progress
+        progress.update(interview_task, advance=1)
+        
+        return interview_file, combination, analysis_file, analysis_text
+
+        
+
+    async def run_interviews():
+        # Bound concurrent requests so we stay under the provider's rate limits
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY.get(provider, 5))
+        
+        try:
+            with Progress(console=console) as progress:
+                # Create tasks
+                interview_task = progress.add_task("[green]Generating interviews...", total=total_interviews)
             
-            # Generate interviews for each persona
-            for i, persona in enumerate(category_personas):
-                # Select interviewer (cycle through them)
-                interviewer_index = i % len(INTERVIEWERS)
-                interviewer = INTERVIEWERS[interviewer_index]
-                
-                # For interviews beyond available interviewers, create variations
-                if i >= len(INTERVIEWERS):
-                    interviewer = {
-                        "name": f"{interviewer['name']} (Session {int(i/len(INTERVIEWERS))+1})",
-                        "role": interviewer['role']
-                    }
-                
-                # Generate interview
-                console.print(f"Generating interview between {interviewer['name']} and {persona['name']}...")
-                try:
-                    interview_text = generate_interview(llm_config, interviewer, persona, category)
+                async def run_category(category):
+                    """Generate a category's interviews concurrently, then its stakeholder summary.
                     
-                    # Save interview
-                    interview_file = save_interview(
-                        interview_text, interviewer, persona, category, 
-                        {"provider": provider, "model": model}, 
-                        timestamp, exports_dir
-                    )
-                    all_interviews.append(interview_file)
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Interview generation interrupted. Saving progress so far...[/yellow]")
-                    raise
-                except Exception as e:
-                    console.print(f"[red]Error generating interview between {interviewer['name']} and {persona['name']}: {str(e)}[/red]")
-                    console.print("[yellow]Skipping this interview and continuing with the next one...[/yellow]")
-                    continue
-                
-                # Get FinePersona data
-                if use_finepersonas and finepersonas and "interviewer" in finepersonas and len(finepersonas["interviewer"]) > 0:
-                    # Use real FinePersona data for interviewer
-                    idx = interviewer_index % len(finepersonas["interviewer"])
-                    interviewer_finepersona = {
-                        "id": finepersonas["interviewer"][idx].get("id", f"fp_{interviewer_index}_001"),
-                        "persona": finepersonas["interviewer"][idx].get("persona_text", interviewer["role"]),
-                        "labels": finepersonas["interviewer"][idx].get("labels", ["Academic", "Research", "AI"])
-                    }
-                else:
-                    # Generate mock FinePersona data
-                    interviewer_finepersona = {
-                        "id": f"fp_{interviewer_index}_001",
-                        "persona": interviewer["role"],
-                        "labels": ["Academic", "Research", "AI", "Consulting", "Technology"]
-                    }
-                
-                if use_finepersonas and finepersonas and category in finepersonas and len(finepersonas[category]) > 0:
-                    # Use real FinePersona data for interviewee
-                    idx = i % len(finepersonas[category])
-                    interviewee_finepersona = {
-                        "id": finepersonas[category][idx].get("id", f"fp_{category}_{i}_001"),
-                        "persona": finepersonas[category][idx].get("persona_text", persona["role"]),
-                        "labels": finepersonas[category][idx].get("labels", [category.replace("_", " ").title()])
-                    }
-                else:
-                    # Generate mock FinePersona data
-                    interviewee_finepersona = {
-                        "id": f"fp_{category}_{i}_001",
-                        "persona": persona["role"],
-                        "labels": [
-                            category.replace("_", " ").title(),
-                            "Business" if "executive" in category or "client" in category else "",
-                            "Technology" if "tech" in category or "ai" in category else "",
-                            "Consulting" if "consultant" in category else "",
-                            "Government" if "regulatory" in category else "",
-                            "Research" if "analyst" in category else ""
-                        ]
-                    }
-                
-                # Track interview combination
-                combination = {
-                    "interviewer": {
-                        "name": interviewer["name"],
-                        "role": interviewer["role"],
-                        "user_id": f"interviewer_{interviewer_index}",
-                        "demographics": {
-                            "profession": "Researcher",
-                            "experience": "Senior",
-                            "expertise": "AI in Consulting"
-                        },
-                        "finepersona": {
-                            "id": interviewer_finepersona["id"],
-                            "persona": interviewer_finepersona["persona"],
-                            "labels": [label for label in interviewer_finepersona["labels"] if label]
-                        }
-                    },
-                    "interviewee": {
-                        "name": persona["name"],
-                        "role": persona["role"],
-                        "user_id": f"{category}_{i}",
-                        "demographics": {
-                            "stakeholder_category": category.replace("_", " "),
-                            "seniority": "Senior" if "Senior" in persona["role"] or "Chief" in persona["role"] or "Head" in persona["role"] else "Mid-level",
-                            "years_experience": "15+" if "Senior" in persona["role"] or "Chief" in persona["role"] else "5-15"
-                        },
-                        "finepersona": {
-                            "id": interviewee_finepersona["id"],
-                            "persona": interviewee_finepersona["persona"],
-                            "labels": [label for label in interviewee_finepersona["labels"] if label]
-                        }
-                    },
-                    "interview_details": {
-                        "category": category,
-                        "file_path": interview_file,
-                        "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "model": model
-                    }
-                }
-                interview_combinations.append(combination)
-                
-                # Generate analysis
-                console.print(f"Analyzing interview with {persona['name']}...")
-                try:
-                    analysis_text = analyze_interview(llm_config, interview_text, interviewer, persona, category)
+                    Returns (results, summary_text); summary_text is None if no summary was made.
+                    """
+                    console.print(f"\n[bold cyan]Generating interviews for {category.replace('_', ' ')}[/bold cyan]")
                     
-                    # Save analysis
-                    analysis_file = save_interview_analysis(
-                        analysis_text, interviewer, persona, category,
-                        {"provider": provider, "model": model},
-                        timestamp, reports_dir
-                    )
-                    all_analyses.append(analysis_file)
-                    category_analyses.append(analysis_text)
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Analysis generation interrupted. Saving progress so far...[/yellow]")
-                    raise
-                except Exception as e:
-                    console.print(f"[red]Error analyzing interview with {persona['name']}: {str(e)}[/red]")
-                    console.print("[yellow]Skipping this analysis and continuing with the next interview...[/yellow]")
-                    # Add a placeholder analysis so the counts match
-                    placeholder_analysis = f"Error analyzing interview with {persona['name']}. The system encountered an error."
-                    category_analyses.append(placeholder_analysis)
+                    # Take the built-in personas first, then generated ones if more are needed
+                    category_personas = list(itertools.islice(persona_stream(category), interviews_per_category))
+                    
+                    # Generate all interviews for this category concurrently (results keep persona order)
+                    results = await asyncio.gather(*[
+                        generate_and_analyze(i, persona, category, progress, interview_task, semaphore)
+                        for i, persona in enumerate(category_personas)
+                    ])
+                    
+                    if use_batch:
+                        return results, None
+                    
+                    category_analyses = [result[3] for result in results if result is not None and result[3] is not None]
+                    
+                    # Generate stakeholder summary for this category if we have analyses
+                    if not category_analyses:
+                        console.print(f"[yellow]No analyses available for {category.replace('_', ' ')}. Skipping summary generation.[/yellow]")
+                        return results, None
+                    
+                    console.print(f"\n[bold cyan]Generating summary for {category.replace('_', ' ')}[/bold cyan]")
+                    try:
+                        async with semaphore:
+                            summary_text = await create_stakeholder_summary_async(fast_config, category_analyses, category)
+                        
+                        # Save stakeholder summary
+                        save_stakeholder_summary(summary_text, category, timestamp, reports_dir)
+                    except (KeyboardInterrupt, asyncio.CancelledError):
+                        console.print("\n[yellow]Summary generation interrupted. Saving progress so far...[/yellow]")
+                        raise
+                    except Exception as e:
+                        console.print(f"[red]Error generating summary for {category.replace('_', ' ')}: {str(e)}[/red]")
+                        console.print("[yellow]Skipping this summary and continuing with the next category...[/yellow]")
+                        # Add a placeholder summary
+                        summary_text = f"Error generating summary for {category.replace('_', ' ')}. The system encountered an error."
+                    return results, summary_text
                 
-                # Update progress
-                progress.update(interview_task, advance=1)
+                # Run all categories at once; the shared semaphore still caps requests in flight
+                category_results = await asyncio.gather(*[run_category(category) for category in selected_categories])
                 
-                # Short pause to avoid rate limiting
-                time.sleep(1)
-            
-            # Generate stakeholder summary for this category if we have analyses
-            if category_analyses:
-                console.print(f"\n[bold cyan]Generating summary for {category.replace('_', ' ')}[/bold cyan]")
-                try:
-                    summary_text = create_stakeholder_summary(llm_config, category_analyses, category)
-                    
-                    # Save stakeholder summary
-                    summary_file = save_stakeholder_summary(summary_text, category, timestamp, reports_dir)
-                    stakeholder_summaries.append(summary_text)
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Summary generation interrupted. Saving progress so far...[/yellow]")
-                    raise
-                except Exception as e:
-                    console.print(f"[red]Error generating summary for {category.replace('_', ' ')}: {str(e)}[/red]")
-                    console.print("[yellow]Skipping this summary and continuing with the next category...[/yellow]")
-                    # Add a placeholder summary
-                    placeholder_summary = f"Error generating summary for {category.replace('_', ' ')}. The system encountered an error."
-                    stakeholder_summaries.append(placeholder_summary)
-            else:
-                console.print(f"[yellow]No analyses available for {category.replace('_', ' ')}. Skipping summary generation.[/yellow]")
+                # Collect outputs in category and persona order
+                for category, (results, summary_text) in zip(selected_categories, category_results):
+                    for result in results:
+                        if result is None:
+                            continue
+                        interview_file, combination, analysis_file, _ = result
+                        all_interviews.append(interview_file)
+                        interview_combinations.append(combination)
+                        if analysis_file:
+                            all_analyses.append(analysis_file)
+                    if summary_text is not None:
+                        stakeholder_summaries.append(summary_text)
+                        summarized_categories.append(category)
+        finally:
+            await close_async_http_client()
+    
+    with open(os.path.join(base_dir, COMBINATIONS_LOG_FILENAME), 'ab') as combinations_log:
+        asyncio.run(run_interviews())
+    
+    # Batch mode: all analyses go out as one batch, then all stakeholder summaries as a second one
+    if use_batch and pending_analyses:
+        console.print(f"\n[bold cyan]Submitting {len(pending_analyses)} analyses as a batch job[/bold cyan]")
+        analysis_prompts = [
+            build_analysis_prompt(interview_text, interviewer, persona, category)
+            for category, interviewer, persona, interview_text in pending_analyses
+        ]
+        try:
+            analysis_texts = submit_batch(fast_config, analysis_prompts, system=ANALYSIS_SYSTEM_PROMPT)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Batch analysis interrupted. Saving progress so far...[/yellow]")
+            raise
+        except Exception as e:
+            console.print(f"[red]Error running analysis batch: {str(e)}[/red]")
+            analysis_texts = [
+                f"Error analyzing interview with {persona.name}. The system encountered an error."
+                for _, _, persona, _ in pending_analyses
+            ]
+        
+        analyses_by_category = {}
+        for (category, interviewer, persona, _), analysis_text in zip(pending_analyses, analysis_texts):
+            analysis_file = save_interview_analysis(
+                analysis_text, interviewer, persona, category,
+                {"provider": provider, "model": fast_config["model"]},
+                timestamp, reports_dir
+            )
+            all_analyses.append(analysis_file)
+            analyses_by_category.setdefault(category, []).append(analysis_text)
+        
+        summary_categories = [category for category in selected_categories if category in analyses_by_category]
+        console.print(f"\n[bold cyan]Submitting {len(summary_categories)} stakeholder summaries as a batch job[/bold cyan]")
+        summary_prompts = [
+            build_summary_prompt(analyses_by_category[category], category)
+            for category in summary_categories
+        ]
+        try:
+            summary_texts = submit_batch(fast_config, summary_prompts, system=SUMMARY_SYSTEM_PROMPT)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Batch summary interrupted. Saving progress so far...[/yellow]")
+            raise
+        except Exception as e:
+            console.print(f"[red]Error running summary batch: {str(e)}[/red]")
+            summary_texts = [
+                f"Error generating summary for {category.replace('_', ' ')}. The system encountered an error."
+                for category in summary_categories
+            ]
+        
+        for category, summary_text in zip(summary_categories, summary_texts):
+            save_stakeholder_summary(summary_text, category, timestamp, reports_dir)
+            stakeholder_summaries.append(summary_text)
+            summarized_categories.append(category)
     
     # Generate final report
     report_file = None
     comprehensive_report_dir = os.path.join(reports_dir, 'comprehensive')
-    os.makedirs(comprehensive_report_dir, exist_ok=True)
     
     # Always generate a final report, even for a single category
     if stakeholder_summaries:
         console.print("\n[bold cyan]Generating comprehensive final report[/bold cyan]")
         try:
             # Create the comprehensive report
-            report_text = create_final_report(llm_config, stakeholder_summaries, selected_categories)
+            report_text = create_final_report(llm_config, stakeholder_summaries, summarized_categories)
             
             # Save final report
             report_file = save_final_report(report_text, timestamp, reports_dir)
@@ -1306,34 +2173,31 @@ def main():
                 
                 # Create a merged report from all stakeholder summaries
                 merged_report_path = os.path.join(comprehensive_report_dir, f"merged_report_{timestamp}.md")
-                with open(merged_report_path, 'w', encoding='utf-8') as f:
-                    f.write(f"# AI in Consulting: Comprehensive Research Report\n\n")
-                    f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    f.write(f"## Overview\n\n")
-                    f.write(f"This report compiles findings from {len(all_interviews)} interviews across {len(selected_categories)} stakeholder categories.\n\n")
+                parts = [
+                    "# AI in Consulting: Comprehensive Research Report\n\n",
+                    f"Generated: {RUN_DATE}\n\n",
+                    "## Overview\n\n",
+                    f"This report compiles findings from {len(all_interviews)} interviews across {len(selected_categories)} stakeholder categories.\n\n"
+                ]
+                
+                # Add a section for each stakeholder category
+                for category, summary in zip(summarized_categories, stakeholder_summaries):
+                    parts.append(f"## {category.replace('_', ' ').title()} Findings\n\n")
                     
-                    # Add a section for each stakeholder category
-                    for i, (category, summary) in enumerate(zip(selected_categories, stakeholder_summaries)):
-                        f.write(f"## {category.replace('_', ' ').title()} Findings\n\n")
-                        
-                        # Extract just the executive summary portion if available
-                        exec_summary = ""
-                        if "## EXECUTIVE SUMMARY" in summary:
-                            parts = summary.split("## EXECUTIVE SUMMARY")
-                            if len(parts) > 1:
-                                exec_parts = parts[1].split("##")
-                                if len(exec_parts) > 0:
-                                    exec_summary = exec_parts[0].strip()
-                        
-                        # Use the extracted executive summary or the first 500 chars of the full summary
-                        if exec_summary:
-                            f.write(exec_summary + "\n\n")
-                        else:
-                            f.write(summary[:500] + "...\n\n")
+                    # Extract just the executive summary portion if available
+                    match = EXECUTIVE_SUMMARY_RE.search(summary)
+                    exec_summary = match.group(1).strip() if match else ""
                     
-                    # Add a conclusion
-                    f.write("## Conclusion\n\n")
-                    f.write("This report represents a compilation of all stakeholder interviews. For detailed findings, please refer to the individual stakeholder reports.\n")
+                    # Use the extracted executive summary or the first 500 chars of the full summary
+                    if exec_summary:
+                        parts.append(exec_summary + "\n\n")
+                    else:
+                        parts.append(summary[:500] + "...\n\n")
+                
+                # Add a conclusion
+                parts.append("## Conclusion\n\n")
+                parts.append("This report represents a compilation of all stakeholder interviews. For detailed findings, please refer to the individual stakeholder reports.\n")
+                Path(merged_report_path).write_text("".join(parts), encoding='utf-8')
                 
                 report_file = merged_report_path
                 console.print(f"[green]Basic merged report created at: {merged_report_path}[/green]")
@@ -1349,63 +2213,69 @@ def main():
                 console.print("[yellow]Creating a minimal report from interview data...[/yellow]")
                 minimal_report_path = os.path.join(comprehensive_report_dir, f"minimal_report_{timestamp}.md")
                 
-                with open(minimal_report_path, 'w', encoding='utf-8') as f:
-                    f.write(f"# AI in Consulting: Interview Summary Report\n\n")
-                    f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    f.write(f"## Overview\n\n")
-                    f.write(f"This report summarizes {len(all_interviews)} interviews conducted across {len(selected_categories)} stakeholder categories.\n\n")
+                parts = [
+                    "# AI in Consulting: Interview Summary Report\n\n",
+                    f"Generated: {RUN_DATE}\n\n",
+                    "## Overview\n\n",
+                    f"This report summarizes {len(all_interviews)} interviews conducted across {len(selected_categories)} stakeholder categories.\n\n"
+                ]
+                
+                # Group interviews by category in one pass
+                combos_by_category = {}
+                for combo in interview_combinations:
+                    combos_by_category.setdefault(combo["interview_details"]["category"], []).append(combo)
+                
+                # Add a section for each category
+                for category in selected_categories:
+                    category_interviews = combos_by_category.get(category, [])
+                    parts.append(f"## {category.replace('_', ' ').title()}\n\n")
+                    parts.append(f"* {len(category_interviews)} interviews conducted\n")
                     
-                    # Add a section for each category
-                    for category in selected_categories:
-                        category_interviews = [path for path in all_interviews if f"/{category}/" in path]
-                        f.write(f"## {category.replace('_', ' ').title()}\n\n")
-                        f.write(f"* {len(category_interviews)} interviews conducted\n")
-                        
-                        # List interviewees
-                        for path in category_interviews:
-                            # Extract interviewee name from filename
-                            filename = os.path.basename(path)
-                            parts = filename.split('_')
-                            if len(parts) >= 3:
-                                f.write(f"* Interview with {parts[2]}\n")
-                        f.write("\n")
+                    # List interviewees
+                    parts.extend(f"* Interview with {combo['interviewee']['name']}\n" for combo in category_interviews)
+                    parts.append("\n")
+                Path(minimal_report_path).write_text("".join(parts), encoding='utf-8')
                 
                 report_file = minimal_report_path
                 console.print(f"[green]Minimal report created at: {minimal_report_path}[/green]")
             except Exception as e:
                 console.print(f"[red]Failed to create minimal report: {str(e)}[/red]")
     
+    # Create PDF versions of the analyses, summaries and final report in the background,
+    # so the remaining files and prompts below don't wait for pandoc
+    if PENDING_PDFS:
+        console.print(f"\n[bold cyan]Creating {len(PENDING_PDFS)} PDF documents in the background[/bold cyan]")
+    pdf_executor = ThreadPoolExecutor(max_workers=1)
+    pdf_conversion = pdf_executor.submit(convert_pending_pdfs, True)
+    pdf_executor.shutdown(wait=False)
+    
     # Save interview combinations to a JSON file
     combinations_file = os.path.join(base_dir, "interview_combinations.json")
-    with open(combinations_file, 'w', encoding='utf-8') as f:
-        json.dump(interview_combinations, f, indent=2)
+    combinations_data = normalize_combinations(interview_combinations)
+    if orjson is not None:
+        Path(combinations_file).write_bytes(orjson.dumps(combinations_data, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump would issue a write for every token of the indented output
+        Path(combinations_file).write_text(json.dumps(combinations_data, indent=2), encoding='utf-8')
     
     # Create a more readable summary file
     summary_file = os.path.join(base_dir, "interview_summary.md")
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write(f"# Interview Summary\n\n")
-        f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Model: {provider}/{model}\n\n")
-        f.write(f"## Overview\n\n")
-        f.write(f"- Total interviews: {len(all_interviews)}\n")
-        f.write(f"- Stakeholder categories: {len(selected_categories)}\n")
-        f.write(f"- Interviews per category: {interviews_per_category}\n\n")
-        
-        f.write(f"## Interview Combinations\n\n")
-        for i, combo in enumerate(interview_combinations):
-            f.write(f"### Interview {i+1}\n\n")
-            f.write(f"**Interviewer**: {combo['interviewer']['name']} ({combo['interviewer']['user_id']})\n")
-            f.write(f"- Role: {combo['interviewer']['role']}\n")
-            f.write(f"- Demographics: {', '.join([f'{k}: {v}' for k, v in combo['interviewer']['demographics'].items()])}\n\n")
-            
-            f.write(f"**Interviewee**: {combo['interviewee']['name']} ({combo['interviewee']['user_id']})\n")
-            f.write(f"- Role: {combo['interviewee']['role']}\n")
-            f.write(f"- Demographics: {', '.join([f'{k}: {v}' for k, v in combo['interviewee']['demographics'].items()])}\n\n")
-            
-            f.write(f"**Details**:\n")
-            f.write(f"- Category: {combo['interview_details']['category'].replace('_', ' ')}\n")
-            f.write(f"- File: {os.path.basename(combo['interview_details']['file_path'])}\n")
-            f.write(f"- Timestamp: {combo['interview_details']['timestamp']}\n\n")
+    header = (
+        f"# Interview Summary\n\n"
+        f"Generated: {RUN_DATE}\n"
+        f"Model: {provider}/{model}\n\n"
+        f"## Overview\n\n"
+        f"- Total interviews: {len(all_interviews)}\n"
+        f"- Stakeholder categories: {len(selected_categories)}\n"
+        f"- Interviews per category: {interviews_per_category}\n\n"
+        f"## Interview Combinations\n\n"
+    )
+    parts = [header]
+    demographics = render_demographics(interview_combinations)
+    parts.extend(render_combination_summary(i, combo, demographics) for i, combo in enumerate(interview_combinations))
+    # One write of the whole document instead of a dozen small writes per interview
+    with open(summary_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write("".join(parts))
     
     # Print summary
     console.print("\n[bold green]Process completed![/bold green]")
@@ -1417,25 +2287,22 @@ def main():
     console.print(f"  - Interview summary: {summary_file}")
     
     # Check for PDF generation capabilities and offer installation if needed
-    try:
-        # First check if pypandoc is available
-        import pypandoc
-        pypandoc_available = True
-    except ImportError:
-        pypandoc_available = False
-        # Then check if system pandoc is available
-        pandoc_available = os.system("which pandoc > /dev/null 2>&1") == 0
+    toolchain = probe_pdf_toolchain()
+    pypandoc_available = toolchain["pypandoc"]
+    pandoc_available = toolchain["pandoc"]
     
     # Check if latex packages are installed (specifically check for xcolor.sty)
-    latex_extra_installed = False
-    if os.system("dpkg-query -W -f='${Status}' texlive-latex-extra 2>/dev/null | grep 'install ok installed'") == 0:
-        latex_extra_installed = True
-    elif os.system("find /usr -name 'xcolor.sty' 2>/dev/null | grep -q 'xcolor.sty'") == 0:
-        latex_extra_installed = True
+    latex_extra_installed = toolchain["xcolor"]
     
     pdf_generation_issue = not (pypandoc_available or pandoc_available) or not latex_extra_installed
     
+    # WeasyPrint renders PDFs without pandoc or LaTeX
+    if load_weasyprint():
+        pdf_generation_issue = False
+    
     if pdf_generation_issue:
+        # Let the background conversion finish before offering to install packages and convert again
+        report_pdf_results(*pdf_conversion.result())
         console.print("[yellow]PDF generation issue detected.[/yellow]")
         
         if not pypandoc_available and not pandoc_available:
@@ -1455,15 +2322,17 @@ def main():
         
         if "all requirements" in install_option:
             console.print("[cyan]Installing pypandoc in the virtual environment...[/cyan]")
-            exit_code = os.system("pip install pypandoc markdown2pdf")
+            # Install into the interpreter running this script, whichever `pip` is first on PATH
+            subprocess.run([sys.executable, "-m", "pip", "install", "pypandoc", "markdown2pdf"], check=False)
             
             # Also install system dependencies
             console.print("[cyan]Installing LaTeX requirements (requires admin privileges)...[/cyan]")
-            os.system("sudo apt-get update && sudo apt-get install -y texlive-latex-base texlive-fonts-recommended texlive-latex-extra")
+            apt_install(LATEX_APT_PACKAGES)
             
             # Verify all installations
-            pypandoc_ok = os.system("pip show pypandoc > /dev/null 2>&1") == 0
-            latex_ok = os.system("dpkg-query -W -f='${Status}' texlive-latex-extra 2>/dev/null | grep 'install ok installed'") == 0
+            toolchain = reprobe_pdf_toolchain()
+            pypandoc_ok = toolchain["pypandoc"]
+            latex_ok = toolchain["xcolor"]
             
             if pypandoc_ok and latex_ok:
                 console.print("[green]All PDF generation requirements installed successfully![/green]")
@@ -1471,35 +2340,7 @@ def main():
                 convert_now = questionary.confirm("Convert existing Markdown files to PDF?", default=True).ask()
                 
                 if convert_now:
-                    try:
-                        # Try to import the newly installed pypandoc
-                        import pypandoc
-                        console.print("[cyan]Converting Markdown files to PDF...[/cyan]")
-                        
-                        # Find all markdown files in the exports directory
-                        md_files = []
-                        for root, _, files in os.walk(base_dir):
-                            for file in files:
-                                if file.endswith(".md"):
-                                    md_files.append(os.path.join(root, file))
-                        
-                        if md_files:
-                            with Progress() as progress:
-                                convert_task = progress.add_task("[green]Converting files...", total=len(md_files))
-                                # Convert each markdown file to PDF
-                                for md_file in md_files:
-                                    try:
-                                        pdf_file = md_file.replace(".md", ".pdf")
-                                        pypandoc.convert_file(md_file, 'pdf', outputfile=pdf_file)
-                                        progress.update(convert_task, advance=1)
-                                    except Exception as e:
-                                        console.print(f"[yellow]Error converting {md_file}: {str(e)}[/yellow]")
-                            
-                            console.print(f"[green]Converted {len(md_files)} Markdown files to PDF.[/green]")
-                        else:
-                            console.print("[yellow]No Markdown files found in the exports directory.[/yellow]")
-                    except Exception as e:
-                        console.print(f"[red]Error using pypandoc: {str(e)}[/red]")
+                    convert_markdown_tree(base_dir)
             else:
                 if not pypandoc_ok:
                     console.print("[red]Failed to install pypandoc.[/red]")
@@ -1509,11 +2350,12 @@ def main():
         
         elif "system requirements" in install_option:
             console.print("[cyan]Installing pandoc and LaTeX requirements (requires admin privileges)...[/cyan]")
-            os.system("sudo apt-get update && sudo apt-get install -y pandoc texlive-latex-base texlive-fonts-recommended texlive-latex-extra")
+            apt_install(("pandoc",) + LATEX_APT_PACKAGES)
             
             # Verify installation
-            pandoc_ok = os.system("which pandoc > /dev/null 2>&1") == 0
-            latex_ok = os.system("dpkg-query -W -f='${Status}' texlive-latex-extra 2>/dev/null | grep 'install ok installed'") == 0
+            toolchain = reprobe_pdf_toolchain()
+            pandoc_ok = toolchain["pandoc"]
+            latex_ok = toolchain["xcolor"]
             
             if pandoc_ok and latex_ok:
                 console.print("[green]All system dependencies installed successfully![/green]")
@@ -1521,26 +2363,7 @@ def main():
                 convert_now = questionary.confirm("Convert existing Markdown files to PDF?", default=True).ask()
                 
                 if convert_now:
-                    console.print("[cyan]Converting Markdown files to PDF...[/cyan]")
-                    # Find all markdown files in the exports directory
-                    md_files = []
-                    for root, _, files in os.walk(base_dir):
-                        for file in files:
-                            if file.endswith(".md"):
-                                md_files.append(os.path.join(root, file))
-                    
-                    if md_files:
-                        with Progress() as progress:
-                            convert_task = progress.add_task("[green]Converting files...", total=len(md_files))
-                            # Convert each markdown file to PDF
-                            for md_file in md_files:
-                                pdf_file = md_file.replace(".md", ".pdf")
-                                os.system(f"pandoc {md_file} -o {pdf_file} 2>/dev/null")
-                                progress.update(convert_task, advance=1)
-                        
-                        console.print(f"[green]Converted {len(md_files)} Markdown files to PDF.[/green]")
-                    else:
-                        console.print("[yellow]No Markdown files found in the exports directory.[/yellow]")
+                    convert_markdown_tree(base_dir)
             else:
                 if not pandoc_ok:
                     console.print("[red]Failed to install pandoc.[/red]")
@@ -1559,9 +2382,11 @@ def main():
             # Try to open the report with the default application
             try:
                 if os.name == 'nt':  # Windows
-                    os.system(f'start "" "{report_file}"')
-                elif os.name == 'posix':  # Linux/Unix/MacOS
-                    os.system(f'xdg-open "{report_file}"')
+                    os.startfile(report_file)
+                elif sys.platform == 'darwin':  # MacOS
+                    subprocess.run(["open", report_file], check=False)
+                elif os.name == 'posix':  # Linux/Unix
+                    subprocess.run(["xdg-open", report_file], check=False)
                 else:
                     console.print("[yellow]Could not automatically open the report on this operating system.[/yellow]")
                     console.print(f"You can manually open the report at: {report_file}")
@@ -1572,6 +2397,9 @@ def main():
         console.print(f"[yellow]Report file {report_file} does not exist. Please check the exports directory.[/yellow]")
     else:
         console.print("[yellow]No report was generated to view.[/yellow]")
+    
+    if not pdf_generation_issue:
+        report_pdf_results(*pdf_conversion.result())
 
 if __name__ == "__main__":
     console.print("\n[bold green]Interactive Interview Generator[/bold green]")
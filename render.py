@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Render a single interview from an interviews.jsonl log written with --jsonl-log."""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import subprocess
+
+
+def find_interview(log_path, category, name):
+    """Return the first record in the log matching category and interviewee name."""
+    with open(log_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["category"] == category and record["name"] == name:
+                return record
+    return None
+
+
+def format_interview(record):
+    """Format a record the same way as the per-interview .txt files."""
+    return (
+        f"INTERVIEW: {record['name']} ({record['category'].replace('_', ' ')})\n"
+        f"ROLE: {record['role']}\n"
+        f"INTERVIEWER: {record['interviewer']}\n"
+        f"MODEL: {record['model']}\n"
+        f"DATE: {record['date']}\n\n"
+        f"{record['text']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render an interview from an interviews.jsonl log')
+    parser.add_argument('log', help='Path to interviews.jsonl')
+    parser.add_argument('--category', required=True, help='Stakeholder category, e.g. senior_executives')
+    parser.add_argument('--name', required=True, help='Interviewee name, e.g. "Sarah Chen"')
+    parser.add_argument('--pdf', help='Write a PDF to this path with pandoc instead of printing the text')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log):
+        print(f"Log file not found: {args.log}", file=sys.stderr)
+        return 1
+
+    record = find_interview(args.log, args.category, args.name)
+    if record is None:
+        print(f"No interview with {args.name} ({args.category}) in {args.log}", file=sys.stderr)
+        return 1
+
+    text = format_interview(record)
+    if not args.pdf:
+        print(text)
+        return 0
+
+    if shutil.which("pandoc") is None:
+        print("pandoc is not installed; cannot create a PDF.", file=sys.stderr)
+        return 1
+    result = subprocess.run(
+        ["pandoc", "-f", "markdown", "-o", args.pdf, "-V", "geometry:margin=1in"],
+        input=text, text=True, stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        print(f"pandoc failed: {result.stderr.strip()}", file=sys.stderr)
+        return result.returncode
+    print(f"Saved PDF to {args.pdf}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
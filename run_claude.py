@@ -1,4 +1,5 @@
 import os
+import asyncio
 import anthropic
 
 api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -6,20 +7,29 @@
 if not api_key:
     raise ValueError("API key nd. " "Use 'set ANTHROPIC_API_KEY=sua_chave' .")
 
-client = anthropic.Anthropic(api_key=api_key)
-
-response = client.messages.create(
-    model="claude-3-opus-20240229",
-    max_tokens=1024,
-    messages=[
-        {
-            "role": "user",
-            "content": (
-                "Gera 5 perguntas de entrevista para um gestor de inovação "
-                "com foco em transformação digital."
-            ),
-        }
-    ],
-)
-
-print(response.content[0].text)
+client = anthropic.AsyncAnthropic(api_key=api_key)
+
+# Os pedidos são enviados em paralelo; acrescente mais prompts a esta lista
+PROMPTS = [
+    (
+        "Gera 5 perguntas de entrevista para um gestor de inovação "
+        "com foco em transformação digital."
+    ),
+]
+
+
+async def ask(prompt):
+    response = await client.messages.create(
+        model="claude-3-opus-20240229",
+        max_tokens=1024,
+        messages=[{"role": "user", "content": prompt}],
+    )
+    return response.content[0].text
+
+
+async def main(prompts):
+    return await asyncio.gather(*(ask(prompt) for prompt in prompts))
+
+
+for text in asyncio.run(main(PROMPTS)):
+    print(text)
@@ -1,11 +1,20 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import create_engine, event, insert, Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
-import datetime
+from sqlalchemy.orm import relationship, sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.sql import func
+from contextlib import contextmanager
+from functools import cached_property
 import os
+import queue
+import atexit
+import threading
 
 Base = declarative_base()
 
+# Longest persona short description shown in selection menus
+SHORT_DESCRIPTION_LENGTH = 100
+
 class Persona(Base):
     __tablename__ = 'personas'
     
@@ -23,7 +32,17 @@ class Persona(Base):
     communication_style = Column(Text)
     ai_views = Column(Text)
     created_by = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    
+    @cached_property
+    def short_description(self):
+        """First sentence of the background, truncated; computed once per loaded persona."""
+        if not self.background:
+            return ""
+        first_sentence = self.background.partition('.')[0]
+        if len(first_sentence) > SHORT_DESCRIPTION_LENGTH:
+            return first_sentence[:SHORT_DESCRIPTION_LENGTH] + '...'
+        return first_sentence
 
 class Interview(Base):
     __tablename__ = 'interviews'
@@ -35,7 +54,7 @@ class Interview(Base):
     model_used = Column(String, nullable=False)
     raw_interview = Column(Text)
     xml_formatted = Column(Text)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     
     # Relationships
     interviewer = relationship("Persona", foreign_keys=[interviewer_id])
@@ -55,44 +74,148 @@ class Analysis(Base):
     rq4_insights = Column(Text)
     contradictions = Column(Text)
     authenticity_assessment = Column(Text)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+
+# Indexes for the columns used in lookups
+INDEXES = (
+    Index('ix_persona_cat_role', Persona.category, Persona.role),
+    Index('ix_interview_category', Interview.category),
+    Index('ix_analysis_interview', Analysis.interview_id),
+)
+
+# Bytes of the database file SQLite may memory-map for reads (256 MiB)
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+# Page cache per connection; negative values are in KiB (64 MiB)
+SQLITE_CACHE_SIZE = -64 * 1024
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection for fast bulk writes and memory-mapped reads."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+    cursor.close()
+
+# Connections kept open per engine, plus how many extra may be opened under load
+POOL_SIZE = 8
+POOL_MAX_OVERFLOW = 16
+
+# Seconds a SQLite connection waits for another writer's lock before failing
+SQLITE_BUSY_TIMEOUT = 30
+
+def _add_created_at_triggers(engine):
+    """Have SQLite fill in created_at for tables created before the column had a server default."""
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            columns = conn.exec_driver_sql(f"PRAGMA table_info({table.name})").fetchall()
+            # table_info rows are (cid, name, type, notnull, dflt_value, pk)
+            if any(column[1] == 'created_at' and column[4] is None for column in columns):
+                conn.exec_driver_sql(
+                    f"CREATE TRIGGER IF NOT EXISTS {table.name}_created_at AFTER INSERT ON {table.name} "
+                    f"WHEN NEW.created_at IS NULL BEGIN "
+                    f"UPDATE {table.name} SET created_at = CURRENT_TIMESTAMP WHERE rowid = NEW.rowid; END"
+                )
 
 class DatabaseManager:
     def __init__(self, db_path='sqlite:///data/interviews.db'):
-        self.engine = create_engine(db_path)
+        if db_path.startswith('sqlite'):
+            connect_args = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT}
+            if db_path in ('sqlite://', 'sqlite:///:memory:'):
+                # Every connection to :memory: is a separate database, so share a single one
+                self.engine = create_engine(db_path, poolclass=StaticPool, connect_args=connect_args)
+            else:
+                # Pool file connections so threads reuse them (and their pragmas) instead of reconnecting
+                self.engine = create_engine(
+                    db_path, poolclass=QueuePool, pool_size=POOL_SIZE, max_overflow=POOL_MAX_OVERFLOW,
+                    connect_args=connect_args
+                )
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        else:
+            self.engine = create_engine(
+                db_path, pool_size=POOL_SIZE, max_overflow=POOL_MAX_OVERFLOW, pool_pre_ping=True
+            )
         Base.metadata.create_all(self.engine)
-        self.Session = sessionmaker(bind=self.engine)
+        # create_all skips tables that already exist, so add missing indexes to older databases
+        for index in INDEXES:
+            index.create(self.engine, checkfirst=True)
+        if db_path.startswith('sqlite'):
+            _add_created_at_triggers(self.engine)
+        # One thread-local session, reused across calls; objects stay usable after commit
+        self._Session = scoped_session(sessionmaker(bind=self.engine, expire_on_commit=False))
+        # get_personas_by_category results by (category, role); cleared whenever personas are added
+        self._persona_cache = {}
     
     def get_session(self):
-        return self.Session()
+        return self._Session()
+    
+    @contextmanager
+    def session(self):
+        """Yield the session, committing on success and rolling back on error."""
+        session = self._Session()
+        try:
+            yield session
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        finally:
+            session.close()
     
     def create_persona(self, persona_data):
         """Create a new persona in the database."""
-        session = self.get_session()
-        try:
+        with self.session() as session:
             persona = Persona(**persona_data)
             session.add(persona)
-            session.commit()
+            session.flush()
+            self.invalidate_persona_cache()
             return persona.id
-        finally:
-            session.close()
+    
+    def bulk_create_personas(self, personas_data):
+        """Create several personas in a single transaction.
+        
+        The rows go through one executemany INSERT rather than a statement per persona, so the
+        new IDs are not fetched; look personas up with get_personas_by_category afterwards.
+        
+        Args:
+            personas_data: List of persona dictionaries, as accepted by create_persona
+            
+        Returns:
+            Number of personas created
+        """
+        if not personas_data:
+            return 0
+        with self.session() as session:
+            session.execute(insert(Persona), personas_data)
+            self.invalidate_persona_cache()
+        return len(personas_data)
     
     def get_personas_by_category(self, category, role=None):
-        """Fetch all personas for a specific category and optionally role."""
-        session = self.get_session()
-        try:
-            query = session.query(Persona).filter_by(category=category)
-            if role:
-                query = query.filter_by(role=role)
-            personas = query.all()
-            return personas
-        finally:
-            session.close()
+        """Fetch all personas for a specific category and optionally role.
+        
+        Results are cached per (category, role) until personas are added through this manager.
+        """
+        key = (category, role)
+        personas = self._persona_cache.get(key)
+        if personas is None:
+            with self.session() as session:
+                query = session.query(Persona).filter_by(category=category)
+                if role:
+                    query = query.filter_by(role=role)
+                personas = query.all()
+            self._persona_cache[key] = personas
+        # Hand out a copy so callers can't change the cached list
+        return list(personas)
+    
+    def invalidate_persona_cache(self):
+        """Forget cached get_personas_by_category results."""
+        self._persona_cache.clear()
     
     def create_interview(self, interviewer_id, interviewee_id, category, model_used, raw_interview, xml_formatted):
         """Create a new interview record."""
-        session = self.get_session()
-        try:
+        with self.session() as session:
             interview = Interview(
                 interviewer_id=interviewer_id,
                 interviewee_id=interviewee_id,
@@ -102,21 +225,130 @@ def create_interview(self, interviewer_id, interviewee_id, category, model_used,
                 xml_formatted=xml_formatted
             )
             session.add(interview)
-            session.commit()
+            session.flush()
             return interview.id
-        finally:
-            session.close()
+    
+    def bulk_create_interviews(self, interviews_data):
+        """Create several interview records in a single transaction.
+        
+        Args:
+            interviews_data: List of dictionaries with the create_interview arguments
+            
+        Returns:
+            List of the new interview IDs, in input order
+        """
+        interviews = [Interview(**data) for data in interviews_data]
+        with self.session() as session:
+            session.bulk_save_objects(interviews, return_defaults=True)
+            return [interview.id for interview in interviews]
+    
+    def bulk_create_interviews_with_analyses(self, interviews_data, analyses_data):
+        """Create interview records and their analyses together in a single transaction.
+        
+        Args:
+            interviews_data: List of dictionaries with the create_interview arguments
+            analyses_data: List of analysis dictionaries, one per interview and in the same order
+            
+        Returns:
+            List of the new interview IDs, in input order
+        """
+        interviews = [Interview(**data) for data in interviews_data]
+        with self.session() as session:
+            session.bulk_save_objects(interviews, return_defaults=True)
+            session.bulk_save_objects([
+                Analysis(interview_id=interview.id, **data)
+                for interview, data in zip(interviews, analyses_data)
+            ])
+            return [interview.id for interview in interviews]
     
     def create_analysis(self, interview_id, analysis_data):
         """Create a new analysis record."""
-        session = self.get_session()
-        try:
+        with self.session() as session:
             analysis = Analysis(interview_id=interview_id, **analysis_data)
             session.add(analysis)
-            session.commit()
+            session.flush()
             return analysis.id
-        finally:
-            session.close()
+    
+    def bulk_create_analyses(self, analyses_data):
+        """Create several analysis records in a single transaction.
+        
+        Args:
+            analyses_data: List of analysis dictionaries, each including its interview_id
+            
+        Returns:
+            List of the new analysis IDs, in input order
+        """
+        analyses = [Analysis(**data) for data in analyses_data]
+        with self.session() as session:
+            session.bulk_save_objects(analyses, return_defaults=True)
+            return [analysis.id for analysis in analyses]
+
+class BackgroundWriter:
+    """Run DatabaseManager write methods on a single daemon thread so callers don't wait for commits."""
+    
+    def __init__(self, manager):
+        self.manager = manager
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        # Exceptions from failed writes, raised to the caller by the next flush or close
+        self._errors = []
+    
+    def submit(self, method_name, *args, **kwargs):
+        """Queue a call to manager.<method_name>(*args, **kwargs), starting the writer thread if needed."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+        self._queue.put((method_name, args, kwargs))
+    
+    def _run(self):
+        """Apply queued writes in order until the close sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                method_name, args, kwargs = item
+                getattr(self.manager, method_name)(*args, **kwargs)
+            except Exception as e:
+                self._errors.append(e)
+            finally:
+                self._queue.task_done()
+    
+    def _raise_errors(self):
+        """Raise (and forget) the failures recorded since the last flush or close."""
+        errors, self._errors = self._errors, []
+        if errors:
+            raise RuntimeError(
+                f"{len(errors)} database write(s) failed; first error: {str(errors[0])}"
+            ) from errors[0]
+    
+    def flush(self):
+        """Block until every queued write has been applied.
+        
+        Raises:
+            RuntimeError: If any write queued since the last flush or close failed
+        """
+        self._queue.join()
+        self._raise_errors()
+    
+    def close(self):
+        """Apply the remaining writes and stop the writer thread.
+        
+        Raises:
+            RuntimeError: If any write queued since the last flush or close failed
+        """
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+        self._raise_errors()
 
 # Initialize the database when imported
-db_manager = DatabaseManager()
\ No newline at end of file
+db_manager = DatabaseManager()
+
+# Writes that nothing reads back straight away (interviews and analyses) go through here
+db_writer = BackgroundWriter(db_manager)
+atexit.register(db_writer.close)
\ No newline at end of file
@@ -1,21 +1,39 @@
+import io
 import os
 import re
 import json
+import string
+import asyncio
+import itertools
 import click
 import questionary
 import datetime
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
 
-from database.db_manager import db_manager
-from models.ai_models import AIModelInterface, get_available_models, get_all_model_info, BatchProcessor
+from database.db_manager import db_manager, db_writer
+from models.ai_models import (
+    get_model, get_available_models, get_model_info, get_all_model_info, estimate_tokens,
+    clamp_max_tokens, BatchProcessor, MAX_CONCURRENCY, CHARS_PER_TOKEN, response_cache
+)
 from prompts.prompt_templates import (
     INTERVIEWER_PERSONA_PROMPT,
     INTERVIEWEE_PERSONA_PROMPT,
-    INTERVIEW_GENERATION_PROMPT,
+    XML_INTERVIEW_GENERATION_PROMPT,
     XML_FORMATTING_PROMPT,
-    ANALYSIS_PROMPT
+    ANALYSIS_PROMPT,
+    FUSED_INTERVIEW_PROMPT,
+    FUSED_INTERVIEW_SCHEMA,
+    FORMAT_AND_ANALYZE_PROMPT,
+    FORMAT_AND_ANALYZE_SCHEMA,
+    ANALYSIS_FIELD_INSTRUCTIONS,
+    STRUCTURED_ANALYSIS_SECTIONS,
+    MULTI_INTERVIEW_PROMPT,
+    EXECUTIVE_SUMMARY_SYSTEM_PROMPT,
+    PRESENTATION_BULLETS_SYSTEM_PROMPT
 )
 from utils.script_parser import (
     parse_interview_scripts,
@@ -24,9 +42,21 @@
     save_scripts_to_files,
     STAKEHOLDER_CATEGORIES,
     NORMALIZED_CATEGORIES,
+    INVERSE_NORMALIZED_CATEGORIES,
     save_scripts_to_json
 )
-from utils.persona_manager import FinePersonaManager
+
+# Optional faster JSON encoder for the JSON files written by write_json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming JSON parser, so listing a questions file holds one category in memory at a time
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Optional imports - will be handled with try/except when used
 # from pptx import Presentation
@@ -38,13 +68,63 @@
 
 console = Console()
 
+def write_json(path, data):
+    """Write data as indented JSON, replacing path atomically so a crash never leaves a partial file.
+    
+    Args:
+        path: File to write
+        data: JSON-serializable object
+    """
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        # One write of the whole document; json.dump writes every token separately
+        content = json.dumps(data, indent=2).encode('utf-8')
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+# Output budget for a single call returning the interview and its analysis together; lowered to
+# the model's own output limit where that is smaller
+FUSED_MAX_TOKENS = 8000
+
+def close_db_writer():
+    """Apply the remaining queued database writes, reporting any that failed."""
+    try:
+        db_writer.close()
+    except Exception as e:
+        console.print(f"[red]Error saving to database: {str(e)}[/red]")
+
 @click.group()
-def cli():
+@click.option('--no-cache', is_flag=True,
+              help="Always call the model API instead of reusing responses to identical earlier requests")
+@click.option('--provider', type=click.Choice(list(get_available_models())),
+              help="AI provider to use instead of asking")
+@click.option('--model', help="AI model to use instead of asking; the provider is looked up if not given")
+@click.pass_context
+def cli(ctx, no_cache, provider, model):
     """Virtual Interview Generator for AI in Consulting Research"""
-    pass
+    response_cache.enabled = not no_cache
+    if model and not provider:
+        provider = next((key for key, models in get_available_models().items() if model in models), None)
+        if provider is None:
+            raise click.BadParameter(f"unknown model '{model}', pass --provider as well", param_hint="--model")
+    # Read by select_ai_model in place of asking
+    ctx.obj = {"provider": provider, "model": model}
+    # Finish queued database writes before the command returns
+    ctx.call_on_close(close_db_writer)
 
 def select_ai_model():
-    """Interactive model selection with context window information."""
+    """Interactive model selection with context window information.
+    
+    The CLI's --provider and --model options answer the matching questions in advance.
+    """
+    ctx = click.get_current_context(silent=True)
+    preset = (ctx.find_object(dict) if ctx else None) or {}
+    if preset.get("provider") and preset.get("model"):
+        return {"provider": preset["provider"], "model": preset["model"]}
+    
     # First, select provider
     provider_choices = [
         "OpenAI (GPT models)",
@@ -52,18 +132,53 @@ def select_ai_model():
         "Google (Gemini models)"
     ]
     
-    provider = questionary.select(
-        "Select AI provider:",
-        choices=provider_choices
-    ).ask()
+    if preset.get("provider"):
+        provider = next(choice for choice in provider_choices if choice.split()[0].lower() == preset["provider"])
+    else:
+        provider = questionary.select(
+            "Select AI provider:",
+            choices=provider_choices
+        ).ask()
     
     # Extract provider name
     provider_key = provider.split()[0].lower()
     
-    # Get model information
+    # The table and guidance only help someone reading a terminal, so skip them when output is redirected
+    if console.is_terminal:
+        # Display model information
+        console.print(model_table(provider, provider_key))
+        
+        # Add price guidance
+        console.print("[yellow]Price Guidance:[/yellow]")
+        console.print("• Budget: Lower cost, suitable for many interviews")
+        console.print("• Standard: Mid-range pricing with good capabilities")
+        console.print("• Premium: Higher cost with best quality/capabilities")
+        
+        # Add context window explanation
+        console.print("\n[yellow]Context Window:[/yellow] Maximum tokens the model can process (input + output)")
+        console.print("[yellow]Output Tokens:[/yellow] Maximum response length the model can generate")
+    
+    # Select specific model
+    model = questionary.select(
+        "Select specific model:",
+        choices=get_available_models()[provider_key]
+    ).ask()
+    
+    return {"provider": provider_key, "model": model}
+
+@lru_cache(maxsize=8)
+def model_table(provider, provider_key):
+    """Build the table of a provider's models with context information; built once per provider.
+    
+    Args:
+        provider: Provider label shown in the table title
+        provider_key: Key of the provider in get_available_models()
+    
+    Returns:
+        Rich Table listing the provider's models
+    """
     model_info = get_all_model_info()
     
-    # Display model information
     table = Table(title=f"{provider} Models")
     table.add_column("Model Name")
     table.add_column("Description")
@@ -71,14 +186,11 @@ def select_ai_model():
     table.add_column("Output Tokens")
     table.add_column("Cost Tier")
     
-    # Get only models for the selected provider
-    provider_models = get_available_models()[provider_key]
-    
-    # Add rows for each model with context information
-    for model_name in provider_models:
+    # Add rows for each of the provider's models with context information
+    for model_name in get_available_models()[provider_key]:
         info = model_info.get(model_name, {})
         context_size = format_token_count(info.get('context_window', 'Unknown'))
-        output_tokens = format_token_count(info.get('token_limit', 'Unknown'))
+        output_tokens = format_token_count(info.get('max_output_tokens', 'Unknown'))
         cost_tier = info.get('cost_tier', 'Unknown').capitalize()
         
         table.add_row(
@@ -89,26 +201,7 @@ def select_ai_model():
             cost_tier
         )
     
-    console.print(table)
-    
-    # Add price guidance
-    console.print("[yellow]Price Guidance:[/yellow]")
-    console.print("• Budget: Lower cost, suitable for many interviews")
-    console.print("• Standard: Mid-range pricing with good capabilities")
-    console.print("• Premium: Higher cost with best quality/capabilities")
-    
-    # Add context window explanation
-    console.print("\n[yellow]Context Window:[/yellow] Maximum tokens the model can process (input + output)")
-    console.print("[yellow]Output Tokens:[/yellow] Maximum response length the model can generate")
-    
-    # Select specific model
-    model_choices = get_available_models()[provider_key]
-    model = questionary.select(
-        "Select specific model:",
-        choices=model_choices
-    ).ask()
-    
-    return {"provider": provider_key, "model": model}
+    return table
 
 def format_token_count(count):
     """Format token count for display."""
@@ -118,6 +211,30 @@ def format_token_count(count):
         return str(count)
     return str(count)
 
+# Markdown heading ("## Title") that starts a new slide in the presentation bullets
+_SECTION_HEADING_RE = re.compile(r'^#+[ \t]+(.*?)[ \t]*$', re.MULTILINE)
+
+# "- point" or "* point" line, capturing the point without the marker or surrounding whitespace
+_BULLET_RE = re.compile(r'^[ \t]*[-*][ \t]*(\S.*?)[ \t\r]*$', re.MULTILINE)
+
+def iter_markdown_sections(markdown_text):
+    """Yield (title, body) for each heading in markdown_text, scanning the text once."""
+    previous = None
+    for match in _SECTION_HEADING_RE.finditer(markdown_text):
+        if previous:
+            yield previous.group(1), markdown_text[previous.end():match.start()]
+        previous = match
+    if previous:
+        yield previous.group(1), markdown_text[previous.end():]
+
+@lru_cache(maxsize=1)
+def _pptx_template():
+    """Serialized python-pptx default template, so each deck is opened from memory instead of disk."""
+    from pptx import Presentation
+    buffer = io.BytesIO()
+    Presentation().save(buffer)
+    return buffer.getvalue()
+
 def create_presentation(presentation_bullets, output_dir, title, timestamp, filename):
     """
     Create a PowerPoint presentation from bullet points.
@@ -129,6 +246,12 @@ def create_presentation(presentation_bullets, output_dir, title, timestamp, file
         timestamp: Timestamp to include in the presentation
         filename: Filename for the presentation file (without extension)
     """
+    # Date the deck with the report's timestamp so every file from one run agrees
+    try:
+        generated_date = datetime.datetime.strptime(timestamp, "%Y%m%d_%H%M%S").strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        generated_date = datetime.date.today().isoformat()
+    
     try:
         from pptx import Presentation
         from pptx.util import Inches, Pt
@@ -137,28 +260,25 @@ def create_presentation(presentation_bullets, output_dir, title, timestamp, file
         console.print(f"[cyan]Creating PowerPoint presentation: {title}...[/cyan]")
         
         # Create a new presentation
-        prs = Presentation()
+        prs = Presentation(io.BytesIO(_pptx_template()))
+        
+        # Look up the layouts once rather than per slide
+        layouts = prs.slide_layouts
+        title_slide_layout = layouts[0]
+        bullet_slide_layout = layouts[1]  # Title and content layout
+        thank_slide_layout = layouts[5]  # Title only layout
         
         # Add a title slide
-        title_slide_layout = prs.slide_layouts[0]
         slide = prs.slides.add_slide(title_slide_layout)
         title_shape = slide.shapes.title
         subtitle = slide.placeholders[1]
         
         title_shape.text = title
-        subtitle.text = f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d')}"
-        
-        # Parse the bullet points into sections
-        import re
-        
-        # Extract sections using regex
-        sections = re.split(r'#+\s+', presentation_bullets)
-        section_titles = re.findall(r'#+\s+(.*?)\n', "# " + presentation_bullets)
+        subtitle.text = f"Generated: {generated_date}"
         
         # Create slides for each section
-        for i, (section_content, section_title) in enumerate(zip(sections[1:], section_titles)):
+        for section_title, section_content in iter_markdown_sections(presentation_bullets):
             # Add a section slide
-            bullet_slide_layout = prs.slide_layouts[1]  # Title and content layout
             slide = prs.slides.add_slide(bullet_slide_layout)
             
             # Set the title
@@ -168,12 +288,8 @@ def create_presentation(presentation_bullets, output_dir, title, timestamp, file
             # Add the bullet points
             content = slide.placeholders[1]
             
-            # Clean up the bullet points - remove empty lines and ensure proper formatting
-            bullet_lines = []
-            for line in section_content.strip().split('\n'):
-                clean_line = line.strip()
-                if clean_line and (clean_line.startswith('-') or clean_line.startswith('*')):
-                    bullet_lines.append(clean_line[1:].strip())  # Remove the bullet character
+            # Clean up the bullet points - keep only "-"/"*" lines, without the bullet character
+            bullet_lines = _BULLET_RE.findall(section_content)
             
             # Add to the content placeholder which automatically formats as bullets
             text_frame = content.text_frame
@@ -188,7 +304,6 @@ def create_presentation(presentation_bullets, output_dir, title, timestamp, file
                 p.level = 0  # Top-level bullet
         
         # Add a thank you slide at the end
-        thank_slide_layout = prs.slide_layouts[5]  # Title only layout
         slide = prs.slides.add_slide(thank_slide_layout)
         slide_title = slide.shapes.title
         slide_title.text = "Thank You"
@@ -208,7 +323,7 @@ def create_presentation(presentation_bullets, output_dir, title, timestamp, file
         ppt_md_path = os.path.join(output_dir, f'{filename}.md')
         with open(ppt_md_path, 'w', encoding='utf-8') as f:
             f.write(f"# {title}\n\n")
-            f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d')}\n\n")
+            f.write(f"Generated: {generated_date}\n\n")
             f.write(presentation_bullets)
             f.write("\n\n# Thank You")
         
@@ -216,107 +331,204 @@ def create_presentation(presentation_bullets, output_dir, title, timestamp, file
         
         return ppt_md_path
 
-def generate_executive_summary(ai_model, analyses, category=None):
-    """
-    Generate an executive summary from multiple interview analyses.
+# Rough token budget for the key points sent to the executive summary prompt,
+# used when the model's context window is unknown
+KEY_POINTS_TOKEN_BUDGET = 1500
+
+# Output tokens reserved for the executive summary
+SUMMARY_MAX_TOKENS = 4000
+
+# Sentences whose word sets overlap at least this much (Jaccard) count as near-duplicates
+KEY_POINT_SIMILARITY = 0.8
+
+# Sentence ends and line breaks, where key points are split before deduplication
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=\D[.!?])\s+|\s*\n\s*')
+
+# Words compared between sentences; digits are left out so list numbering doesn't count
+_WORD_RE = re.compile(r'[^\W\d_]+')
+
+def condense_key_points(key_points, token_budget=KEY_POINTS_TOKEN_BUDGET):
+    """Drop near-duplicate sentences across interviews' key points and trim the rest to a token budget.
     
     Args:
-        ai_model: The AI model to use for generation
-        analyses: List of analysis objects to summarize
-        category: Optional category name for category-specific summaries
+        key_points: Key point texts, one per analysis
+        token_budget: Approximate number of tokens to keep
     
     Returns:
-        dict containing the executive_summary and presentation_bullets
+        The distinct sentences, in their original order, one per line
     """
-    if not analyses:
-        return {
-            "executive_summary": "No analyses available to generate an executive summary.",
-            "presentation_bullets": "No analyses available to generate presentation points."
-        }
+    char_budget = token_budget * CHARS_PER_TOKEN
+    kept = []
+    kept_words = []
+    used = 0
+    for text in key_points:
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
+            words = set(_WORD_RE.findall(sentence.lower()))
+            if not words:
+                continue
+            if any(len(words & seen) >= KEY_POINT_SIMILARITY * len(words | seen) for seen in kept_words):
+                continue
+            if used + len(sentence) > char_budget:
+                return "\n".join(kept)
+            kept.append(sentence)
+            kept_words.append(words)
+            used += len(sentence) + 1
+    return "\n".join(kept)
+
+def key_points_token_budget(ai_model, fixed_prompt):
+    """Tokens left for key points in the model's context window.
     
-    # Extract key points and insights by research question
-    key_points = []
-    rq_insights = {
-        "rq1": [],
-        "rq2": [],
-        "rq3": [],
-        "rq4": []
-    }
+    Args:
+        ai_model: The AI model the prompt is for
+        fixed_prompt: Every part of the request other than the key points
     
-    for analysis in analyses:
-        if analysis.key_points:
-            key_points.append(analysis.key_points)
-        
-        if analysis.rq1_insights:
-            rq_insights["rq1"].append(analysis.rq1_insights)
-        if analysis.rq2_insights:
-            rq_insights["rq2"].append(analysis.rq2_insights)
-        if analysis.rq3_insights:
-            rq_insights["rq3"].append(analysis.rq3_insights)
-        if analysis.rq4_insights:
-            rq_insights["rq4"].append(analysis.rq4_insights)
+    Returns:
+        The context window minus the fixed prompt and the reserved output, or
+        KEY_POINTS_TOKEN_BUDGET when the model's context window is unknown
+    """
+    context_window = get_model_info(ai_model.model).get('context_window')
+    if not context_window:
+        return KEY_POINTS_TOKEN_BUDGET
+    return max(context_window - estimate_tokens(fixed_prompt, SUMMARY_MAX_TOKENS), 0)
+
+# Returned in place of a summary when there are no analyses to summarize
+NO_ANALYSES_SUMMARY = {
+    "executive_summary": "No analyses available to generate an executive summary.",
+    "presentation_bullets": "No analyses available to generate presentation points."
+}
+
+def _summary_category_text(category):
+    """Describe whose interviews a summary covers, for the summary prompts."""
+    return f"for {category.replace('_', ' ')} stakeholders" if category else "across all stakeholder perspectives"
+
+def executive_summary_prompt(ai_model, analyses, category=None):
+    """
+    Build the prompt asking for an executive summary of the analyses' key points.
+    
+    Args:
+        ai_model: The AI model the prompt is for, which sets the key point budget
+        analyses: List of analysis objects to summarize
+        category: Optional category name for category-specific summaries
     
-    # Build the executive summary prompt
-    category_text = f"for {category.replace('_', ' ')} stakeholders" if category else "across all stakeholder perspectives"
+    Returns:
+        The prompt, to send with EXECUTIVE_SUMMARY_SYSTEM_PROMPT as the system block
+    """
+    # Order by ID so the same analyses always produce the same prompts (and cached responses)
+    key_points = [
+        analysis.key_points
+        for analysis in sorted(analyses, key=lambda analysis: analysis.id)
+        if analysis.key_points
+    ]
     
-    exec_summary_prompt = f"""
-Generate an executive summary for a research report on "The Role of Business Consulting Firms in the Era of Artificial Intelligence" 
-based on the following key points extracted from {len(analyses)} interviews {category_text}.
+    # The static instructions go in the system blocks and only the per-report details
+    # follow them, so providers can reuse the cached prefix
+    exec_summary_header = f"""
+Generate an executive summary based on the following key points extracted from {len(analyses)} interviews {_summary_category_text(category)}.
 
 KEY POINTS FROM INTERVIEWS:
-{"".join(key_points[:5])}  # Use first 5 to avoid token limits
-
-Your executive summary should:
-1. Synthesize the main findings {category_text}
-2. Highlight the most significant trends and insights
-3. Discuss implications for the consulting industry
-4. Be approximately 500 words in length
 """
     
-    # Generate the executive summary
-    executive_summary = ai_model.generate_text(exec_summary_prompt)
-    
-    # Generate presentation-ready bullet points
-    presentation_prompt = f"""
-Based on the executive summary below and research insights from {len(analyses)} interviews about AI in consulting {category_text},
-create concise, presentation-ready bullet points organized by key sections.
+    # Interviews repeat each other's points, so send each point once, filling whatever
+    # room the model's context window leaves after the instructions and the summary itself
+    token_budget = key_points_token_budget(ai_model, EXECUTIVE_SUMMARY_SYSTEM_PROMPT + exec_summary_header)
+    return f"{exec_summary_header}{condense_key_points(key_points, token_budget)}\n"
 
-EXECUTIVE SUMMARY:
-{executive_summary}
-
-For each of the following categories, create 3-5 crisp, insightful bullet points suitable for a presentation slide:
-
-1. Overall Key Findings
-2. AI Adoption Status (RQ1)
-3. Market Trends (RQ2)
-4. Automation & Knowledge Effects (RQ3)
-5. Ethical Considerations (RQ4)
-"""
+def presentation_bullets_prompt(analyses, executive_summary, category=None):
+    """
+    Build the prompt turning an executive summary into presentation bullet points.
+    
+    Args:
+        analyses: List of analysis objects the summary was written from
+        executive_summary: The generated executive summary
+        category: Optional category name for category-specific summaries
     
+    Returns:
+        The prompt, to send with PRESENTATION_BULLETS_SYSTEM_PROMPT as the system block
+    """
     # Add category-specific sections as appropriate
     if category:
-        presentation_prompt += f"6. Key Implications for {category.replace('_', ' ').title()}\n"
+        closing_section = f"Key Implications for {category.replace('_', ' ').title()}"
     else:
-        presentation_prompt += "6. Recommendations for Consulting Firms\n"
+        closing_section = "Recommendations for Consulting Firms"
     
-    presentation_prompt += """
-Each bullet should be:
-- Specific and evidence-based
-- 1-2 lines maximum
-- Clear and impactful for a business audience
-- Free of jargon and unnecessary qualifiers
-- Formatted for direct placement in presentation slides
+    return f"""
+Create the presentation bullet points from the executive summary below, based on research insights from {len(analyses)} interviews about AI in consulting {_summary_category_text(category)}.
+Name the sixth section "{closing_section}".
 
-Format with clear headers and bullet points using * or - symbols.
+EXECUTIVE SUMMARY:
+{executive_summary}
 """
+
+def generate_executive_summary(ai_model, analyses, category=None):
+    """
+    Generate an executive summary from multiple interview analyses.
     
-    presentation_bullets = ai_model.generate_text(presentation_prompt)
+    Args:
+        ai_model: The AI model to use for generation
+        analyses: List of analysis objects to summarize
+        category: Optional category name for category-specific summaries
+    
+    Returns:
+        dict containing the executive_summary and presentation_bullets
+    """
+    if not analyses:
+        return dict(NO_ANALYSES_SUMMARY)
+    
+    executive_summary = ai_model.generate_text(
+        executive_summary_prompt(ai_model, analyses, category),
+        max_tokens=SUMMARY_MAX_TOKENS, system=[EXECUTIVE_SUMMARY_SYSTEM_PROMPT]
+    )
+    presentation_bullets = ai_model.generate_text(
+        presentation_bullets_prompt(analyses, executive_summary, category),
+        system=[PRESENTATION_BULLETS_SYSTEM_PROMPT]
+    )
     
     return {
         "executive_summary": executive_summary,
         "presentation_bullets": presentation_bullets
     }
 
+async def agenerate_executive_summary(ai_model, analyses, category=None):
+    """Async version of generate_executive_summary, for summarizing several categories concurrently."""
+    if not analyses:
+        return dict(NO_ANALYSES_SUMMARY)
+    
+    executive_summary = await ai_model.generate_text_async(
+        executive_summary_prompt(ai_model, analyses, category),
+        max_tokens=SUMMARY_MAX_TOKENS, system=[EXECUTIVE_SUMMARY_SYSTEM_PROMPT]
+    )
+    presentation_bullets = await ai_model.generate_text_async(
+        presentation_bullets_prompt(analyses, executive_summary, category),
+        system=[PRESENTATION_BULLETS_SYSTEM_PROMPT]
+    )
+    
+    return {
+        "executive_summary": executive_summary,
+        "presentation_bullets": presentation_bullets
+    }
+
+async def generate_category_summaries(ai_model, analyses_by_category):
+    """
+    Generate the executive summaries of several categories concurrently.
+    
+    Args:
+        ai_model: The AI model to use for generation
+        analyses_by_category: Dictionary mapping each category to its analysis objects
+    
+    Returns:
+        Dictionary mapping each category to its generate_executive_summary result
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    
+    async def summarize(category, analyses):
+        async with semaphore:
+            return await agenerate_executive_summary(ai_model, analyses, category)
+    
+    summaries = await asyncio.gather(*(
+        summarize(category, analyses) for category, analyses in analyses_by_category.items()
+    ))
+    return dict(zip(analyses_by_category, summaries))
+
 @cli.command()
 def preload_personas():
     """Preload a local cache of FinePersonas for faster searching."""
@@ -333,6 +545,7 @@ def preload_personas():
     ).ask().startswith("Sample")
     
     # Initialize the persona manager
+    from utils.persona_manager import FinePersonaManager
     persona_manager = FinePersonaManager(use_sample=use_sample)
     
     # Ask if we should enable semantic search for higher quality matches
@@ -421,8 +634,8 @@ def parse_scripts():
         # Check if file already exists
         if os.path.exists(json_path):
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(json_path, 'rb') as f:
+                    data = json.loads(f.read())
                 console.print("[green]Loaded existing questions file.[/green]")
             except Exception as e:
                 console.print(f"[yellow]Error loading existing file: {str(e)}. Starting fresh.[/yellow]")
@@ -435,8 +648,7 @@ def parse_scripts():
         
         # Edit each selected category
         for category_key in categories_to_edit:
-            full_name = next((cat for cat in NORMALIZED_CATEGORIES.keys() 
-                           if NORMALIZED_CATEGORIES[cat] == category_key), category_key)
+            full_name = INVERSE_NORMALIZED_CATEGORIES.get(category_key, category_key)
             
             console.print(f"\n[bold]Editing questions for {full_name}[/bold]")
             
@@ -482,8 +694,7 @@ def parse_scripts():
                     data[category_key]["questions"][section] = new_questions
         
         # Save the updated data
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        write_json(json_path, data)
         
         console.print("[green]Questions saved successfully to data/scripts/interview_questions.json[/green]")
     
@@ -497,21 +708,26 @@ def parse_scripts():
         console.print(f"Using scripts from {json_path}...")
         
         try:
-            # Verify JSON file exists and is valid
-            with open(json_path, 'r', encoding='utf-8') as f:
-                scripts_data = json.load(f)
-            
-            # Display categories found in JSON
-            table = Table(title="Available Interview Scripts")
-            table.add_column("Category")
-            table.add_column("Questions")
-            
-            for category_key, data in scripts_data.items():
-                category_name = data.get("name", category_key)
-                question_count = sum(len(qs) for qs in data.get("questions", {}).values()) if "questions" in data else 0
-                table.add_row(category_name, str(question_count))
-            
-            console.print(table)
+            # Count the questions per category; parsing the whole file also verifies it is valid
+            question_counts = []
+            with open(json_path, 'rb') as f:
+                categories = ijson.kvitems(f, '') if ijson is not None else json.loads(f.read()).items()
+                for category_key, data in categories:
+                    category_name = data.get("name", category_key)
+                    question_count = sum(len(qs) for qs in data.get("questions", {}).values())
+                    question_counts.append((category_name, question_count))
+            
+            # Display categories found in JSON, as a table only when writing to a terminal
+            if console.is_terminal:
+                table = Table(title="Available Interview Scripts")
+                table.add_column("Category")
+                table.add_column("Questions")
+                for category_name, question_count in question_counts:
+                    table.add_row(category_name, str(question_count))
+                console.print(table)
+            else:
+                for category_name, question_count in question_counts:
+                    console.print(f"{category_name}: {question_count} questions")
             console.print("[green]Scripts are ready to use.[/green]")
             
         except Exception as e:
@@ -527,7 +743,8 @@ def generate_personas():
     ).ask()
     
     if use_finepersonas:
-        # Initialize FinePersona manager
+        # Initialize FinePersona manager; imported here because it pulls in numpy
+        from utils.persona_manager import FinePersonaManager
         persona_manager = FinePersonaManager(use_sample=True)  # Use the smaller sample by default
         
         # Load the dataset
@@ -553,7 +770,7 @@ def generate_personas():
         if use_search:
             # Ask whether to use the full dataset (better results but slower)
             use_full_dataset = questionary.confirm(
-                "Use the full FinePersonas dataset instead of the sample? (Better results but slower and requires 143GB)",
+                "Use the full FinePersonas dataset instead of the sample? (Better results but slower; streamed rather than downloaded)",
                 default=False
             ).ask()
             
@@ -579,10 +796,8 @@ def generate_personas():
         
         console.print(f"Selected {len(interviewer_personas)} interviewer personas from FinePersonas")
         
-        # Save interviewers to database
-        for persona_data in interviewer_personas:
-            formatted_persona = persona_manager.format_persona_for_interview(persona_data, 'interviewer')
-            db_manager.create_persona(formatted_persona)
+        # Collect every persona and save them in one transaction at the end
+        all_personas = persona_manager.format_personas_for_interview(interviewer_personas, 'interviewer')
         
         # Ask which categories to generate interviewees for
         categories = []
@@ -610,6 +825,9 @@ def generate_personas():
         ).ask()
         num_per_category = int(num_per_category)
         
+        # Build the persona index once so every category below only samples from it
+        persona_manager.prepare_index()
+        
         # Generate interviewee personas for each category
         for category in categories:
             console.print(f"\nGenerating personas for {category}...")
@@ -629,11 +847,10 @@ def generate_personas():
                 category_personas = persona_manager.get_personas_by_category(category, num_per_category)
             console.print(f"Selected {len(category_personas)} personas from FinePersonas")
             
-            # Save personas to database
-            for persona_data in category_personas:
-                formatted_persona = persona_manager.format_persona_for_interview(persona_data, 'interviewee')
-                formatted_persona['category'] = category  # Ensure correct category
-                db_manager.create_persona(formatted_persona)
+            all_personas.extend(persona_manager.format_personas_for_interview(category_personas, 'interviewee', category))
+        
+        # Save personas to database
+        db_manager.bulk_create_personas(all_personas)
         
         console.print("[green]All personas generated successfully from FinePersonas![/green]")
         
@@ -643,7 +860,7 @@ def generate_personas():
         model_info = select_ai_model()
         
         try:
-            ai_model = AIModelInterface(model_info["provider"], model_info["model"])
+            ai_model = get_model(model_info["provider"], model_info["model"])
             
             # Ask how many interviewer personas to generate
             num_interviewers = questionary.text(
@@ -652,28 +869,41 @@ def generate_personas():
             ).ask()
             num_interviewers = int(num_interviewers)
             
+            async def generate_all(prompt, count, progress, task):
+                """Send prompt count times concurrently, advancing the progress task as each response arrives."""
+                semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+                
+                async def generate():
+                    async with semaphore:
+                        # Every call repeats the same prompt, so each needs its own (uncached) completion
+                        response = await ai_model.generate_text_async(prompt, cache=False)
+                    progress.update(task, advance=1)
+                    return response
+                
+                return await asyncio.gather(*(generate() for _ in range(count)))
+            
             # Generate interviewer personas
             console.print(f"Generating {num_interviewers} interviewer personas...")
             
             with Progress() as progress:
                 task = progress.add_task("[green]Generating interviewer personas...", total=num_interviewers)
-                
-                for i in range(num_interviewers):
-                    response = ai_model.generate_text(INTERVIEWER_PERSONA_PROMPT)
-                    
-                    # Parse the response to extract persona details
-                    # This is a simplified version - you might want to add more structured parsing
-                    persona_data = {
-                        "name": f"Interviewer {i+1}",  # Placeholder - extract from response
-                        "category": "interviewer",
-                        "role": "interviewer",
-                        "background": response,
-                        "created_by": f"{model_info['provider']}/{model_info['model']}"
-                    }
-                    
-                    # Save to database
-                    db_manager.create_persona(persona_data)
-                    progress.update(task, advance=1)
+                responses = ai_model.run_async(generate_all(INTERVIEWER_PERSONA_PROMPT, num_interviewers, progress, task))
+            
+            # Parse the responses to extract persona details
+            # This is a simplified version - you might want to add more structured parsing
+            interviewer_personas = [
+                {
+                    "name": f"Interviewer {i+1}",  # Placeholder - extract from response
+                    "category": "interviewer",
+                    "role": "interviewer",
+                    "background": response,
+                    "created_by": f"{model_info['provider']}/{model_info['model']}"
+                }
+                for i, response in enumerate(responses)
+            ]
+            
+            # Collect every persona and save them in one transaction at the end
+            all_personas = list(interviewer_personas)
             
             # Ask which categories to generate interviewees for
             categories = []
@@ -699,32 +929,212 @@ def generate_personas():
                 
                 with Progress() as progress:
                     task = progress.add_task(f"[green]Generating {category} personas...", total=num_per_category)
-                    
-                    for i in range(num_per_category):
-                        prompt = INTERVIEWEE_PERSONA_PROMPT.format(category=category)
-                        response = ai_model.generate_text(prompt)
-                        
-                        # Parse the response to extract persona details
-                        # This is a simplified version - you might want to add more structured parsing
-                        persona_data = {
-                            "name": f"{category} {i+1}",  # Placeholder - extract from response
-                            "category": get_category_key(category),
-                            "role": "interviewee",
-                            "background": response,
-                            "created_by": f"{model_info['provider']}/{model_info['model']}"
-                        }
-                        
-                        # Save to database
-                        db_manager.create_persona(persona_data)
-                        progress.update(task, advance=1)
+                    prompt = INTERVIEWEE_PERSONA_PROMPT.format(category=category)
+                    responses = ai_model.run_async(generate_all(prompt, num_per_category, progress, task))
+                
+                # Parse the responses to extract persona details
+                # This is a simplified version - you might want to add more structured parsing
+                all_personas.extend(
+                    {
+                        "name": f"{category} {i+1}",  # Placeholder - extract from response
+                        "category": get_category_key(category),
+                        "role": "interviewee",
+                        "background": response,
+                        "created_by": f"{model_info['provider']}/{model_info['model']}"
+                    }
+                    for i, response in enumerate(responses)
+                )
+            
+            # Save to database
+            db_manager.bulk_create_personas(all_personas)
             
             console.print("[green]All personas generated successfully![/green]")
             
         except Exception as e:
             console.print(f"[red]Error generating personas: {str(e)}[/red]")
 
+# Parsed interview scripts, written by the parse_scripts command
+SCRIPTS_JSON_PATH = "data/scripts/interview_questions.json"
+
+@lru_cache(maxsize=None)
+def _load_scripts_data(json_path, mtime):
+    """Parse the scripts JSON file; mtime is part of the cache key so edits are picked up."""
+    # json.loads decodes the UTF-8 bytes itself in one pass, skipping the text-mode file wrapper
+    with open(json_path, 'rb') as f:
+        return json.loads(f.read())
+
+def load_scripts_data(json_path=SCRIPTS_JSON_PATH):
+    """Return the parsed scripts JSON, reading the file again only when it has changed.
+    
+    The returned dictionary is shared between callers and must not be modified.
+    """
+    return _load_scripts_data(json_path, os.path.getmtime(json_path))
+
+@lru_cache(maxsize=None)
+def _load_script(category_key, json_path, mtime):
+    """Build the formatted interview script for one category of the scripts JSON."""
+    category_data = _load_scripts_data(json_path, mtime).get(category_key)
+    if category_data is None:
+        return None
+    
+    # Format the script from the JSON structure
+    script_text = ""
+    if "questions" in category_data:
+        for section, questions in category_data["questions"].items():
+            script_text += f"{section} Questions:\n"
+            for question in questions:
+                script_text += f"- {question}\n"
+            script_text += "\n"
+    else:
+        script_text = category_data.get("script", "")
+    
+    return format_script_for_interview(script_text)
+
+def load_script(category_key, json_path=SCRIPTS_JSON_PATH):
+    """Get the formatted interview script for a category, cached until the scripts file changes.
+    
+    Args:
+        category_key: Normalized category key, e.g. 'senior_executives'
+        json_path: Path of the parsed scripts JSON file
+        
+    Returns:
+        The formatted script, or None if the category is not in the file
+    """
+    return _load_script(category_key, json_path, os.path.getmtime(json_path))
+
+def persona_choices(personas):
+    """Build "name - short description" menu entries for a list of personas; each entry's value is the persona ID."""
+    return [questionary.Choice(title=f"{p.name} - {p.short_description}", value=p.id) for p in personas]
+
+def bind_prompt(template, **fixed):
+    """Fill the fields of a prompt template that stay the same across a loop.
+    
+    Args:
+        template: Prompt template using str.format fields
+        **fixed: Values for the fields that don't change between calls
+        
+    Returns:
+        Function taking the remaining fields as keyword arguments and returning the full prompt;
+        it only concatenates strings, so the template is not parsed again on each call
+    """
+    variable = {name for _, name, _, _ in string.Formatter().parse(template) if name and name not in fixed}
+    # Mark each remaining field with NUL separators, then split so literals and field names alternate
+    parts = template.format(**fixed, **{name: f"\0{name}\0" for name in variable}).split("\0")
+    literals, names = parts[0::2], parts[1::2]
+    
+    def build(**values):
+        segments = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            segments.append(values[name])
+            segments.append(literal)
+        return "".join(segments)
+    
+    return build
+
+def chunked(items, size):
+    """Yield successive lists of up to size items."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+def parse_marshaled_interviews(response_text):
+    """Map stakeholder id to interview text from a MULTI_INTERVIEW_PROMPT response (empty if unparseable)."""
+    match = re.search(r"\[.*\]", response_text or "", re.DOTALL)
+    if not match:
+        return {}
+    try:
+        records = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return {}
+    return {
+        str(record.get("id")): record["interview"]
+        for record in records
+        if isinstance(record, dict) and record.get("interview")
+    }
+
+def parse_xml_interview(response_text, interview_id, interviewer_details, interviewee_details):
+    """Turn an XML_INTERVIEW_GENERATION_PROMPT response into the raw transcript and the full XML document.
+    
+    Args:
+        response_text: Model response containing a <dialogue> element
+        interview_id: ID for the <conversation> element
+        interviewer_details: Interviewer persona text for the <personas> element
+        interviewee_details: Interviewee persona text for the <personas> element
+        
+    Returns:
+        Tuple of (raw_interview, xml_formatted), in the same shape XML_FORMATTING_PROMPT produces
+        
+    Raises:
+        ValueError: If the response has no well-formed dialogue with at least one line
+    """
+    match = re.search(r"<dialogue>.*</dialogue>", response_text or "", re.DOTALL)
+    if not match:
+        raise ValueError("No <dialogue> element in response")
+    try:
+        dialogue = ET.fromstring(match.group(0))
+    except ET.ParseError as e:
+        raise ValueError(f"Malformed dialogue XML: {str(e)}")
+    lines = [line for line in dialogue if line.tag in ('interviewer_line', 'respondent_line')]
+    if not lines:
+        raise ValueError("Dialogue has no lines")
+    
+    raw_interview = "\n\n".join(
+        f"{'Interviewer' if line.tag == 'interviewer_line' else 'Respondent'}: {''.join(line.itertext()).strip()}"
+        for line in lines
+    )
+    
+    # Add the personas locally instead of having the model repeat them
+    conversation_set = ET.Element('conversation_set')
+    conversation = ET.SubElement(conversation_set, 'conversation', id=interview_id)
+    personas = ET.SubElement(conversation, 'personas')
+    ET.SubElement(personas, 'interviewer').text = interviewer_details
+    ET.SubElement(personas, 'respondent').text = interviewee_details
+    conversation.append(dialogue)
+    ET.indent(conversation_set)
+    return raw_interview, ET.tostring(conversation_set, encoding='unicode')
+
+# Analysis column for each heading of STRUCTURED_ANALYSIS_SECTIONS, in section order
+STRUCTURED_ANALYSIS_HEADINGS = (
+    ("key_points", "KEY POINTS"),
+    ("notable_quotes", "NOTABLE QUOTES"),
+    ("ai_attitudes", "AI ATTITUDES"),
+    ("rq1_insights", "RQ1 INSIGHTS"),
+    ("rq2_insights", "RQ2 INSIGHTS"),
+    ("rq3_insights", "RQ3 INSIGHTS"),
+    ("rq4_insights", "RQ4 INSIGHTS"),
+    ("contradictions", "CONTRADICTIONS"),
+    ("authenticity_assessment", r"AUTHENTICITY(?: ASSESSMENT)?"),
+)
+
+# Any numbered section heading at the start of a line (allowing markdown bold or #), named after its column
+_ANALYSIS_HEADING_RE = re.compile(
+    r'^[ \t#*]*\d+\.?[ \t]*(?:' + "|".join(f"(?P<{column}>{heading})" for column, heading in STRUCTURED_ANALYSIS_HEADINGS)
+    + r')\b[ \t*]*:?[ \t*]*',
+    re.IGNORECASE | re.MULTILINE
+)
+
+def parse_structured_analysis(analysis_text):
+    """Split a structured analysis into its Analysis columns in a single pass over the text.
+    
+    Args:
+        analysis_text: Model response using the numbered STRUCTURED_ANALYSIS_SECTIONS headings
+        
+    Returns:
+        Dictionary with every Analysis text column; sections missing from the response are empty
+    """
+    analysis_text = analysis_text or ""
+    sections = {column: "" for column, _ in STRUCTURED_ANALYSIS_HEADINGS}
+    headings = list(_ANALYSIS_HEADING_RE.finditer(analysis_text))
+    # Each section runs from the end of its heading to the start of the next one
+    for heading, end in zip(headings, [h.start() for h in headings[1:]] + [len(analysis_text)]):
+        if not sections[heading.lastgroup]:
+            sections[heading.lastgroup] = analysis_text[heading.end():end].strip()
+    return sections
+
 @cli.command()
-def generate_interviews():
+@click.option('--marshal-batch', type=click.IntRange(min=1), default=1,
+              help="In batch mode, generate this many interviews per request")
+def generate_interviews(marshal_batch):
     """Generate interviews between selected personas across all stakeholder categories."""
     # Track which categories have been interviewed
     interviewed_categories = set()
@@ -776,7 +1186,7 @@ def generate_interviews():
             model_info = select_ai_model()
         
         try:
-            ai_model = AIModelInterface(model_info["provider"], model_info["model"])
+            ai_model = get_model(model_info["provider"], model_info["model"])
             
             # Get stakeholder categories to interview in this session
             if len(remaining_categories) > 1:
@@ -800,362 +1210,389 @@ def generate_interviews():
                 category_key = get_category_key(category_name)
             
                 # Load script for this category from the JSON file
-                json_path = "data/scripts/interview_questions.json"
-                if not os.path.exists(json_path):
+                if not os.path.exists(SCRIPTS_JSON_PATH):
                     console.print(f"[yellow]Script file not found. Run 'parse_scripts' command first.[/yellow]")
                     continue
                 
                 try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        scripts_data = json.load(f)
-                    
-                    if category_key not in scripts_data:
-                        console.print(f"[yellow]Category {category_name} not found in scripts file.[/yellow]")
-                        continue
-                        
-                    # Format the script from the JSON structure
-                    script_text = ""
-                    if "questions" in scripts_data[category_key]:
-                        for section, questions in scripts_data[category_key]["questions"].items():
-                            script_text += f"{section} Questions:\n"
-                            for question in questions:
-                                script_text += f"- {question}\n"
-                            script_text += "\n"
-                    else:
-                        script_text = scripts_data[category_key].get("script", "")
-                
-                    script = format_script_for_interview(script_text)
+                    script = load_script(category_key)
                 except Exception as e:
                     console.print(f"[red]Error loading script: {str(e)}[/red]")
                     continue
                 
+                if script is None:
+                    console.print(f"[yellow]Category {category_name} not found in scripts file.[/yellow]")
+                    continue
+                
                 # Get interviewer personas
                 interviewers = db_manager.get_personas_by_category("interviewer", "interviewer")
                 if not interviewers:
                     console.print("[yellow]No interviewer personas found. Run 'generate_personas' first.[/yellow]")
                     continue
         
-        # Create more descriptive choices to better represent personas
-        interviewer_choices = []
-        for p in interviewers:
-            # Extract a short description from the background (first sentence or part of it)
-            short_desc = ""
-            if p.background:
-                first_sentence = p.background.split('.')[0]
-                short_desc = (first_sentence[:100] + '...') if len(first_sentence) > 100 else first_sentence
-            interviewer_choices.append(f"{p.name} - {short_desc}")
-        
-        # Check if we should search FinePersonas for more matching personas
-        use_finepersonas_search = questionary.confirm(
-            "Do you want to search for additional interviewer personas in FinePersonas?",
-            default=False
-        ).ask()
+                # Create more descriptive choices to better represent personas
+                interviewer_choices = persona_choices(interviewers)
         
-        if use_finepersonas_search:
-            # Generate suggested queries for interviewers based on the selected category
-            suggested_queries = [
-                "researcher AI consulting",
-                "professor business technology",
-                "academic specializing in artificial intelligence",
-                "industry analyst mckinsey bcg",
-                "technology journalist consulting",
-                "consultant gartner forrester analyst",
-                "senior advisor deloitte accenture"
-            ]
-            
-            # Add category-specific suggestions
-            if category_key == 'senior_executives':
-                suggested_queries.append("researcher executive leadership mckinsey bcg")
-            elif category_key == 'ai_specialists':
-                suggested_queries.append("researcher artificial intelligence accenture palantir")
-            elif category_key == 'regulatory_stakeholders':
-                suggested_queries.append("professor policy regulation kpmg deloitte")
+                # Check if we should search FinePersonas for more matching personas
+                use_finepersonas_search = questionary.confirm(
+                    "Do you want to search for additional interviewer personas in FinePersonas?",
+                    default=False
+                ).ask()
+        
+                if use_finepersonas_search:
+                    # Generate suggested queries for interviewers based on the selected category
+                    suggested_queries = [
+                        "researcher AI consulting",
+                        "professor business technology",
+                        "academic specializing in artificial intelligence",
+                        "industry analyst mckinsey bcg",
+                        "technology journalist consulting",
+                        "consultant gartner forrester analyst",
+                        "senior advisor deloitte accenture"
+                    ]
+            
+                    # Add category-specific suggestions
+                    if category_key == 'senior_executives':
+                        suggested_queries.append("researcher executive leadership mckinsey bcg")
+                    elif category_key == 'ai_specialists':
+                        suggested_queries.append("researcher artificial intelligence accenture palantir")
+                    elif category_key == 'regulatory_stakeholders':
+                        suggested_queries.append("professor policy regulation kpmg deloitte")
             
-            # Allow user to select from suggested queries or create their own
-            query_choices = suggested_queries + ["Enter my own search terms"]
+                    # Allow user to select from suggested queries or create their own
+                    query_choices = suggested_queries + ["Enter my own search terms"]
             
-            query_selection = questionary.select(
-                "Select a suggested search query or create your own:",
-                choices=query_choices
-            ).ask()
+                    query_selection = questionary.select(
+                        "Select a suggested search query or create your own:",
+                        choices=query_choices
+                    ).ask()
             
-            # Get the final search query
-            if query_selection == "Enter my own search terms":
-                search_query = questionary.text(
-                    "Enter search terms for interviewer:"
-                ).ask()
-            else:
-                search_query = query_selection
-                console.print(f"Using selected query: '{search_query}'")
+                    # Get the final search query
+                    if query_selection == "Enter my own search terms":
+                        search_query = questionary.text(
+                            "Enter search terms for interviewer:"
+                        ).ask()
+                    else:
+                        search_query = query_selection
+                        console.print(f"Using selected query: '{search_query}'")
             
-            console.print("Searching FinePersonas for matching interviewer profiles...")
+                    console.print("Searching FinePersonas for matching interviewer profiles...")
             
-            # Initialize FinePersona manager if not already done
-            if not 'persona_manager' in locals():
-                persona_manager = FinePersonaManager()
-                console.print("[cyan]Loading FinePersonas cached personas...[/cyan]")
-                persona_manager.load_dataset()
+                    # Initialize FinePersona manager if not already done
+                    if not 'persona_manager' in locals():
+                        from utils.persona_manager import FinePersonaManager
+                        persona_manager = FinePersonaManager()
+                        console.print("[cyan]Loading FinePersonas cached personas...[/cyan]")
+                        persona_manager.load_dataset()
                 
-                # If no cache exists, ask if user wants to create one
-                if not any(persona_manager.category_personas.values()):
-                    create_cache = questionary.confirm(
-                        "No cached personas found. Would you like to preload personas now? (Recommended for faster searches)",
-                        default=True
-                    ).ask()
+                        # If no cache exists, ask if user wants to create one
+                        if not any(persona_manager.category_personas.values()):
+                            create_cache = questionary.confirm(
+                                "No cached personas found. Would you like to preload personas now? (Recommended for faster searches)",
+                                default=True
+                            ).ask()
                     
-                    if create_cache:
-                        console.print("[cyan]Running preload command...[/cyan]")
-                        # Call the preload command
-                        preload_personas()
-            
-            # Get matching personas
-            search_results = persona_manager.get_personas_by_category('industry_analysts', 5, search_query)
-            
-            if search_results:
-                # Format the personas and add to database
-                for persona_data in search_results:
-                    formatted_persona = persona_manager.format_persona_for_interview(persona_data, 'interviewer')
-                    db_manager.create_persona(formatted_persona)
+                            if create_cache:
+                                console.print("[cyan]Running preload command...[/cyan]")
+                                # Call the preload command
+                                preload_personas()
+            
+                    # Get matching personas
+                    search_results = persona_manager.get_personas_by_category('industry_analysts', 5, search_query)
+            
+                    if search_results:
+                        # Format the personas and add to database
+                        db_manager.bulk_create_personas(
+                            persona_manager.format_personas_for_interview(search_results, 'interviewer')
+                        )
                 
-                # Refresh interviewer list
-                interviewers = db_manager.get_personas_by_category("interviewer", "interviewer")
-                interviewer_choices = []
-                for p in interviewers:
-                    short_desc = ""
-                    if p.background:
-                        first_sentence = p.background.split('.')[0]
-                        short_desc = (first_sentence[:100] + '...') if len(first_sentence) > 100 else first_sentence
-                    interviewer_choices.append(f"{p.name} - {short_desc}")
+                        # Refresh interviewer list
+                        interviewers = db_manager.get_personas_by_category("interviewer", "interviewer")
+                        interviewer_choices = persona_choices(interviewers)
                 
-                console.print(f"[green]Added {len(search_results)} new interviewer profiles.[/green]")
+                        console.print(f"[green]Added {len(search_results)} new interviewer profiles.[/green]")
         
-        selected_interviewer_display = questionary.select(
-            "Select interviewer persona:",
-            choices=interviewer_choices
-        ).ask()
+                selected_interviewer_id = questionary.select(
+                    "Select interviewer persona:",
+                    choices=interviewer_choices
+                ).ask()
+                selected_interviewer = {p.id: p for p in interviewers}[selected_interviewer_id]
         
-        # Extract just the name part
-        selected_interviewer_name = selected_interviewer_display.split(' - ')[0]
-        selected_interviewer = next(p for p in interviewers if p.name == selected_interviewer_name)
-        
-        # Get interviewee personas for this category
-        interviewees = db_manager.get_personas_by_category(category_key, "interviewee")
-        if not interviewees:
-            console.print(f"[yellow]No personas found for category {category_name}. Run 'generate_personas' first and select this category.[/yellow]")
-            continue
-        
-        # Create more descriptive choices for interviewees too
-        interviewee_choices = []
-        for p in interviewees:
-            # Extract a short description from the background (first sentence or part of it)
-            short_desc = ""
-            if p.background:
-                first_sentence = p.background.split('.')[0]
-                short_desc = (first_sentence[:100] + '...') if len(first_sentence) > 100 else first_sentence
-            interviewee_choices.append(f"{p.name} - {short_desc}")
-        
-        # Check if we should search FinePersonas for more matching interviewee personas
-        use_finepersonas_search = questionary.confirm(
-            f"Do you want to search for additional {category_name} personas in FinePersonas?",
-            default=False
-        ).ask()
+                # Get interviewee personas for this category
+                interviewees = db_manager.get_personas_by_category(category_key, "interviewee")
+                if not interviewees:
+                    console.print(f"[yellow]No personas found for category {category_name}. Run 'generate_personas' first and select this category.[/yellow]")
+                    continue
+        
+                # Create more descriptive choices for interviewees too
+                interviewee_choices = persona_choices(interviewees)
         
-        if use_finepersonas_search:
-            # Generate suggested query based on the category
-            suggested_query = ""
+                # Check if we should search FinePersonas for more matching interviewee personas
+                use_finepersonas_search = questionary.confirm(
+                    f"Do you want to search for additional {category_name} personas in FinePersonas?",
+                    default=False
+                ).ask()
+        
+                if use_finepersonas_search:
+                    # Generate suggested query based on the category
+                    suggested_query = ""
             
-            # Load the JSON file to get category-specific details
-            try:
-                with open("data/scripts/interview_questions.json", 'r', encoding='utf-8') as f:
-                    scripts_data = json.load(f)
+                    # Load the JSON file to get category-specific details
+                    try:
+                        scripts_data = load_scripts_data()
                 
-                if category_key in scripts_data and "questions" in scripts_data[category_key]:
-                    # Extract key terms from questions for this category
-                    all_questions = []
-                    for section, questions in scripts_data[category_key]["questions"].items():
-                        all_questions.extend(questions)
+                        if category_key in scripts_data and "questions" in scripts_data[category_key]:
+                            # Extract key terms from questions for this category
+                            all_questions = []
+                            for section, questions in scripts_data[category_key]["questions"].items():
+                                all_questions.extend(questions)
                     
-                    # Find common terms in questions that could be relevant for search
-                    import re
-                    from collections import Counter
+                            # Find common terms in questions that could be relevant for search
+                            from collections import Counter
                     
-                    # Extract key terms (nouns and adjectives likely to be profile indicators)
-                    words = re.findall(r'\b([A-Z][a-z]{2,}|[a-z]{3,})\b', ' '.join(all_questions))
-                    word_count = Counter(words)
+                            # Extract key terms (nouns and adjectives likely to be profile indicators)
+                            words = re.findall(r'\b([A-Z][a-z]{2,}|[a-z]{3,})\b', ' '.join(all_questions))
+                            word_count = Counter(words)
                     
-                    # Filter out common words that aren't useful for profile search
-                    common_words = {'have', 'what', 'how', 'your', 'with', 'consulting', 'about', 'that', 'this',
-                                   'industry', 'technologies', 'specific', 'most', 'think', 'would', 'firm'}
+                            # Filter out common words that aren't useful for profile search
+                            common_words = {'have', 'what', 'how', 'your', 'with', 'consulting', 'about', 'that', 'this',
+                                           'industry', 'technologies', 'specific', 'most', 'think', 'would', 'firm'}
                     
-                    # Build a suggested query from the most frequent relevant terms
-                    key_terms = [word for word, count in word_count.most_common(10) 
-                                if count > 1 and word.lower() not in common_words][:3]
+                            # Build a suggested query from the most frequent relevant terms
+                            key_terms = [word for word, count in word_count.most_common(10) 
+                                        if count > 1 and word.lower() not in common_words][:3]
                     
-                    # Create suggestion based on category with consulting firm integration
-                    if category_key == 'senior_executives':
-                        # For senior executives, add top consulting firms
-                        suggested_query = f"executive consulting mckinsey bcg bain {' '.join(key_terms)}"
-                    elif category_key == 'ai_specialists':
-                        # For AI specialists, add tech-focused firms
-                        suggested_query = f"AI specialist consulting accenture palantir {' '.join(key_terms)}"
-                    elif category_key == 'mid_level_consultants':
-                        # For mid-level, include a mix of firms
-                        suggested_query = f"consultant deloitte mckinsey accenture {' '.join(key_terms)}"
-                    elif category_key == 'clients':
-                        suggested_query = f"business client {' '.join(key_terms)}"
-                    elif category_key == 'technology_providers':
-                        suggested_query = f"technology provider accenture ibm {' '.join(key_terms)}"
-                    elif category_key == 'regulatory_stakeholders':
-                        suggested_query = f"regulation deloitte ey kpmg {' '.join(key_terms)}"
-                    elif category_key == 'industry_analysts':
-                        suggested_query = f"analyst gartner forrester {' '.join(key_terms)}"
-            except Exception as e:
-                console.print(f"[yellow]Error generating suggested query: {str(e)}[/yellow]")
-                suggested_query = f"{category_name.lower().replace('_', ' ')}"
-            
-            # Offer the suggested query to the user
-            use_suggested = False
-            if suggested_query:
-                use_suggested = questionary.confirm(
-                    f"Use suggested search query: '{suggested_query}'?",
-                    default=True
-                ).ask()
-            
-            # Get the final search query
-            if use_suggested and suggested_query:
-                search_query = suggested_query
-                console.print(f"Using suggested query: '{search_query}'")
-            else:
-                search_query = questionary.text(
-                    f"Enter search terms for {category_name} personas:",
-                    default=suggested_query
-                ).ask()
-            
-            console.print(f"Searching FinePersonas for matching {category_name} profiles...")
-            
-            # Initialize FinePersona manager if not already done
-            if not 'persona_manager' in locals():
-                persona_manager = FinePersonaManager()
-                console.print("[cyan]Loading FinePersonas cached personas...[/cyan]")
-                persona_manager.load_dataset()
+                            # Create suggestion based on category with consulting firm integration
+                            if category_key == 'senior_executives':
+                                # For senior executives, add top consulting firms
+                                suggested_query = f"executive consulting mckinsey bcg bain {' '.join(key_terms)}"
+                            elif category_key == 'ai_specialists':
+                                # For AI specialists, add tech-focused firms
+                                suggested_query = f"AI specialist consulting accenture palantir {' '.join(key_terms)}"
+                            elif category_key == 'mid_level_consultants':
+                                # For mid-level, include a mix of firms
+                                suggested_query = f"consultant deloitte mckinsey accenture {' '.join(key_terms)}"
+                            elif category_key == 'clients':
+                                suggested_query = f"business client {' '.join(key_terms)}"
+                            elif category_key == 'technology_providers':
+                                suggested_query = f"technology provider accenture ibm {' '.join(key_terms)}"
+                            elif category_key == 'regulatory_stakeholders':
+                                suggested_query = f"regulation deloitte ey kpmg {' '.join(key_terms)}"
+                            elif category_key == 'industry_analysts':
+                                suggested_query = f"analyst gartner forrester {' '.join(key_terms)}"
+                    except Exception as e:
+                        console.print(f"[yellow]Error generating suggested query: {str(e)}[/yellow]")
+                        suggested_query = f"{category_name.lower().replace('_', ' ')}"
+            
+                    # Offer the suggested query to the user
+                    use_suggested = False
+                    if suggested_query:
+                        use_suggested = questionary.confirm(
+                            f"Use suggested search query: '{suggested_query}'?",
+                            default=True
+                        ).ask()
+            
+                    # Get the final search query
+                    if use_suggested and suggested_query:
+                        search_query = suggested_query
+                        console.print(f"Using suggested query: '{search_query}'")
+                    else:
+                        search_query = questionary.text(
+                            f"Enter search terms for {category_name} personas:",
+                            default=suggested_query
+                        ).ask()
+            
+                    console.print(f"Searching FinePersonas for matching {category_name} profiles...")
+            
+                    # Initialize FinePersona manager if not already done
+                    if not 'persona_manager' in locals():
+                        from utils.persona_manager import FinePersonaManager
+                        persona_manager = FinePersonaManager()
+                        console.print("[cyan]Loading FinePersonas cached personas...[/cyan]")
+                        persona_manager.load_dataset()
                 
-                # If no cache exists, ask if user wants to create one
-                if not any(persona_manager.category_personas.values()):
-                    create_cache = questionary.confirm(
-                        "No cached personas found. Would you like to preload personas now? (Recommended for faster searches)",
-                        default=True
-                    ).ask()
+                        # If no cache exists, ask if user wants to create one
+                        if not any(persona_manager.category_personas.values()):
+                            create_cache = questionary.confirm(
+                                "No cached personas found. Would you like to preload personas now? (Recommended for faster searches)",
+                                default=True
+                            ).ask()
                     
-                    if create_cache:
-                        console.print("[cyan]Running preload command...[/cyan]")
-                        # Call the preload command
-                        preload_personas()
-            
-            # Get matching personas
-            search_results = persona_manager.get_personas_by_category(category_key, 5, search_query)
-            
-            if search_results:
-                # Format the personas and add to database
-                for persona_data in search_results:
-                    formatted_persona = persona_manager.format_persona_for_interview(persona_data, 'interviewee')
-                    formatted_persona['category'] = category_key  # Ensure correct category
-                    db_manager.create_persona(formatted_persona)
+                            if create_cache:
+                                console.print("[cyan]Running preload command...[/cyan]")
+                                # Call the preload command
+                                preload_personas()
+            
+                    # Get matching personas
+                    search_results = persona_manager.get_personas_by_category(category_key, 5, search_query)
+            
+                    if search_results:
+                        # Format the personas and add to database
+                        db_manager.bulk_create_personas(
+                            persona_manager.format_personas_for_interview(search_results, 'interviewee', category_key)
+                        )
                 
-                # Refresh interviewee list
-                interviewees = db_manager.get_personas_by_category(category_key, "interviewee")
-                interviewee_choices = []
-                for p in interviewees:
-                    short_desc = ""
-                    if p.background:
-                        first_sentence = p.background.split('.')[0]
-                        short_desc = (first_sentence[:100] + '...') if len(first_sentence) > 100 else first_sentence
-                    interviewee_choices.append(f"{p.name} - {short_desc}")
+                        # Refresh interviewee list
+                        interviewees = db_manager.get_personas_by_category(category_key, "interviewee")
+                        interviewee_choices = persona_choices(interviewees)
                 
-                console.print(f"[green]Added {len(search_results)} new {category_name} profiles.[/green]")
-            else:
-                console.print(f"[yellow]No matching profiles found. Try a different search query.[/yellow]")
-        
-        selected_interviewee_displays = questionary.checkbox(
-            f"Select interviewee personas (up to 10) for {category_name}:",
-            choices=interviewee_choices
-        ).ask()
+                        console.print(f"[green]Added {len(search_results)} new {category_name} profiles.[/green]")
+                    else:
+                        console.print(f"[yellow]No matching profiles found. Try a different search query.[/yellow]")
         
-        selected_interviewee_names = [display.split(' - ')[0] for display in selected_interviewee_displays]
+                selected_interviewee_ids = questionary.checkbox(
+                    f"Select interviewee personas (up to 10) for {category_name}:",
+                    choices=interviewee_choices
+                ).ask()
+                
+                # Resolve the selected IDs with one dict instead of scanning the list per selection
+                interviewees_by_id = {p.id: p for p in interviewees}
+                selected_interviewees = [interviewees_by_id[persona_id] for persona_id in selected_interviewee_ids]
         
-        # Generate interviews
-        console.print(f"\nGenerating interviews for {len(selected_interviewee_names)} personas in {category_name} category...")
+                # Generate interviews
+                console.print(f"\nGenerating interviews for {len(selected_interviewees)} personas in {category_name} category...")
         
-        # Ask if user wants to use batch processing
-        use_batch = questionary.confirm(
-            "Do you want to use batch processing for faster generation (experimental)?",
-            default=False
-        ).ask()
+                # Ask if user wants to use batch processing
+                use_batch = questionary.confirm(
+                    "Do you want to use batch processing for faster generation (experimental)?",
+                    default=False
+                ).ask()
         
-        if use_batch:
-            # Initialize batch processor
-            batch_processor = BatchProcessor(model_info["provider"], model_info["model"])
-            
-            # Prepare prompts for all interviews
-            interview_prompts = []
-            for interviewee_name in selected_interviewee_names:
-                interviewee = next(p for p in interviewees if p.name == interviewee_name)
-                
-                prompt = INTERVIEW_GENERATION_PROMPT.format(
+                # The interviewer and script are the same for every interviewee, so fill them in once
+                interview_prompt = bind_prompt(
+                    XML_INTERVIEW_GENERATION_PROMPT,
                     interviewer_details=selected_interviewer.background,
-                    interviewee_details=interviewee.background,
                     script=script
                 )
-                interview_prompts.append((interviewee, prompt))
+                xml_formatting_prompt = bind_prompt(
+                    XML_FORMATTING_PROMPT,
+                    interviewer_details=selected_interviewer.background
+                )
+                # Interviews that don't come back as XML get their formatting and analysis from one call
+                format_and_analyze_prompt = bind_prompt(
+                    FORMAT_AND_ANALYZE_PROMPT,
+                    interviewer_details=selected_interviewer.background,
+                    analysis_instructions=(
+                        "An analysis of the conversation formatted with these clear sections:\n\n" + STRUCTURED_ANALYSIS_SECTIONS
+                        if use_batch else ANALYSIS_FIELD_INSTRUCTIONS
+                    )
+                )
+        
+                if use_batch:
+                    # Initialize batch processor
+                    batch_processor = BatchProcessor(model_info["provider"], model_info["model"], model_interface=ai_model)
+            
+                    # Prepare prompts for all interviews
+                    interview_prompts = [
+                        (interviewee, interview_prompt(interviewee_details=interviewee.background))
+                        for interviewee in selected_interviewees
+                    ]
             
-            # Process interviews in batch
-            console.print(f"Generating {len(interview_prompts)} interviews in batch...")
-            prompts_only = [p[1] for p in interview_prompts]
+                    # Process interviews in batch; each round must produce new interviews, so the
+                    # generation requests skip the response cache (identical prompts would replay it)
+                    console.print(f"Generating {len(interview_prompts)} interviews in batch...")
+                    prompts_only = [p[1] for p in interview_prompts]
             
-            # Determine model's token limit from MODEL_INFO
-            model_info_data = get_all_model_info().get(model_info["model"], {})
-            token_limit = model_info_data.get('token_limit', 2048)  # Default to conservative 2048 if unknown
+                    # Determine every token limit for this batch from a single MODEL_INFO lookup
+                    model_info_data = get_all_model_info().get(model_info["model"], {})
+                    token_limit = model_info_data.get('token_limit', 2048)  # Default to conservative 2048 if unknown
+                    
+                    # Use 90% of the model's token limit for generation to be safe
+                    safe_token_limit = int(token_limit * 0.9)
                     
-            # Use 90% of the model's token limit for generation to be safe
-            safe_token_limit = int(token_limit * 0.9)
-            console.print(f"Using {safe_token_limit} tokens for generation (model max: {token_limit})")
+                    # The follow-up calls use a smaller token limit than the interview itself
+                    # This helps with models that have smaller context windows
+                    xml_token_limit = min(model_info_data.get('token_limit', 4096), 4000)
+                    analysis_token_limit = xml_token_limit
+                    console.print(f"Using {safe_token_limit} tokens for generation (model max: {token_limit})")
                     
-            results = batch_processor.process_batch_sync(prompts_only, max_tokens=safe_token_limit)
+                    if marshal_batch > 1:
+                        # Pack several interviewees into each request; the interviewer and script are sent once per group
+                        groups = list(chunked(interview_prompts, marshal_batch))
+                        group_prompts = [
+                            MULTI_INTERVIEW_PROMPT.format(
+                                count=len(group),
+                                interviewer_details=selected_interviewer.background,
+                                script=script,
+                                interviewees="\n".join(
+                                    f"STAKEHOLDER {interviewee.id}:\n{interviewee.background}\n" for interviewee, _ in group
+                                )
+                            )
+                            for group in groups
+                        ]
+                        console.print(f"Packing up to {marshal_batch} interviews per request ({len(group_prompts)} requests)...")
+                        # Several interviews share one response, but it still can't exceed the model's output limit
+                        group_results = ai_model.run_async(batch_processor.process_batch(
+                            group_prompts, max_tokens=clamp_max_tokens(model_info["model"], safe_token_limit * marshal_batch),
+                            return_exceptions=True, cache=False
+                        ))
+                        
+                        interviews_by_id = {}
+                        for response_text in group_results:
+                            if isinstance(response_text, Exception):
+                                # Treated like an unparseable response: its interviewees are generated individually below
+                                console.print(f"[yellow]Packed request failed: {str(response_text)}[/yellow]")
+                                continue
+                            interviews_by_id.update(parse_marshaled_interviews(response_text))
+                        
+                        # Generate any interview the packed responses left out on its own
+                        missing = [i for i, (interviewee, _) in enumerate(interview_prompts) if str(interviewee.id) not in interviews_by_id]
+                        if missing:
+                            console.print(f"[yellow]{len(missing)} interviews missing from packed responses; generating them individually...[/yellow]")
+                            missing_results = ai_model.run_async(batch_processor.process_batch([prompts_only[i] for i in missing], max_tokens=safe_token_limit, cache=False))
+                            for i, interview_text in zip(missing, missing_results):
+                                interviews_by_id[str(interview_prompts[i][0].id)] = interview_text
+                        
+                        results = [interviews_by_id[str(interviewee.id)] for interviewee, _ in interview_prompts]
+                    else:
+                        results = ai_model.run_async(batch_processor.process_batch(prompts_only, max_tokens=safe_token_limit, cache=False))
             
-            # Process results
-            for i, (interviewee, _) in enumerate(interview_prompts):
-                interview_text = results[i]
-                
-                # Format as XML
-                xml_prompt = XML_FORMATTING_PROMPT.format(
-                    interview_id=f"{category_key}_{interviewee.id}",
-                    interviewer_details=selected_interviewer.background,
-                    interviewee_details=interviewee.background,
-                    interview_text=interview_text
-                )
-                
-                console.print(f"Formatting interview with {interviewee.name} as XML...")
-                
-                # Use a smaller token limit for XML formatting than for the main interview
-                # This helps with models that have smaller context windows
-                model_info_data = get_all_model_info().get(model_info["model"], {})
-                xml_token_limit = min(model_info_data.get('token_limit', 4096), 4000)
-                console.print(f"Using {xml_token_limit} tokens for XML formatting")
-                
-                xml_formatted = ai_model.generate_text(xml_prompt, max_tokens=xml_token_limit)
-                
-                # Save interview to database
-                interview_id = db_manager.create_interview(
-                    interviewer_id=selected_interviewer.id,
-                    interviewee_id=interviewee.id,
-                    category=category_key,
-                    model_used=f"{model_info['provider']}/{model_info['model']}",
-                    raw_interview=interview_text,
-                    xml_formatted=xml_formatted
-                )
-                
-                # Generate structured analysis with improved components
-                # Create a more detailed analysis prompt that requests specific sections
-                structured_analysis_prompt = f"""
+                    console.print(f"Using {xml_token_limit} tokens for XML formatting and {analysis_token_limit} tokens for analysis generation")
+
+                    # XML formatting and analysis each only need the finished interview text, so run them
+                    # for every interview concurrently, with at most MAX_CONCURRENCY requests in flight
+                    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+                    
+                    async def generate(prompt, max_tokens):
+                        async with semaphore:
+                            return await ai_model.generate_text_async(prompt, max_tokens=max_tokens)
+                    
+                    async def format_and_analyze(interviewee, interview_text):
+                        """Return the interview text with its XML version and structured analysis."""
+                        # Interviews normally come back as XML already; only reformat the ones that don't parse
+                        try:
+                            interview_text, xml_formatted = parse_xml_interview(
+                                interview_text, f"{category_key}_{interviewee.id}",
+                                selected_interviewer.background, interviewee.background
+                            )
+                            xml_call = None
+                        except ValueError:
+                            console.print(f"Formatting and analyzing interview with {interviewee.name}...")
+                            try:
+                                async with semaphore:
+                                    fused = await ai_model.generate_structured_async(
+                                        format_and_analyze_prompt(
+                                            interview_id=f"{category_key}_{interviewee.id}",
+                                            interviewee_details=interviewee.background,
+                                            interview_text=interview_text
+                                        ),
+                                        FORMAT_AND_ANALYZE_SCHEMA, name="formatted_interview",
+                                        max_tokens=clamp_max_tokens(model_info["model"], xml_token_limit + analysis_token_limit)
+                                    )
+                                return interview_text, fused["xml_formatted"], fused["analysis"]
+                            except Exception as e:
+                                console.print(f"[yellow]Single-call formatting failed for {interviewee.name} ({str(e)}); using separate calls...[/yellow]")
+                            xml_prompt = xml_formatting_prompt(
+                                interview_id=f"{category_key}_{interviewee.id}",
+                                interviewee_details=interviewee.background,
+                                interview_text=interview_text
+                            )
+                            console.print(f"Formatting interview with {interviewee.name} as XML...")
+                            xml_call = generate(xml_prompt, xml_token_limit)
+
+                        # Generate structured analysis with improved components
+                        # Create a more detailed analysis prompt that requests specific sections
+                        structured_analysis_prompt = f"""
 Analyze the following interview between {selected_interviewer.name} and {interviewee.name} about AI in consulting.
 Provide a structured analysis with the following sections:
 
@@ -1164,151 +1601,197 @@ def generate_interviews():
 
 Please format your analysis with these clear sections:
 
-1. KEY POINTS: Summarize the 3-5 most important points from the interview.
-
-2. NOTABLE QUOTES: Extract 2-3 direct quotes that best represent the interviewee's perspective.
-
-3. AI ATTITUDES: Analyze the interviewee's attitude toward AI in consulting (positive, negative, neutral, nuanced).
+{STRUCTURED_ANALYSIS_SECTIONS}"""
 
-4. RQ1 INSIGHTS: What insights does this interview provide about the state of AI adoption in consulting?
+                        console.print(f"Generating structured analysis for {interviewee.name}...")
+                        analysis_call = generate(structured_analysis_prompt, analysis_token_limit)
+                        if xml_call is None:
+                            return interview_text, xml_formatted, await analysis_call
+                        xml_formatted, analysis_text = await asyncio.gather(xml_call, analysis_call)
+                        return interview_text, xml_formatted, analysis_text
+                    
+                    async def format_and_analyze_all():
+                        return await asyncio.gather(
+                            *(format_and_analyze(interviewee, interview_text)
+                              for (interviewee, _), interview_text in zip(interview_prompts, results)),
+                            return_exceptions=True
+                        )
+                    
+                    completed = ai_model.run_async(format_and_analyze_all())
 
-5. RQ2 INSIGHTS: What insights does this interview provide about current market trends in consulting?
+                    # Collect results in selection order, keeping the records to save in one transaction
+                    interviews_data = []
+                    analyses_data = []
+                    for (interviewee, _), result in zip(interview_prompts, completed):
+                        if isinstance(result, Exception):
+                            console.print(f"[red]Error processing interview with {interviewee.name}: {str(result)}[/red]")
+                            continue
+                        interview_text, xml_formatted, analysis_text = result
 
-6. RQ3 INSIGHTS: What insights does this interview provide about automation and knowledge management?
+                        interviews_data.append({
+                            "interviewer_id": selected_interviewer.id,
+                            "interviewee_id": interviewee.id,
+                            "category": category_key,
+                            "model_used": f"{model_info['provider']}/{model_info['model']}",
+                            "raw_interview": interview_text,
+                            "xml_formatted": xml_formatted
+                        })
 
-7. RQ4 INSIGHTS: What insights does this interview provide about ethical considerations and risks?
+                        # Extract each section
+                        analysis_data = parse_structured_analysis(analysis_text)
 
-8. CONTRADICTIONS: Note any contradictions or inconsistencies in the interviewee's statements.
+                        # Fallback if structured parsing fails
+                        if not any(analysis_data.values()):
+                            console.print(f"[yellow]Structured analysis parsing failed for {interviewee.name}, using raw analysis[/yellow]")
+                            analysis_data = {
+                                "key_points": analysis_text,
+                                "notable_quotes": "",
+                                "ai_attitudes": "",
+                                "rq1_insights": "",
+                                "rq2_insights": "",
+                                "rq3_insights": "",
+                                "rq4_insights": "",
+                                "contradictions": "",
+                                "authenticity_assessment": ""
+                            }
 
-9. AUTHENTICITY ASSESSMENT: Evaluate how authentic and realistic this interview feels.
-"""
-                
-                console.print(f"Generating structured analysis for {interviewee.name}...")
-                
-                # Use an appropriate token limit for analysis as well
-                model_info_data = get_all_model_info().get(model_info["model"], {})
-                analysis_token_limit = min(model_info_data.get('token_limit', 4096), 4000)
-                console.print(f"Using {analysis_token_limit} tokens for analysis generation")
-                
-                analysis_text = ai_model.generate_text(structured_analysis_prompt, max_tokens=analysis_token_limit)
-                
-                # Parse the structured analysis into components
-                import re
-                
-                # Create a parser to extract each section
-                def extract_section(text, section_name):
-                    pattern = rf"{section_name}:?(.*?)(?=\d+\.\s+\w+:|$)"
-                    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-                    if match:
-                        return match.group(1).strip()
-                    return ""
-                
-                # Extract each section
-                analysis_data = {
-                    "key_points": extract_section(analysis_text, r"1\.?\s*KEY POINTS"),
-                    "notable_quotes": extract_section(analysis_text, r"2\.?\s*NOTABLE QUOTES"),
-                    "ai_attitudes": extract_section(analysis_text, r"3\.?\s*AI ATTITUDES"),
-                    "rq1_insights": extract_section(analysis_text, r"4\.?\s*RQ1 INSIGHTS"),
-                    "rq2_insights": extract_section(analysis_text, r"5\.?\s*RQ2 INSIGHTS"),
-                    "rq3_insights": extract_section(analysis_text, r"6\.?\s*RQ3 INSIGHTS"),
-                    "rq4_insights": extract_section(analysis_text, r"7\.?\s*RQ4 INSIGHTS"),
-                    "contradictions": extract_section(analysis_text, r"8\.?\s*CONTRADICTIONS"),
-                    "authenticity_assessment": extract_section(analysis_text, r"9\.?\s*AUTHENTICITY")
-                }
-                
-                # Fallback if structured parsing fails
-                if not any(analysis_data.values()):
-                    console.print("[yellow]Structured analysis parsing failed, using raw analysis[/yellow]")
-                    analysis_data = {
-                        "key_points": analysis_text,
-                        "notable_quotes": "",
-                        "ai_attitudes": "",
-                        "rq1_insights": "",
-                        "rq2_insights": "",
-                        "rq3_insights": "",
-                        "rq4_insights": "",
-                        "contradictions": "",
-                        "authenticity_assessment": ""
-                    }
-                
-                db_manager.create_analysis(interview_id, analysis_data)
-                
-                # Increment counters
-                category_interviews_generated += 1
-                total_interviews_generated += 1
+                        analyses_data.append(analysis_data)
                 
-        else:
-            # Process interviews sequentially 
-            with Progress() as progress:
-                tasks = {}
-                for name in selected_interviewee_names:
-                    task_id = progress.add_task(f"[green]Generating interview with {name}...", total=3)
-                    tasks[name] = task_id
-                
-                for interviewee_name in selected_interviewee_names:
-                    interviewee = next(p for p in interviewees if p.name == interviewee_name)
-                    
-                    # 1. Generate interview
-                    prompt = INTERVIEW_GENERATION_PROMPT.format(
+                else:
+                    # Run the interviews concurrently; each one's XML formatting and analysis
+                    # only need the interview text, so those two calls run in parallel too
+                    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+                    fused_interview_prompt = bind_prompt(
+                        FUSED_INTERVIEW_PROMPT,
                         interviewer_details=selected_interviewer.background,
-                        interviewee_details=interviewee.background,
                         script=script
                     )
+                    fused_max_tokens = clamp_max_tokens(model_info["model"], FUSED_MAX_TOKENS)
                     
-                    console.print(f"\nGenerating interview between {selected_interviewer.name} and {interviewee.name}...")
-                    interview_text = ai_model.generate_text(prompt, max_tokens=3000)
-                    progress.update(tasks[interviewee_name], advance=1)
-                    
-                    # 2. Format as XML
-                    xml_prompt = XML_FORMATTING_PROMPT.format(
-                        interview_id=f"{category_key}_{interviewee.id}",
-                        interviewer_details=selected_interviewer.background,
-                        interviewee_details=interviewee.background,
-                        interview_text=interview_text
-                    )
-                    
-                    console.print(f"Formatting interview as XML...")
-                    xml_formatted = ai_model.generate_text(xml_prompt)
-                    progress.update(tasks[interviewee_name], advance=1)
-                    
-                    # 3. Save interview to database
-                    interview_id = db_manager.create_interview(
-                        interviewer_id=selected_interviewer.id,
-                        interviewee_id=interviewee.id,
-                        category=category_key,
-                        model_used=f"{model_info['provider']}/{model_info['model']}",
-                        raw_interview=interview_text,
-                        xml_formatted=xml_formatted
-                    )
-                    
-                    # 4. Generate analysis
-                    analysis_prompt = ANALYSIS_PROMPT.format(
-                        interview_text=interview_text
-                    )
-                    
-                    console.print(f"Generating analysis...")
-                    analysis_text = ai_model.generate_text(analysis_prompt)
-                    
-                    # Parse analysis into components (simplified)
-                    analysis_data = {
-                        "key_points": analysis_text,
-                        "notable_quotes": "",
-                        "ai_attitudes": "",
-                        "rq1_insights": "",
-                        "rq2_insights": "",
-                        "rq3_insights": "",
-                        "rq4_insights": "",
-                        "contradictions": "",
-                        "authenticity_assessment": ""
-                    }
+                    async def run_interview(interviewee, progress, task_id):
+                        """Generate one interview with its XML version and analysis, in one call when possible."""
+                        fused_prompt = fused_interview_prompt(interviewee_details=interviewee.background)
+                        try:
+                            async with semaphore:
+                                fused = await ai_model.generate_structured_async(
+                                    fused_prompt, FUSED_INTERVIEW_SCHEMA, name="interview", max_tokens=fused_max_tokens
+                                )
+                            # The conversation comes back once, as the <dialogue>; build the transcript and XML from it
+                            interview_text, xml_formatted = parse_xml_interview(
+                                fused["dialogue"], f"{category_key}_{interviewee.id}",
+                                selected_interviewer.background, interviewee.background
+                            )
+                            progress.update(task_id, advance=3)
+                            return interview_text, xml_formatted, fused["analysis"]
+                        except Exception as e:
+                            console.print(f"[yellow]Single-call generation failed for {interviewee.name} ({str(e)}); using separate calls...[/yellow]")
+                        
+                        prompt = interview_prompt(interviewee_details=interviewee.background)
+                        async with semaphore:
+                            interview_text = await ai_model.generate_text_async(prompt, max_tokens=3000, cache=False)
+                        progress.update(task_id, advance=1)
+                        
+                        async def generate(prompt):
+                            async with semaphore:
+                                text = await ai_model.generate_text_async(prompt)
+                            progress.update(task_id, advance=1)
+                            return text
+                        
+                        # The interview normally comes back as XML already, leaving only the analysis call
+                        try:
+                            interview_text, xml_formatted = parse_xml_interview(
+                                interview_text, f"{category_key}_{interviewee.id}",
+                                selected_interviewer.background, interviewee.background
+                            )
+                        except ValueError:
+                            xml_formatted = None
+                        if xml_formatted is not None:
+                            progress.update(task_id, advance=1)
+                            analysis_text = await generate(ANALYSIS_PROMPT.format(interview_text=interview_text))
+                            return interview_text, xml_formatted, analysis_text
+                        
+                        # Otherwise format and analyze it in one call, falling back to one call each
+                        try:
+                            async with semaphore:
+                                fused = await ai_model.generate_structured_async(
+                                    format_and_analyze_prompt(
+                                        interview_id=f"{category_key}_{interviewee.id}",
+                                        interviewee_details=interviewee.background,
+                                        interview_text=interview_text
+                                    ),
+                                    FORMAT_AND_ANALYZE_SCHEMA, name="formatted_interview", max_tokens=fused_max_tokens
+                                )
+                            progress.update(task_id, advance=2)
+                            return interview_text, fused["xml_formatted"], fused["analysis"]
+                        except Exception as e:
+                            console.print(f"[yellow]Single-call formatting failed for {interviewee.name} ({str(e)}); using separate calls...[/yellow]")
+                        
+                        xml_prompt = xml_formatting_prompt(
+                            interview_id=f"{category_key}_{interviewee.id}",
+                            interviewee_details=interviewee.background,
+                            interview_text=interview_text
+                        )
+                        analysis_prompt = ANALYSIS_PROMPT.format(
+                            interview_text=interview_text
+                        )
+                        
+                        xml_formatted, analysis_text = await asyncio.gather(generate(xml_prompt), generate(analysis_prompt))
+                        return interview_text, xml_formatted, analysis_text
                     
-                    db_manager.create_analysis(interview_id, analysis_data)
+                    async def run_all(progress):
+                        task_ids = [
+                            progress.add_task(f"[green]Generating interview with {interviewee.name}...", total=3)
+                            for interviewee in selected_interviewees
+                        ]
+                        results = await asyncio.gather(
+                            *(run_interview(interviewee, progress, task_id) for interviewee, task_id in zip(selected_interviewees, task_ids)),
+                            return_exceptions=True
+                        )
+                        return zip(selected_interviewees, results)
                     
-                    # Increment counters
-                    total_interviews_generated += 1
+                    console.print(f"\nGenerating {len(selected_interviewees)} interviews with {selected_interviewer.name}...")
+                    with Progress() as progress:
+                        completed = ai_model.run_async(run_all(progress))
                     
-                    # Update progress
-                    progress.update(tasks[interviewee_name], advance=1)
+                    # Save results in selection order once all calls have finished, in one transaction
+                    interviews_data = []
+                    analyses_data = []
+                    for interviewee, result in completed:
+                        if isinstance(result, Exception):
+                            console.print(f"[red]Error generating interview with {interviewee.name}: {str(result)}[/red]")
+                            continue
+                        interview_text, xml_formatted, analysis_text = result
+                        
+                        interviews_data.append({
+                            "interviewer_id": selected_interviewer.id,
+                            "interviewee_id": interviewee.id,
+                            "category": category_key,
+                            "model_used": f"{model_info['provider']}/{model_info['model']}",
+                            "raw_interview": interview_text,
+                            "xml_formatted": xml_formatted
+                        })
+                        
+                        # Parse analysis into components (simplified)
+                        analyses_data.append({
+                            "key_points": analysis_text,
+                            "notable_quotes": "",
+                            "ai_attitudes": "",
+                            "rq1_insights": "",
+                            "rq2_insights": "",
+                            "rq3_insights": "",
+                            "rq4_insights": "",
+                            "contradictions": "",
+                            "authenticity_assessment": ""
+                        })
+                
+                # Save interviews and analyses to database on the writer thread, waiting for the
+                # commit so a failed write is reported below instead of counted as generated
+                db_writer.submit("bulk_create_interviews_with_analyses", interviews_data, analyses_data)
+                db_writer.flush()
+                
+                # Increment counters
+                category_interviews_generated += len(interviews_data)
+                total_interviews_generated += len(interviews_data)
         
                 # Mark this category as interviewed in this round
                 interviewed_categories.add(category_key)
@@ -1325,17 +1808,17 @@ def extract_section(text, section_name):
                     if not continue_with_next:
                         break
         
-    except Exception as e:
-        console.print(f"[red]Error generating interviews: {str(e)}[/red]")
+        except Exception as e:
+            console.print(f"[red]Error generating interviews: {str(e)}[/red]")
         
-        # Ask if user wants to continue despite error
-        continue_after_error = questionary.confirm(
-            "Would you like to continue with the next categories despite the error?",
-            default=True
-        ).ask()
+            # Ask if user wants to continue despite error
+            continue_after_error = questionary.confirm(
+                "Would you like to continue with the next categories despite the error?",
+                default=True
+            ).ask()
         
-        if not continue_after_error:
-            break
+            if not continue_after_error:
+                break
     
     # Final summary
     console.print("\n[bold green]Interview Generation Complete[/bold green]")
@@ -1527,8 +2010,7 @@ def export_interviews(format, output_dir, include_analysis):
                                 "authenticity_assessment": interview.analysis.authenticity_assessment
                             }
                         
-                        with open(json_path, 'w', encoding='utf-8') as f:
-                            json.dump(interview_data, f, indent=2)
+                        write_json(json_path, interview_data)
                 
                 progress.update(task, advance=1)
         
@@ -1704,7 +2186,19 @@ def generate_report(output_format, output_dir, individual_reports, stakeholder_r
             
             # Prepare AI model for synthesis
             model_info = select_ai_model()
-            ai_model = AIModelInterface(model_info["provider"], model_info["model"])
+            ai_model = get_model(model_info["provider"], model_info["model"])
+            
+            # Extract all analysis objects for each category
+            analyses_by_category = {
+                category: [i.analysis for i in category_interviews if hasattr(i, 'analysis') and i.analysis]
+                for category, category_interviews in interviews_by_category.items()
+            }
+            
+            # The categories' executive summaries don't depend on each other, so request them all at once
+            console.print("[cyan]Generating executive summaries for all stakeholder groups...[/cyan]")
+            summaries_by_category = ai_model.run_async(generate_category_summaries(ai_model, {
+                category: analyses for category, analyses in analyses_by_category.items() if analyses
+            }))
             
             with Progress() as progress:
                 task = progress.add_task("[green]Processing stakeholder groups...", total=len(interviews_by_category))
@@ -1738,14 +2232,11 @@ def generate_report(output_format, output_dir, individual_reports, stakeholder_r
                     # Collect all AI attitudes
                     attitudes = [i.analysis.ai_attitudes for i in category_interviews if hasattr(i, 'analysis') and i.analysis and i.analysis.ai_attitudes]
                     
-                    # Extract all analysis objects for this category
-                    category_analyses = [i.analysis for i in category_interviews 
-                                        if hasattr(i, 'analysis') and i.analysis]
+                    category_analyses = analyses_by_category[category]
                     
-                    # Generate executive summary and presentation bullets for this category
+                    # Add the executive summary and presentation bullets generated for this category
                     if category_analyses:
-                        console.print(f"[cyan]Generating executive summary for {category} stakeholders...[/cyan]")
-                        summary_results = generate_executive_summary(ai_model, category_analyses, category)
+                        summary_results = summaries_by_category[category]
                         
                         # Add executive summary
                         report_content += "## Executive Summary\n\n"
@@ -1883,7 +2374,7 @@ def generate_report(output_format, output_dir, individual_reports, stakeholder_r
         
         # Prepare AI model for report generation
         model_info = select_ai_model()
-        ai_model = AIModelInterface(model_info["provider"], model_info["model"])
+        ai_model = get_model(model_info["provider"], model_info["model"])
         
         # Extract all analysis objects
         all_analyses = [i.analysis for i in interviews if hasattr(i, 'analysis') and i.analysis]
@@ -1892,6 +2383,8 @@ def generate_report(output_format, output_dir, individual_reports, stakeholder_r
         if all_analyses:
             # Generate the executive summary and presentation-ready bullets
             summary_results = generate_executive_summary(ai_model, all_analyses)
+            if ai_model.cached_input_tokens:
+                console.print(f"[cyan]{ai_model.cached_input_tokens} prompt tokens were served from the provider's prompt cache[/cyan]")
             
             # Add executive summary
             report_content += "## Executive Summary\n\n"
@@ -1,6 +1,12 @@
 import os
-import openai
-import anthropic
+import json
+import time
+import atexit
+import hashlib
+import sqlite3
+import inspect
+import threading
+import functools
 import asyncio
 from dotenv import load_dotenv
 
@@ -8,7 +14,7 @@
 load_dotenv()
 
 # Configure API keys
-openai.api_key = os.getenv("OPENAI_API_KEY")
+openai_api_key = os.getenv("OPENAI_API_KEY")
 anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 google_api_key = os.getenv("GOOGLE_API_KEY")
 
@@ -34,73 +40,234 @@
     ]
 }
 
-# Model information for display
+# Model information for display; context_window is the most tokens (prompt plus output) a request can use,
+# max_output_tokens the most a single response may contain
 MODEL_INFO = {
     # OpenAI models
     'gpt-4.5-preview-2025-02-27': {
         'description': 'Latest preview model with advanced capabilities',
-        'best_for': 'Advanced reasoning and complex interview simulation'
+        'best_for': 'Advanced reasoning and complex interview simulation',
+        'context_window': 128000,
+        'max_output_tokens': 16384
     },
     'gpt-4o-2024-08-06': {
         'description': 'Balanced GPT-4o model',
-        'best_for': 'High-quality interviews with balanced performance'
+        'best_for': 'High-quality interviews with balanced performance',
+        'context_window': 128000,
+        'max_output_tokens': 16384
     },
     'gpt-4o-mini-2024-07-18': {
         'description': 'Smaller GPT-4o variant',
-        'best_for': 'Faster generation with good quality'
+        'best_for': 'Faster generation with good quality',
+        'context_window': 128000,
+        'max_output_tokens': 16384
     },
     'o1-2024-12-17': {
         'description': 'Optimized for reasoning',
-        'best_for': 'Interviews requiring deep analytical thinking'
+        'best_for': 'Interviews requiring deep analytical thinking',
+        'context_window': 200000,
+        'max_output_tokens': 100000
     },
     'o3-mini-2025-01-31': {
         'description': 'Compact but powerful model',
-        'best_for': 'Efficient generation with good reasoning'
+        'best_for': 'Efficient generation with good reasoning',
+        'context_window': 200000,
+        'max_output_tokens': 100000
     },
     
     # Anthropic models
     'claude-3-7-sonnet-20250219': {
         'description': 'Latest Claude 3.7 Sonnet model',
-        'best_for': 'Premium quality interviews with nuanced responses'
+        'best_for': 'Premium quality interviews with nuanced responses',
+        'context_window': 200000,
+        'max_output_tokens': 64000
     },
     'claude-3-5-sonnet-20240620': {
         'description': 'Claude 3.5 Sonnet (June 2024)',
-        'best_for': 'Well-balanced interviews with good detail'
+        'best_for': 'Well-balanced interviews with good detail',
+        'context_window': 200000,
+        'max_output_tokens': 8192
     },
     'claude-3-5-sonnet-20241022': {
         'description': 'Claude 3.5 Sonnet (October 2024)',
-        'best_for': 'Updated Sonnet with improved capabilities'
+        'best_for': 'Updated Sonnet with improved capabilities',
+        'context_window': 200000,
+        'max_output_tokens': 8192
     },
     'claude-3-5-haiku-20241022': {
         'description': 'Claude 3.5 Haiku model',
-        'best_for': 'Fast generation while maintaining quality'
+        'best_for': 'Fast generation while maintaining quality',
+        'context_window': 200000,
+        'max_output_tokens': 8192
     },
     'claude-3-haiku-20240307': {
         'description': 'Claude 3 Haiku (cheapest option)',
-        'best_for': 'Cost-effective interview generation'
+        'best_for': 'Cost-effective interview generation',
+        'context_window': 200000,
+        'max_output_tokens': 4096
     },
     
     # Google models
     'gemini-2-0-flash': {
         'description': 'Google\'s Gemini 2.0 Flash model',
-        'best_for': 'High-quality responses with good speed'
+        'best_for': 'High-quality responses with good speed',
+        'context_window': 1048576,
+        'max_output_tokens': 8192
     },
     'gemini-2-0-flash-lite': {
         'description': 'Lighter version of Gemini 2.0 Flash',
-        'best_for': 'Efficient processing for simpler interviews'
+        'best_for': 'Efficient processing for simpler interviews',
+        'context_window': 1048576,
+        'max_output_tokens': 8192
     }
 }
 
+# Requests allowed in flight at once against a provider
+MAX_CONCURRENCY = 3
+
+# Connection pool shared by all calls to a provider; long completions can take minutes,
+# so only the connect timeout is short
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 20
+HTTP_TIMEOUT = 600.0
+HTTP_CONNECT_TIMEOUT = 10.0
+
+def _http_client(use_async=False):
+    """Create a pooled HTTP/2 client for the provider SDKs, or HTTP/1.1 if h2 isn't installed."""
+    import httpx
+    client_class = httpx.AsyncClient if use_async else httpx.Client
+    options = dict(
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+    )
+    try:
+        return client_class(http2=True, **options)
+    except ImportError:
+        # HTTP/2 needs the optional h2 package
+        return client_class(**options)
+
+@functools.lru_cache(maxsize=None)
+def _shared_http_client():
+    """Return the synchronous HTTP client shared by every model interface, closed at exit.
+    
+    Interfaces for different models of a provider reach the same host, so sharing one pool
+    lets them reuse each other's open connections instead of each doing its own handshakes.
+    """
+    client = _http_client()
+    atexit.register(client.close)
+    return client
+
+# SQLite file holding completions of earlier requests, so identical re-runs skip the API
+RESPONSE_CACHE_PATH = "data/llm_cache.db"
+
+# Seconds a cached completion is reused before the request is sent again (14 days)
+RESPONSE_CACHE_TTL = 14 * 24 * 60 * 60
+
+class ResponseCache:
+    """Exact-match store of model completions keyed by provider, model, prompt and token limit."""
+    
+    def __init__(self, path=RESPONSE_CACHE_PATH, ttl=RESPONSE_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.enabled = True
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    def _connection(self):
+        """Open the cache database on first use."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL)"
+            )
+            # Caches written before entries expired have no created_at; theirs count as expired
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(responses)")]
+            if 'created_at' not in columns:
+                self._conn.execute("ALTER TABLE responses ADD COLUMN created_at REAL")
+        return self._conn
+    
+    @staticmethod
+    def make_key(provider, model, prompt, max_tokens, system=None):
+        """Hash the request parameters that determine a completion."""
+        parts = [provider, model, prompt, max_tokens]
+        # Requests without system blocks keep the keys they had before system blocks existed
+        if system:
+            parts.append(system)
+        return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Return the cached completion for key, or None if there is none younger than the TTL."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at >= ?", (key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key, response):
+        """Store a completion under key."""
+        with self._lock:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, time.time())
+                )
+
+# Shared by every AIModelInterface; set response_cache.enabled = False to always call the API
+response_cache = ResponseCache()
+
+def cached_response(method):
+    """Serve generate_text-style methods from response_cache, storing new completions in it.
+    
+    The wrapped method takes an extra cache keyword; pass cache=False when the same prompt is
+    sent repeatedly on purpose and each call should get a fresh completion.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def wrapper(self, prompt, max_tokens=4000, system=None, cache=True):
+            if not (cache and response_cache.enabled):
+                return await method(self, prompt, max_tokens, system)
+            key = ResponseCache.make_key(self.provider, self.model, prompt, max_tokens, system)
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached
+            response = await method(self, prompt, max_tokens, system)
+            if response is not None:
+                response_cache.set(key, response)
+            return response
+    else:
+        @functools.wraps(method)
+        def wrapper(self, prompt, max_tokens=4000, system=None, cache=True):
+            if not (cache and response_cache.enabled):
+                return method(self, prompt, max_tokens, system)
+            key = ResponseCache.make_key(self.provider, self.model, prompt, max_tokens, system)
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached
+            response = method(self, prompt, max_tokens, system)
+            if response is not None:
+                response_cache.set(key, response)
+            return response
+    return wrapper
+
 class AIModelInterface:
     def __init__(self, provider, model):
         self.provider = provider
         self.model = model
+        # Created on first async call and reused, so concurrent requests share one connection pool
+        self.async_client = None
+        self._async_client_loop = None
+        # Prompt tokens the provider served from its prefix cache, summed over this interface's calls
+        self.cached_input_tokens = 0
         
-        # Initialize appropriate client
+        # Initialize appropriate client; the SDKs are imported here because they take
+        # most of a second to import and each run only needs one of them
         if provider == 'anthropic':
-            self.client = anthropic.Anthropic(api_key=anthropic_api_key)
+            import anthropic
+            self.client = anthropic.Anthropic(api_key=anthropic_api_key, http_client=_shared_http_client())
         elif provider == 'openai':
-            self.client = openai.OpenAI()
+            import openai
+            self.client = openai.OpenAI(api_key=openai_api_key, http_client=_shared_http_client())
         elif provider == 'google':
             try:
                 import google.generativeai as genai
@@ -111,97 +278,290 @@ def __init__(self, provider, model):
         else:
             raise ValueError(f"Unsupported provider: {provider}")
     
-    def generate_text(self, prompt, max_tokens=4000):
-        """Generate text using the selected model."""
+    def _text_request(self, prompt, max_tokens, system):
+        """Build the provider-specific keyword arguments for a text request.
+        
+        Args:
+            prompt: The user message, i.e. the part that changes between requests
+            max_tokens: Maximum tokens to generate
+            system: Optional list of static instruction blocks sent ahead of the prompt, most stable first
+        """
+        messages = [{"role": "user", "content": prompt}]
         if self.provider == 'anthropic':
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                messages=[
-                    {"role": "user", "content": prompt}
+            request = dict(model=self.model, max_tokens=max_tokens, messages=messages)
+            if system:
+                # Mark each block as a cache breakpoint so repeated prefixes are billed and served from the prompt cache
+                request["system"] = [
+                    {"type": "text", "text": block, "cache_control": {"type": "ephemeral"}} for block in system
                 ]
-            )
+            return request
+        if system:
+            # OpenAI caches repeated prompt prefixes automatically, so the static text just has to come first
+            messages = [{"role": "system", "content": "\n\n".join(system)}] + messages
+        return dict(model=self.model, messages=messages, max_tokens=max_tokens)
+    
+    def _record_usage(self, response):
+        """Add the prompt tokens the provider read from its cache to cached_input_tokens."""
+        usage = getattr(response, "usage", None)
+        if self.provider == 'anthropic':
+            cached = getattr(usage, "cache_read_input_tokens", None)
+        else:
+            cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+        self.cached_input_tokens += cached or 0
+    
+    @cached_response
+    def generate_text(self, prompt, max_tokens=4000, system=None):
+        """Generate text using the selected model."""
+        if self.provider == 'anthropic':
+            response = self.client.messages.create(**self._text_request(prompt, max_tokens, system))
+            self._record_usage(response)
             return response.content[0].text
         
         elif self.provider == 'openai':
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_tokens
-            )
+            response = self.client.chat.completions.create(**self._text_request(prompt, max_tokens, system))
+            self._record_usage(response)
             return response.choices[0].message.content
         
         elif self.provider == 'google':
             model = self.client.GenerativeModel(self.model)
-            response = model.generate_content(prompt)
+            response = model.generate_content("\n\n".join([*(system or []), prompt]))
             return response.text
         
         return None
     
-    async def generate_text_async(self, prompt, max_tokens=4000):
+    def get_async_client(self):
+        """Return the async client for the running event loop, creating it on first use."""
+        # Async clients hold connections bound to one event loop, so each asyncio.run needs a fresh one
+        loop = asyncio.get_running_loop()
+        if self.async_client is None or self._async_client_loop is not loop:
+            if self.provider == 'anthropic':
+                import anthropic
+                self.async_client = anthropic.AsyncAnthropic(api_key=anthropic_api_key, http_client=_http_client(use_async=True))
+            else:
+                import openai
+                self.async_client = openai.AsyncOpenAI(api_key=openai_api_key, http_client=_http_client(use_async=True))
+            self._async_client_loop = loop
+        return self.async_client
+    
+    async def aclose(self):
+        """Close the async client created on the running event loop, releasing its connection pool."""
+        client, loop = self.async_client, self._async_client_loop
+        self.async_client = None
+        self._async_client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+    
+    def run_async(self, coro):
+        """Run coro in a new event loop with asyncio.run, closing this interface's async client before the loop ends.
+        
+        Each asyncio.run needs its own async client, so without this every run would leave the
+        previous client's connection pool open.
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        return asyncio.run(runner())
+    
+    @cached_response
+    async def generate_text_async(self, prompt, max_tokens=4000, system=None):
         """Asynchronously generate text using the selected model."""
         if self.provider == 'anthropic':
-            client = anthropic.AsyncAnthropic(api_key=anthropic_api_key)
-            response = await client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            response = await self.get_async_client().messages.create(**self._text_request(prompt, max_tokens, system))
+            self._record_usage(response)
             return response.content[0].text
         
         elif self.provider == 'openai':
-            client = openai.AsyncOpenAI()
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_tokens
-            )
+            response = await self.get_async_client().chat.completions.create(**self._text_request(prompt, max_tokens, system))
+            self._record_usage(response)
             return response.choices[0].message.content
         
         elif self.provider == 'google':
             # Use synchronous version for Google as their async API is less standardized
-            # Convert to async using run_in_executor
+            # Convert to async using run_in_executor; this wrapper already handled the cache,
+            # so the sync call skips it (otherwise cache=False would still be served from it)
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.generate_text, prompt, max_tokens)
+            return await loop.run_in_executor(
+                None, functools.partial(self.generate_text, prompt, max_tokens, system, cache=False)
+            )
         
         return None
 
+    def _structured_request(self, prompt, schema, name, max_tokens):
+        """Build the provider-specific keyword arguments for a JSON-schema constrained request."""
+        messages = [{"role": "user", "content": prompt}]
+        if self.provider == 'anthropic':
+            # Forcing a single tool call makes Claude return arguments that match the schema
+            return dict(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=messages,
+                tools=[{"name": name, "description": "Record the requested output.", "input_schema": schema}],
+                tool_choice={"type": "tool", "name": name}
+            )
+        return dict(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            response_format={"type": "json_schema", "json_schema": {"name": name, "schema": schema, "strict": True}}
+        )
+    
+    def _parse_structured(self, response, schema):
+        """Extract the JSON object from a structured response and check its required fields."""
+        if self.provider == 'anthropic':
+            data = next(block.input for block in response.content if block.type == "tool_use")
+        elif self.provider == 'openai':
+            data = json.loads(response.choices[0].message.content)
+        else:
+            data = json.loads(response.text)
+        missing = [key for key in schema.get("required", []) if not isinstance(data.get(key), str) or not data[key].strip()]
+        if missing:
+            raise ValueError(f"Structured response is missing fields: {', '.join(missing)}")
+        return data
+    
+    def generate_structured(self, prompt, schema, name="structured_output", max_tokens=4000):
+        """Generate a JSON object matching schema using the selected model.
+        
+        Raises:
+            ValueError: If the response does not contain every required field
+        """
+        if self.provider == 'anthropic':
+            response = self.client.messages.create(**self._structured_request(prompt, schema, name, max_tokens))
+        elif self.provider == 'openai':
+            response = self.client.chat.completions.create(**self._structured_request(prompt, schema, name, max_tokens))
+        else:
+            # Gemini's schema support differs from JSON Schema, so only ask for JSON and validate the fields here
+            model = self.client.GenerativeModel(self.model, generation_config={"response_mime_type": "application/json"})
+            response = model.generate_content(prompt)
+        return self._parse_structured(response, schema)
+    
+    async def generate_structured_async(self, prompt, schema, name="structured_output", max_tokens=4000):
+        """Asynchronously generate a JSON object matching schema using the selected model."""
+        if self.provider == 'anthropic':
+            response = await self.get_async_client().messages.create(**self._structured_request(prompt, schema, name, max_tokens))
+        elif self.provider == 'openai':
+            response = await self.get_async_client().chat.completions.create(**self._structured_request(prompt, schema, name, max_tokens))
+        else:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self.generate_structured, prompt, schema, name, max_tokens)
+        return self._parse_structured(response, schema)
+
+@functools.lru_cache(maxsize=None)
+def get_model(provider, model):
+    """Return the shared AIModelInterface for a provider and model, so its connections are reused."""
+    return AIModelInterface(provider, model)
+
+# Approximate lowest paid-tier limits as (requests per minute, tokens per minute);
+# raise them to match your account so batches aren't throttled more than needed
+RATE_LIMITS = {
+    'gpt-4.5-preview-2025-02-27': (1000, 125_000),
+    'gpt-4o-2024-08-06': (500, 30_000),
+    'gpt-4o-mini-2024-07-18': (500, 200_000),
+    'o1-2024-12-17': (500, 30_000),
+    'o3-mini-2025-01-31': (1000, 100_000),
+    'claude-3-7-sonnet-20250219': (50, 40_000),
+    'claude-3-5-sonnet-20240620': (50, 40_000),
+    'claude-3-5-sonnet-20241022': (50, 40_000),
+    'claude-3-5-haiku-20241022': (50, 50_000),
+    'claude-3-haiku-20240307': (50, 50_000),
+    'gemini-2-0-flash': (2000, 4_000_000),
+    'gemini-2-0-flash-lite': (4000, 4_000_000)
+}
+
+# Used for models missing from RATE_LIMITS
+DEFAULT_RATE_LIMIT = (50, 40_000)
+
+# Rough characters per token, for estimating a prompt's cost before sending it
+CHARS_PER_TOKEN = 4
+
+class TokenBucket:
+    """Continuously refilling budget that paces callers to rate units per second."""
+    
+    def __init__(self, rate_per_sec, burst):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, cost):
+        """Take cost from the bucket, going into debt if needed; returns the seconds to wait before proceeding."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # A request larger than the whole bucket would otherwise never fit
+            self._tokens -= min(cost, self.burst)
+            return max(0.0, -self._tokens / self.rate)
+    
+    async def acquire(self, cost=1):
+        """Wait until cost units are available."""
+        delay = self._reserve(cost)
+        if delay:
+            await asyncio.sleep(delay)
+    
+    def acquire_sync(self, cost=1):
+        """Blocking version of acquire for threads and sequential loops."""
+        delay = self._reserve(cost)
+        if delay:
+            time.sleep(delay)
+
+@functools.lru_cache(maxsize=None)
+def get_rate_limiter(model):
+    """Return the shared (requests, tokens) buckets for a model, so every batch draws from one budget."""
+    requests_per_minute, tokens_per_minute = RATE_LIMITS.get(model, DEFAULT_RATE_LIMIT)
+    return (
+        TokenBucket(requests_per_minute / 60, requests_per_minute),
+        TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+    )
+
+def estimate_tokens(prompt, max_tokens):
+    """Estimate the tokens a request counts against the limit: its prompt plus the reserved output."""
+    return len(prompt) // CHARS_PER_TOKEN + max_tokens
+
 class BatchProcessor:
-    def __init__(self, provider, model, max_concurrency=3):
+    def __init__(self, provider, model, max_concurrency=MAX_CONCURRENCY, model_interface=None):
         self.provider = provider
         self.model = model
         self.max_concurrency = max_concurrency
+        self.model_interface = model_interface or get_model(provider, model)
+        self.request_bucket, self.token_bucket = get_rate_limiter(model)
     
-    async def process_batch(self, prompts, max_tokens=4000):
-        """Process a batch of prompts concurrently."""
-        model = AIModelInterface(self.provider, self.model)
+    async def process_batch(self, prompts, max_tokens=4000, return_exceptions=False, cache=True):
+        """Process a batch of prompts concurrently.
+        
+        With return_exceptions=True a failed request's exception takes its place in the results
+        instead of being raised, so the other prompts' responses are kept. Pass cache=False for
+        generative prompts whose repeats should produce new responses, as with generate_text.
+        """
+        model = self.model_interface
         
         # Create a semaphore to limit concurrency
         semaphore = asyncio.Semaphore(self.max_concurrency)
         
         async def process_with_semaphore(prompt):
             async with semaphore:
-                return await model.generate_text_async(prompt, max_tokens)
+                # Pace requests to the model's limits instead of running into 429s and backoff
+                await self.request_bucket.acquire()
+                await self.token_bucket.acquire(estimate_tokens(prompt, max_tokens))
+                return await model.generate_text_async(prompt, max_tokens, cache=cache)
         
         # Create tasks for all prompts
         tasks = [process_with_semaphore(prompt) for prompt in prompts]
         
         # Run all tasks and return results
-        return await asyncio.gather(*tasks)
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
     
-    def process_batch_sync(self, prompts, max_tokens=4000):
+    def process_batch_sync(self, prompts, max_tokens=4000, cache=True):
         """Process a batch of prompts synchronously (for environments without asyncio)."""
-        model = AIModelInterface(self.provider, self.model)
+        model = self.model_interface
         results = []
         
         for prompt in prompts:
-            result = model.generate_text(prompt, max_tokens)
+            self.request_bucket.acquire_sync()
+            self.token_bucket.acquire_sync(estimate_tokens(prompt, max_tokens))
+            result = model.generate_text(prompt, max_tokens, cache=cache)
             results.append(result)
         
         return results
@@ -217,6 +577,19 @@ def get_model_info(model_name):
         'best_for': 'General use'
     })
 
+def clamp_max_tokens(model, max_tokens):
+    """Lower max_tokens to the model's max_output_tokens, since providers reject requests above it.
+    
+    Args:
+        model: Model name as listed in MODEL_INFO
+        max_tokens: Requested output budget
+        
+    Returns:
+        max_tokens, or the model's output limit if that is smaller (unknown models are left as requested)
+    """
+    limit = MODEL_INFO.get(model, {}).get('max_output_tokens')
+    return min(max_tokens, limit) if limit else max_tokens
+
 def get_all_model_info():
     """Return detailed information about all models."""
     return MODEL_INFO
\ No newline at end of file
@@ -59,6 +59,41 @@
 Important: Follow the script questions precisely - don't skip any sections or questions. The goal is to generate a realistic interview that addresses all the research questions.
 """
 
+# INTERVIEW_GENERATION_PROMPT that returns the dialogue already in XML, so no separate formatting call is needed
+XML_INTERVIEW_GENERATION_PROMPT = """
+I'd like you to simulate an interview between an interviewer and a stakeholder in the consulting industry about AI adoption.
+
+INTERVIEWER PERSONA:
+{interviewer_details}
+
+STAKEHOLDER PERSONA:
+{interviewee_details}
+
+INTERVIEW SCRIPT:
+{script}
+
+Please simulate a realistic interview conversation following this exact script. The conversation should:
+1. Start with the introduction
+2. Cover the demographic questions
+3. Proceed through each research question section in order
+4. Include natural follow-up questions when appropriate
+5. End with the closing
+
+The stakeholder's responses should reflect their background, expertise, and views on AI as defined in their persona. The interviewer should maintain their defined interview style.
+
+Important: Follow the script questions precisely - don't skip any sections or questions. The goal is to generate a realistic interview that addresses all the research questions.
+
+Write the conversation directly as well-formed XML and return only the XML, in exactly this structure:
+
+<dialogue>
+  <interviewer_line>[Line from the interviewer]</interviewer_line>
+  <respondent_line>[Response from the stakeholder]</respondent_line>
+  [Repeat interviewer_line and respondent_line for the entire conversation]
+</dialogue>
+
+Escape &, < and > inside lines as &amp;, &lt; and &gt;.
+"""
+
 XML_FORMATTING_PROMPT = """
 Please format the following interview conversation into XML format according to this structure:
 
@@ -106,6 +141,185 @@
 Provide a comprehensive analysis that could be used for academic research.
 """
 
+# Several interviews with the same interviewer and script in one request
+MULTI_INTERVIEW_PROMPT = """
+I'd like you to simulate {count} separate interviews between the same interviewer and different stakeholders in the consulting industry about AI adoption.
+
+INTERVIEWER PERSONA:
+{interviewer_details}
+
+INTERVIEW SCRIPT:
+{script}
+
+STAKEHOLDER PERSONAS:
+{interviewees}
+
+For each stakeholder, please simulate a realistic interview conversation following this exact script. Each conversation should:
+1. Start with the introduction
+2. Cover the demographic questions
+3. Proceed through each research question section in order
+4. Include natural follow-up questions when appropriate
+5. End with the closing
+
+Each stakeholder's responses should reflect their own background, expertise, and views on AI as defined in their persona. The interviewer should maintain their defined interview style.
+
+Important: Follow the script questions precisely in every interview - don't skip any sections or questions.
+
+Return only a JSON array with one object per stakeholder, in the order given:
+[{{"id": "<stakeholder id>", "interview": "<the full interview conversation>"}}]
+"""
+
+# What the "analysis" field of the single-call prompts asks for, matching ANALYSIS_PROMPT
+ANALYSIS_FIELD_INSTRUCTIONS = """An analysis of the conversation that could be used for academic research, covering:
+   - Summary of key points raised by the respondent
+   - Notable quotes that could be useful for academic research
+   - Main attitudes expressed toward AI adoption in consulting
+   - Specific insights related to each research question:
+     - RQ1: How established is AI adoption within the consulting industry?
+     - RQ2: What are the current trends in the consulting market in Portugal?
+     - RQ3: How does AI affect the business of consulting firms in terms of automation and internalisation of knowledge by clients?
+     - RQ4: What ethical risks and concerns are associated with integrating AI in consulting?
+   - Any contradictions or interesting nuances in the respondent's views
+   - Authenticity assessment - how realistic the responses appear
+"""
+
+# Numbered sections of the structured analysis; batch generation parses each one into its own Analysis column
+STRUCTURED_ANALYSIS_SECTIONS = """1. KEY POINTS: Summarize the 3-5 most important points from the interview.
+
+2. NOTABLE QUOTES: Extract 2-3 direct quotes that best represent the interviewee's perspective.
+
+3. AI ATTITUDES: Analyze the interviewee's attitude toward AI in consulting (positive, negative, neutral, nuanced).
+
+4. RQ1 INSIGHTS: What insights does this interview provide about the state of AI adoption in consulting?
+
+5. RQ2 INSIGHTS: What insights does this interview provide about current market trends in consulting?
+
+6. RQ3 INSIGHTS: What insights does this interview provide about automation and knowledge management?
+
+7. RQ4 INSIGHTS: What insights does this interview provide about ethical considerations and risks?
+
+8. CONTRADICTIONS: Note any contradictions or inconsistencies in the interviewee's statements.
+
+9. AUTHENTICITY ASSESSMENT: Evaluate how authentic and realistic this interview feels.
+"""
+
+# Single-call version of XML_INTERVIEW_GENERATION_PROMPT and the analysis prompt; the conversation is only
+# written once, as the <dialogue>, and the raw transcript and full XML document are built from it locally
+FUSED_INTERVIEW_PROMPT = """
+I'd like you to simulate an interview between an interviewer and a stakeholder in the consulting industry about AI adoption, then analyze it.
+
+INTERVIEWER PERSONA:
+{interviewer_details}
+
+STAKEHOLDER PERSONA:
+{interviewee_details}
+
+INTERVIEW SCRIPT:
+{script}
+
+Return a single JSON object with exactly these two string fields:
+
+1. "dialogue": A realistic interview conversation following this exact script, written as well-formed XML in exactly this structure:
+
+<dialogue>
+  <interviewer_line>[Line from the interviewer]</interviewer_line>
+  <respondent_line>[Response from the stakeholder]</respondent_line>
+  [Repeat interviewer_line and respondent_line for the entire conversation]
+</dialogue>
+
+It should start with the introduction, cover the demographic questions, proceed through each research question section in order, include natural follow-up questions when appropriate, and end with the closing. The stakeholder's responses should reflect their background, expertise, and views on AI as defined in their persona. The interviewer should maintain their defined interview style. Follow the script questions precisely - don't skip any sections or questions. Escape &, < and > inside lines as &amp;, &lt; and &gt;.
+
+2. "analysis": """ + ANALYSIS_FIELD_INSTRUCTIONS
+
+# JSON schema for the FUSED_INTERVIEW_PROMPT response
+FUSED_INTERVIEW_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "dialogue": {"type": "string", "description": "The interview conversation as the requested <dialogue> element"},
+        "analysis": {"type": "string", "description": "The research analysis of the interview"}
+    },
+    "required": ["dialogue", "analysis"],
+    "additionalProperties": False
+}
+
+# Single-call version of XML_FORMATTING_PROMPT plus an analysis, for interviews that didn't come back as XML;
+# {analysis_instructions} is ANALYSIS_FIELD_INSTRUCTIONS or the STRUCTURED_ANALYSIS_SECTIONS request
+FORMAT_AND_ANALYZE_PROMPT = """
+Please format the following interview conversation into XML and analyze it.
+
+Return a single JSON object with exactly these two string fields:
+
+1. "xml_formatted": The conversation in this XML structure:
+
+<conversation_set>
+  <conversation id="{interview_id}">
+    <personas>
+      <interviewer>
+        {interviewer_details}
+      </interviewer>
+      <respondent>
+        {interviewee_details}
+      </respondent>
+    </personas>
+    <dialogue>
+      <interviewer_line>[Line from the interviewer]</interviewer_line>
+      <respondent_line>[Response from the stakeholder]</respondent_line>
+      [Repeat interviewer_line and respondent_line for the entire conversation]
+    </dialogue>
+  </conversation>
+</conversation_set>
+
+2. "analysis": {analysis_instructions}
+Here's the interview conversation:
+
+{interview_text}
+"""
+
+# JSON schema for the FORMAT_AND_ANALYZE_PROMPT response
+FORMAT_AND_ANALYZE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "xml_formatted": {"type": "string", "description": "The interview in the requested XML structure"},
+        "analysis": {"type": "string", "description": "The requested analysis of the interview"}
+    },
+    "required": ["xml_formatted", "analysis"],
+    "additionalProperties": False
+}
+
+# Static instructions for executive summaries, sent ahead of the per-report key points so providers can cache them
+EXECUTIVE_SUMMARY_SYSTEM_PROMPT = """
+You write executive summaries for a research report on "The Role of Business Consulting Firms in the Era of Artificial Intelligence", based on key points extracted from interviews with stakeholders in the consulting industry.
+
+Your executive summary should:
+1. Synthesize the main findings for the stakeholders named in the request
+2. Highlight the most significant trends and insights
+3. Discuss implications for the consulting industry
+4. Be approximately 500 words in length
+"""
+
+# Static instructions for presentation bullets, sent ahead of the per-report executive summary
+PRESENTATION_BULLETS_SYSTEM_PROMPT = """
+You turn the executive summary of a research report on AI in consulting into concise, presentation-ready bullet points organized by key sections.
+
+For each of the following categories, create 3-5 crisp, insightful bullet points suitable for a presentation slide:
+
+1. Overall Key Findings
+2. AI Adoption Status (RQ1)
+3. Market Trends (RQ2)
+4. Automation & Knowledge Effects (RQ3)
+5. Ethical Considerations (RQ4)
+6. The closing section named in the request
+
+Each bullet should be:
+- Specific and evidence-based
+- 1-2 lines maximum
+- Clear and impactful for a business audience
+- Free of jargon and unnecessary qualifiers
+- Formatted for direct placement in presentation slides
+
+Format with clear headers and bullet points using * or - symbols.
+"""
+
 # New prompt for enhancing FinePersonas
 FINEPERSONA_ENHANCEMENT_PROMPT = """
 Below is a high-level description of a persona. Please enhance this description into a more detailed persona suitable for a research interview about AI in consulting.
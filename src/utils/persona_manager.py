@@ -1,8 +1,22 @@
 # src/utils/persona_manager.py
-from datasets import load_dataset
+import re
 import json
-import random
-from typing import List, Dict, Any
+import numpy as np
+from typing import List, Dict, Any, Optional
+
+# Map our categories to likely FinePersonas labels
+CATEGORY_KEYWORDS = {
+    'senior_executives': ["Business", "Management", "Leadership", "Executive", "CEO", "CFO", "Strategy"],
+    'ai_specialists': ["Artificial Intelligence", "Machine Learning", "Data Science", "Computer Science", "Programming", "Software Engineering"],
+    'mid_level_consultants': ["Consulting", "Business Analysis", "Project Management", "Strategy", "Professional Services"],
+    'clients': ["Business", "Corporate", "Industry", "Enterprise", "Operations"],
+    'technology_providers': ["Technology", "Software", "Information Technology", "Engineering", "Computer Science"],
+    'regulatory_stakeholders': ["Law", "Regulation", "Compliance", "Policy", "Government", "Legal"],
+    'industry_analysts': ["Research", "Analysis", "Market Research", "Industry", "Academic", "Professor"]
+}
+
+# Stop indexing once every category has this many candidate personas
+MAX_INDEXED_PER_CATEGORY = 1000
 
 class FinePersonaManager:
     def __init__(self, use_sample=True):
@@ -15,96 +29,186 @@ def __init__(self, use_sample=True):
         self.dataset = None
         self.category_personas = {}
         
+        # Column-oriented persona index, built once per loaded dataset
+        self._ids = None
+        self._texts = None
+        self._lower_texts = None
+        self._labels = None
+        self._category_index = {}
+        self._rng = np.random.default_rng()
+        
     def load_dataset(self):
         """Load the FinePersonas dataset."""
         try:
+            # Imported here because the datasets library is slow to import and only needed for FinePersonas
+            from datasets import load_dataset
             if self.use_sample:
                 # Load the smaller clustering sample (100k)
                 self.dataset = load_dataset("argilla/FinePersonas-v0.1-clustering-100k", split="train")
             else:
-                # Load the full dataset (warning: this is 143GB)
-                self.dataset = load_dataset("argilla/FinePersonas-v0.1", split="train")
+                # Stream the full dataset (143GB) rather than downloading it; _build_index reads
+                # shards lazily and stops as soon as every category has enough candidates
+                self.dataset = load_dataset("argilla/FinePersonas-v0.1", split="train", streaming=True)
             
             return True
         except Exception as e:
             print(f"Error loading FinePersonas dataset: {str(e)}")
             return False
     
-    def get_personas_by_category(self, category: str, count: int = 30) -> List[Dict[str, Any]]:
-        """Get personas that match a consulting-related category.
+    def _build_index(self):
+        """Parse the dataset once into column arrays and per-category row indices."""
+        # Streamed datasets may not know their columns up front, and can't be loaded into a DataFrame anyway
+        if 'summary_label' in (self.dataset.column_names or []):
+            self._build_index_vectorized()
+            return
         
-        Args:
-            category: The consulting category to filter by
-            count: Number of personas to return
-            
-        Returns:
-            List of persona dictionaries
-        """
-        # Map our categories to likely FinePersonas labels
-        category_keywords = {
-            'senior_executives': ["Business", "Management", "Leadership", "Executive", "CEO", "CFO", "Strategy"],
-            'ai_specialists': ["Artificial Intelligence", "Machine Learning", "Data Science", "Computer Science", "Programming", "Software Engineering"],
-            'mid_level_consultants': ["Consulting", "Business Analysis", "Project Management", "Strategy", "Professional Services"],
-            'clients': ["Business", "Corporate", "Industry", "Enterprise", "Operations"],
-            'technology_providers': ["Technology", "Software", "Information Technology", "Engineering", "Computer Science"],
-            'regulatory_stakeholders': ["Law", "Regulation", "Compliance", "Policy", "Government", "Legal"],
-            'industry_analysts': ["Research", "Analysis", "Market Research", "Industry", "Academic", "Professor"]
-        }
-        
-        # If we haven't loaded the dataset yet
-        if self.dataset is None:
-            self.load_dataset()
+        ids, texts, labels = [], [], []
+        category_rows = {category: [] for category in CATEGORY_KEYWORDS}
         
-        # Check if we've already filtered this category
-        if category in self.category_personas and len(self.category_personas[category]) >= count:
-            return random.sample(self.category_personas[category], count)
-        
-        # Get relevant keywords for the category
-        keywords = category_keywords.get(category, [])
-        
-        # Filter personas based on their labels containing any of our keywords
-        filtered_personas = []
-        
-        # Look through the dataset and filter
         for persona in self.dataset:
             # Extract labels (format varies between the datasets)
             try:
                 # For the clustering dataset
                 if 'summary_label' in persona:
-                    labels = json.loads(persona['summary_label'])
+                    persona_labels = json.loads(persona['summary_label'])
                 # For the main dataset
                 elif 'labels' in persona:
-                    labels = persona['labels']
+                    persona_labels = persona['labels']
                 else:
                     continue
-                
-                # Check if any keywords match labels
-                if any(keyword in label for keyword in keywords for label in labels):
-                    filtered_personas.append({
-                        "id": persona["id"],
-                        "persona_text": persona["persona"],
-                        "labels": labels
-                    })
             except:
                 # Skip problematic entries
                 continue
             
-            # Break if we have enough
-            if len(filtered_personas) >= count * 3:  # Get more than needed for randomization
+            # Record the row under every category whose keywords match its labels
+            row = None
+            for category, keywords in CATEGORY_KEYWORDS.items():
+                if len(category_rows[category]) >= MAX_INDEXED_PER_CATEGORY:
+                    continue
+                if any(keyword in label for keyword in keywords for label in persona_labels):
+                    if row is None:
+                        row = len(ids)
+                        ids.append(persona["id"])
+                        texts.append(persona["persona"])
+                        labels.append(persona_labels)
+                    category_rows[category].append(row)
+            
+            # Stop once every category has enough candidates (the full dataset has 21M rows)
+            if all(len(rows) >= MAX_INDEXED_PER_CATEGORY for rows in category_rows.values()):
                 break
         
+        self._set_index(ids, texts, labels, {
+            category: np.array(rows, dtype=np.int64) for category, rows in category_rows.items()
+        })
+    
+    def _build_index_vectorized(self):
+        """Build the index for the clustering sample with pandas string matching instead of a per-row loop."""
+        # Only the columns we need; the sample also carries embeddings that would dominate memory
+        columns = ['id', 'persona', 'summary_label']
+        frame = self.dataset.remove_columns(
+            [column for column in self.dataset.column_names if column not in columns]
+        ).to_pandas()
+        
+        # summary_label is a JSON list of strings, so matching a keyword against the raw JSON
+        # is the same as matching it against any one label
+        label_text = frame['summary_label'].fillna("")
+        category_matches = {
+            category: np.flatnonzero(
+                label_text.str.contains("|".join(map(re.escape, keywords)), regex=True).to_numpy()
+            )[:MAX_INDEXED_PER_CATEGORY]
+            for category, keywords in CATEGORY_KEYWORDS.items()
+        }
+        
+        # Keep only rows some category matched, and parse their labels
+        rows = np.unique(np.concatenate(list(category_matches.values())))
+        labels = []
+        for raw in label_text.to_numpy()[rows]:
+            try:
+                labels.append(json.loads(raw))
+            except ValueError:
+                labels.append([])
+        
+        self._set_index(
+            frame['id'].to_numpy()[rows],
+            frame['persona'].to_numpy()[rows],
+            labels,
+            {category: np.searchsorted(rows, matches) for category, matches in category_matches.items()}
+        )
+    
+    def _set_index(self, ids, texts, labels, category_index):
+        """Store the index columns; category_index maps each category to row positions in them."""
+        self._ids = np.array(ids, dtype=object)
+        self._texts = np.array(texts, dtype=object)
+        # Lowercased fixed-width copy so search terms can be matched with vectorized np.char calls
+        self._lower_texts = np.char.lower(np.array(texts, dtype=str))
+        self._labels = np.empty(len(labels), dtype=object)
+        self._labels[:] = labels
+        self._category_index = category_index
+    
+    def prepare_index(self) -> bool:
+        """Load the dataset and build the persona index if that hasn't happened yet.
+        
+        Returns:
+            True if the index is ready, False if the dataset could not be loaded
+        """
+        if self.dataset is None:
+            self.load_dataset()
+        if self.dataset is None:
+            return False
+        if self._ids is None:
+            self._build_index()
+        return True
+    
+    def get_personas_by_category(self, category: str, count: int = 30, search_query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get personas that match a consulting-related category.
+        
+        Args:
+            category: The consulting category to filter by
+            count: Number of personas to return
+            search_query: Optional free text; personas whose description mentions its words are preferred
+            
+        Returns:
+            List of persona dictionaries
+        """
+        # Load the dataset and build the index on first use
+        if not self.prepare_index():
+            return []
+        
+        candidates = self._category_index.get(category)
+        if candidates is None or len(candidates) == 0:
+            return []
+        
+        # Narrow to personas mentioning the search terms when there are enough of them
+        if search_query:
+            terms = [term.lower() for term in search_query.split() if len(term) > 2]
+            candidate_texts = self._lower_texts[candidates]
+            mask = np.zeros(len(candidates), dtype=bool)
+            for term in terms:
+                mask |= np.char.find(candidate_texts, term) >= 0
+            matches = candidates[mask]
+            if len(matches) >= count:
+                candidates = matches
+        
+        # Sample rows in bulk and gather the matching columns
+        rows = self._rng.choice(candidates, size=min(count, len(candidates)), replace=False)
+        personas = [
+            {"id": persona_id, "persona_text": text, "labels": labels}
+            for persona_id, text, labels in zip(self._ids[rows], self._texts[rows], self._labels[rows])
+        ]
+        
         # Store for future use
-        self.category_personas[category] = filtered_personas
+        self.category_personas[category] = personas
         
-        # Return random selection
-        return random.sample(filtered_personas, min(count, len(filtered_personas)))
+        return personas
     
-    def format_persona_for_interview(self, persona_data: Dict[str, Any], role: str) -> Dict[str, Any]:
+    def format_persona_for_interview(self, persona_data: Dict[str, Any], role: str, category: Optional[str] = None) -> Dict[str, Any]:
         """Format a FinePersona for use in the interview system.
         
         Args:
             persona_data: The raw persona data
             role: Either 'interviewer' or 'interviewee'
+            category: Category to store the persona under; defaults to the role for
+                interviewers and the persona's labels for interviewees
             
         Returns:
             Formatted persona dictionary
@@ -112,11 +216,27 @@ def format_persona_for_interview(self, persona_data: Dict[str, Any], role: str)
         # Extract what we can from the persona text
         persona_text = persona_data["persona_text"]
         
+        if category is None:
+            category = role if role == "interviewer" else ", ".join(persona_data.get("labels", []))
+        
         # Create a reasonable structure
         return {
             "name": f"Persona {persona_data['id'][:8]}",  # Use part of the ID as a name
-            "category": role if role == "interviewer" else ", ".join(persona_data.get("labels", [])),
+            "category": category,
             "role": role,
             "background": persona_text,
             "created_by": "FinePersonas"
-        }
\ No newline at end of file
+        }
+    
+    def format_personas_for_interview(self, personas_data: List[Dict[str, Any]], role: str, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Format a batch of FinePersonas, ready for db_manager.bulk_create_personas.
+        
+        Args:
+            personas_data: The raw persona data, e.g. from get_personas_by_category
+            role: Either 'interviewer' or 'interviewee'
+            category: Category to store every persona under (see format_persona_for_interview)
+            
+        Returns:
+            List of formatted persona dictionaries, in input order
+        """
+        return [self.format_persona_for_interview(persona_data, role, category) for persona_data in personas_data]
\ No newline at end of file
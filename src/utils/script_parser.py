@@ -1,7 +1,6 @@
 import os
 import re
 import json
-import PyPDF2
 
 # Script categories
 STAKEHOLDER_CATEGORIES = [
@@ -25,6 +24,9 @@
     'Industry Analysts or Academics Specializing in Consulting and AI': 'industry_analysts'
 }
 
+# Full category name for each normalized key
+INVERSE_NORMALIZED_CATEGORIES = {key: name for name, key in NORMALIZED_CATEGORIES.items()}
+
 def parse_interview_scripts(file_path):
     """Parse the interview script document and extract scripts for each stakeholder category."""
     # Check if it's a PDF file
@@ -73,6 +75,8 @@ def extract_text_from_pdf(pdf_path):
     """Extract text content from a PDF file."""
     text = ""
     try:
+        # Imported here so commands that never read PDFs don't pay for it
+        import PyPDF2
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
             for page_num in range(len(pdf_reader.pages)):